@@ -2,6 +2,12 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
+
 // Simple LCG PRNG for deterministic test data
 static unsigned long long lcg_state = 0;
 
@@ -64,7 +70,7 @@ double** matrix_multiply(double** a, double** b, int n) {
 
 int main() {
     // Generate test matrices (fixed seed for reproducibility)
-    int N = 100;
+    int N = (int)bench_size(100);
     double** matrix_a = create_test_matrix(N, 42);
     double** matrix_b = create_test_matrix(N, 43);
 
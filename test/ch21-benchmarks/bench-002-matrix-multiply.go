@@ -1,7 +1,11 @@
 // BENCH-002: Matrix Multiplication (100x100) - Go
 package main
 
-import "fmt"
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
 
 // Simple LCG PRNG for deterministic test data
 var lcgState uint64
@@ -15,6 +19,14 @@ func lcgRandom() float64 {
 	return float64(lcgState) / 2147483648.0
 }
 
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func matrixMultiply(a, b [][]float64, n int) [][]float64 {
 	result := make([][]float64, n)
 	for i := range result {
@@ -46,7 +58,7 @@ func createTestMatrix(n int, seed uint64) [][]float64 {
 
 func main() {
 	// Generate test matrices (fixed seed for reproducibility)
-	N := 100
+	N := benchSize(100)
 	matrixA := createTestMatrix(N, 42)
 	matrixB := createTestMatrix(N, 43)
 
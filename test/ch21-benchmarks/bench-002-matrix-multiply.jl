@@ -37,7 +37,7 @@ function create_test_matrix(n, seed)
 end
 
 # Generate test matrices (fixed seed for reproducibility)
-N = 100
+N = parse(Int, get(ENV, "BENCH_SIZE", "100"))
 matrix_a = create_test_matrix(N, 42)
 matrix_b = create_test_matrix(N, 43)
 
@@ -2,10 +2,25 @@
 # BENCH-002: Matrix Multiplication (100x100)
 # Task: Multiply two 100x100 matrices using naive algorithm
 # Measures: Nested loop performance, array access patterns, arithmetic ops
+#
+# Variants (--variant), all validated against the same LCG checksum:
+#   naive       Baseline: triple loop over nested lists (default)
+#   row-cached  i-k-j order, rows of A/B/result hoisted out of the inner loop
+#   blocked     row-cached, tiled into --block sized blocks for cache reuse
+#   numpy       NumPy `@` (requires numpy)
+#
+# --n scales the problem (e.g. 1000, 2000; default: $BENCH_SIZE or 100); --stats
+# prints the multiply time.
+
+import os
+import sys
 
 # Simple LCG PRNG for deterministic test data (matches C implementation)
 lcg_state = 0
 
+# Checksum for N=100 with seeds 42/43 (any variant, summation order aside)
+EXPECTED_CHECKSUM_100 = 248683.505429
+
 def lcg_seed(seed):
     global lcg_state
     lcg_state = seed
@@ -26,20 +41,129 @@ def matrix_multiply(a, b, n):
 
     return result
 
+def matrix_multiply_row_cached(a, b, n):
+    """i-k-j order: each result row is updated with a scaled row of B"""
+    result = []
+    for i in range(n):
+        a_row = a[i]
+        row = [0.0] * n
+        for k in range(n):
+            a_ik = a_row[k]
+            row = [r + a_ik * x for r, x in zip(row, b[k])]
+        result.append(row)
+    return result
+
+def matrix_multiply_blocked(a, b, n, block=64):
+    """Row-cached multiply tiled over k and j so B's block stays cache-resident"""
+    result = [[0.0] * n for _ in range(n)]
+    for kk in range(0, n, block):
+        k_end = min(kk + block, n)
+        for jj in range(0, n, block):
+            j_end = min(jj + block, n)
+            b_tile = [b[k][jj:j_end] for k in range(kk, k_end)]
+            for i in range(n):
+                a_row = a[i]
+                tile = result[i][jj:j_end]
+                for k in range(kk, k_end):
+                    a_ik = a_row[k]
+                    tile = [r + a_ik * x for r, x in zip(tile, b_tile[k - kk])]
+                result[i][jj:j_end] = tile
+    return result
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        sys.exit("numpy variant requires numpy (pip install numpy)")
+    return np
+
+def matrix_multiply_numpy(a, b, n):
+    """NumPy matrix product (BLAS-backed)"""
+    np = _numpy()
+    return np.array(a) @ np.array(b)
+
+VARIANTS = {
+    'naive': matrix_multiply,
+    'row-cached': matrix_multiply_row_cached,
+    'blocked': matrix_multiply_blocked,
+    'numpy': matrix_multiply_numpy,
+}
+
 def create_test_matrix(n, seed):
     """Create NxN matrix with deterministic random values"""
     lcg_seed(seed)
     return [[lcg_random() for _ in range(n)] for _ in range(n)]
 
-# Generate test matrices (fixed seed for reproducibility - Toyota Way: Jidoka)
-N = 100
-matrix_a = create_test_matrix(N, seed=42)
-matrix_b = create_test_matrix(N, seed=43)
+def checksum_of(result):
+    """Sum of all elements for any variant's result type"""
+    if hasattr(result, 'sum'):
+        return float(result.sum())
+    if isinstance(result, list):
+        return sum(sum(row) for row in result)
+    return sum(result)
+
+def expected_checksum(a, b, n):
+    """
+    Sum of all elements of A·B in O(n²): sum_k colsum(A)[k] * rowsum(B)[k].
+
+    Lets every variant be validated at sizes where the naive multiply is
+    far too slow to serve as a reference.
+    """
+    col_sums = [sum(a[i][k] for i in range(n)) for k in range(n)]
+    return sum(col_sums[k] * sum(b[k]) for k in range(n))
+
+def parse_args(argv):
+    """
+    Return (n, variant, block, verify, stats). argparse is only imported
+    when flags are given, so the default baseline run pays no extra import time.
+    """
+    default_n = int(os.environ.get('BENCH_SIZE', 100))
+    if not argv:
+        return default_n, 'naive', 64, False, False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-002 matrix multiplication')
+    parser.add_argument('--variant', choices=VARIANTS, default='naive')
+    parser.add_argument('--n', type=int, default=default_n,
+                        help='matrix size (default: $BENCH_SIZE or 100)')
+    parser.add_argument('--block', type=int, default=64, help='tile size for --variant blocked')
+    parser.add_argument('--verify', action='store_true',
+                        help='validate the checksum (exact constant at N=100, '
+                             'O(n²) identity otherwise)')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the multiply time to stderr')
+    args = parser.parse_args(argv)
+    return args.n, args.variant, args.block, args.verify, args.stats
+
+def main():
+    N, variant, block, verify, stats = parse_args(sys.argv[1:])
+
+    # Generate test matrices (fixed seed for reproducibility - Toyota Way: Jidoka)
+    matrix_a = create_test_matrix(N, seed=42)
+    matrix_b = create_test_matrix(N, seed=43)
+
+    # Execute benchmark
+    if variant == 'numpy':
+        _numpy()  # ~100ms import: keep it out of the --stats timing
+    if stats:
+        import time
+        start = time.perf_counter()
+    if variant == 'blocked':
+        result = matrix_multiply_blocked(matrix_a, matrix_b, N, block)
+    else:
+        result = VARIANTS[variant](matrix_a, matrix_b, N)
+    if stats:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"{variant} N={N}: {elapsed_ms:.2f}ms", file=sys.stderr)
+
+    # Output checksum for verification (sum of all elements)
+    checksum = checksum_of(result)
+    print(f"{checksum:.6f}")
+    # Expected: 248683.505429 (deterministic with LCG)
 
-# Execute benchmark
-result = matrix_multiply(matrix_a, matrix_b, N)
+    if verify:
+        expected = EXPECTED_CHECKSUM_100 if N == 100 else expected_checksum(matrix_a, matrix_b, N)
+        assert abs(checksum - expected) <= 1e-9 * abs(expected) + 1e-6, \
+            f"{variant}: checksum {checksum:.6f} != expected {expected:.6f}"
 
-# Output checksum for verification (sum of all elements)
-checksum = sum(sum(row) for row in result)
-print(f"{checksum:.6f}")
-# Expected: 248683.505429 (deterministic with LCG)
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,7 @@ function createTestMatrix(n: number, seed: number): number[][] {
 }
 
 // Generate test matrices (fixed seed for reproducibility)
-const N = 100;
+const N = Number(Deno.env.get("BENCH_SIZE") ?? 100);
 const matrixA = createTestMatrix(N, 42);
 const matrixB = createTestMatrix(N, 43);
 
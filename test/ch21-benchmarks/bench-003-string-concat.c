@@ -5,6 +5,12 @@
 #include <stdlib.h>
 #include <string.h>
 
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
+
 char* string_concatenation(int iterations) {
     // Allocate buffer for final string (iterations * 1 byte + null terminator)
     char *result = (char*)malloc(iterations + 1);
@@ -20,10 +26,12 @@ char* string_concatenation(int iterations) {
 }
 
 int main() {
-    int iterations = 10000;
+    int iterations = (int)bench_size(10000);
     char *result = string_concatenation(iterations);
 
-    // Silent for benchmarking
+    // Output length for verification
+    printf("%zu\n", strlen(result));
+    // Expected: 10000
     free(result);
     return 0;
 }
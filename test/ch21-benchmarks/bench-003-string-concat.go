@@ -1,7 +1,20 @@
 // BENCH-003: String concatenation (10K operations) - Go
 package main
 
-import "strings"
+import (
+	"fmt"
+	"os"
+	"strconv"
+	"strings"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
 
 func stringConcatenation(iterations int) string {
 	// Idiomatic: strings.Builder (efficient, O(n))
@@ -13,9 +26,9 @@ func stringConcatenation(iterations int) string {
 }
 
 func main() {
-	iterations := 10000
+	iterations := benchSize(10000)
 	result := stringConcatenation(iterations)
-	_ = result
-	// Silent for benchmarking
-	// Expected: 10000 characters
+	// Output length for verification
+	fmt.Println(len(result))
+	// Expected: 10000
 }
@@ -5,10 +5,11 @@ function string_concatenation(iterations::Int64)::String
 end
 
 function main()
-    iterations = 10000
+    iterations = parse(Int, get(ENV, "BENCH_SIZE", "10000"))
     result = string_concatenation(iterations)
-    # Silent for benchmarking
-    # Expected: 10000 characters
+    # Output length for verification
+    println(length(result))
+    # Expected: 10000
 end
 
 main()
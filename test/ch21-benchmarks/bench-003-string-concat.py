@@ -1,18 +1,36 @@
 #!/usr/bin/env python3
 # BENCH-003: String concatenation (10K operations)
 # Python baseline implementation - IDIOMATIC VERSION
+# Size: BENCH_SIZE environment variable (default 10000 operations)
+#
+# String-building strategies (--variant), all building 'x' * n:
+#   join       Baseline: "".join over a list comprehension (default)
+#   naive      result += "x" in a loop
+#   generator  "".join over a generator expression
+#   stringio   io.StringIO.write per character, then getvalue()
+#   bytearray  bytearray.extend per character, decoded once at the end
+#   repeat     'x' * n (one allocation)
+#
+# --stats prints elapsed time and peak RSS to stderr. --check-fast-path runs
+# the naive loop instrumented to count how many appends CPython resized in
+# place (the object id stays the same) instead of copying into a new string.
+
+import os
+import sys
 
 def string_concatenation_naive(iterations):
     """
-    Naive O(n²) implementation - DO NOT USE IN PRODUCTION
+    Naive += implementation - DO NOT USE IN PRODUCTION
 
     This approach is included for educational comparison only.
-    String concatenation with += has quadratic complexity in Python
-    because strings are immutable and must be reallocated on each append.
+    Strings are immutable, so += is O(n²) in general. CPython special-cases
+    `s += t` when s has no other references and resizes it in place, which
+    makes this loop close to linear there - but not on other interpreters,
+    nor when anything else holds a reference to the string.
     """
     result = ""
     for i in range(iterations):
-        result += "x"  # ❌ O(n²) - reallocates entire string each iteration
+        result += "x"  # ❌ O(n²) unless CPython's in-place resize applies
     return result
 
 def string_concatenation(iterations):
@@ -26,15 +44,100 @@ def string_concatenation(iterations):
     result = "".join(['x' for _ in range(iterations)])
     return result
 
-# Alternative idiomatic implementations (all O(n)):
-# result = "".join('x' * iterations)  # Even faster (single allocation)
-# result = 'x' * iterations           # Fastest (built-in string repeat)
+def string_concatenation_generator(iterations):
+    """join over a generator: str.join materializes it as a list first anyway"""
+    return "".join('x' for _ in range(iterations))
+
+def string_concatenation_stringio(iterations):
+    """io.StringIO as a growable text buffer"""
+    import io
+    buf = io.StringIO()
+    write = buf.write
+    for _ in range(iterations):
+        write('x')
+    return buf.getvalue()
+
+def string_concatenation_bytearray(iterations):
+    """Mutable byte buffer with amortized growth, decoded once"""
+    buf = bytearray()
+    extend = buf.extend
+    for _ in range(iterations):
+        extend(b'x')
+    return buf.decode('ascii')
+
+def string_concatenation_repeat(iterations):
+    """Built-in repeat: a single allocation, no per-character work"""
+    return 'x' * iterations
+
+VARIANTS = {
+    'join': string_concatenation,
+    'naive': string_concatenation_naive,
+    'generator': string_concatenation_generator,
+    'stringio': string_concatenation_stringio,
+    'bytearray': string_concatenation_bytearray,
+    'repeat': string_concatenation_repeat,
+}
+
+def naive_fast_path_check(iterations):
+    """
+    Run the naive loop, counting appends where the string kept its id.
+
+    A kept id means CPython resized the string in place; a copy always
+    yields a new object while the old one is still alive. Returns
+    (in_place, iterations).
+    """
+    result = ""
+    previous = id(result)
+    in_place = 0
+    for _ in range(iterations):
+        result += "x"
+        current = id(result)
+        in_place += current == previous
+        previous = current
+    return in_place, iterations
+
+def parse_args(argv):
+    """
+    Return (iterations, variant, stats, check_fast_path). argparse is only
+    imported when flags are given, so the default baseline run pays no
+    extra import time.
+    """
+    default_iterations = int(os.environ.get('BENCH_SIZE', 10000))
+    if not argv:
+        return default_iterations, 'join', False, False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-003 string concatenation')
+    parser.add_argument('--variant', choices=VARIANTS, default='join')
+    parser.add_argument('--iterations', type=int, default=default_iterations,
+                        help='characters to append (default: $BENCH_SIZE or 10000)')
+    parser.add_argument('--stats', action='store_true',
+                        help='print elapsed time and peak RSS to stderr')
+    parser.add_argument('--check-fast-path', action='store_true',
+                        help="report whether CPython's in-place += resize triggers")
+    args = parser.parse_args(argv)
+    return args.iterations, args.variant, args.stats, args.check_fast_path
 
 def main():
-    iterations = 10000
+    iterations, variant, stats, check_fast_path = parse_args(sys.argv[1:])
+
+    if check_fast_path:
+        in_place, total = naive_fast_path_check(iterations)
+        share = in_place / total if total else 0.0
+        verdict = "active" if share > 0.5 else "not active"
+        print(f"naive +=: {in_place}/{total} appends resized in place ({share:.1%}), "
+              f"fast path {verdict}", file=sys.stderr)
 
-    # Benchmark the IDIOMATIC version (not naive)
-    result = string_concatenation(iterations)
+    if stats:
+        import resource
+        import time
+        start = time.perf_counter()
+    # Benchmark the IDIOMATIC version (not naive) unless told otherwise
+    result = VARIANTS[variant](iterations)
+    if stats:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{variant} n={iterations}: {elapsed_ms:.2f}ms, peak RSS {peak_mb:.1f}MB",
+              file=sys.stderr)
 
     print(f"Concatenated {len(result)} characters")
 
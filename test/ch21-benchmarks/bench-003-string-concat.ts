@@ -5,10 +5,11 @@ function string_concatenation(iterations: number): string {
 }
 
 function main(): void {
-    const iterations = 10000;
+    const iterations = Number(Deno.env.get("BENCH_SIZE") ?? 10000);
     const result = string_concatenation(iterations);
-    // Silent for benchmarking
-    // Expected: 10000 characters
+    // Output length for verification
+    console.log(result.length);
+    // Expected: 10000
 }
 
 main();
@@ -4,6 +4,12 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
+
 typedef struct TreeNode {
     struct TreeNode *left;
     struct TreeNode *right;
@@ -43,7 +49,7 @@ void free_tree(TreeNode *node) {
 }
 
 int main() {
-    int max_depth = 16;
+    int max_depth = (int)bench_size(16);
     int min_depth = 4;
 
     // Stretch tree
@@ -70,6 +76,8 @@ int main() {
     int long_check = check_tree(long_lived_tree);
     free_tree(long_lived_tree);
 
-    // Silent for benchmarking
+    // Output node counts for verification
+    printf("%d %d %d\n", stretch_check, total_checks, long_check);
+    // Expected: 262143 14592688 131071
     return 0;
 }
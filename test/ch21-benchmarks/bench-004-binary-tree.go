@@ -2,6 +2,20 @@
 // Tests: memory allocator, GC, pointer chasing
 package main
 
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 type TreeNode struct {
 	left  *TreeNode
 	right *TreeNode
@@ -25,7 +39,7 @@ func checkTree(node *TreeNode) int {
 }
 
 func main() {
-	maxDepth := 16
+	maxDepth := benchSize(16)
 	minDepth := 4
 
 	// Stretch tree
@@ -49,8 +63,7 @@ func main() {
 	// Final checksum
 	longCheck := checkTree(longLivedTree)
 
-	_ = stretchCheck
-	_ = totalChecks
-	_ = longCheck
-	// Silent for benchmarking
+	// Output node counts for verification
+	fmt.Println(stretchCheck, totalChecks, longCheck)
+	// Expected: 262143 14592688 131071
 }
@@ -23,7 +23,7 @@ function check_tree(node::TreeNode)::Int64
 end
 
 function main()
-    max_depth = 16
+    max_depth = parse(Int, get(ENV, "BENCH_SIZE", "16"))
     min_depth = 4
 
     # Stretch tree
@@ -47,7 +47,9 @@ function main()
     # Final checksum
     long_check = check_tree(long_lived_tree)
 
-    # Silent for benchmarking
+    # Output node counts for verification
+    println("$stretch_check $total_checks $long_check")
+    # Expected: 262143 14592688 131071
 end
 
 main()
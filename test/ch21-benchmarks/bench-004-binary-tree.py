@@ -2,6 +2,21 @@
 # BENCH-004: Binary tree allocation/deallocation - Python
 # Based on Computer Language Benchmarks Game binary-trees
 # Tests: memory allocator, GC, pointer chasing
+#
+# Node representations (--variant):
+#   class  Baseline: regular class with an instance __dict__ (default)
+#   slots  __slots__ class (no per-instance dict)
+#   tuple  (left, right) tuples; leaves share one immutable (None, None)
+#   arena  parallel array('i') left/right index arrays, bulk-reset after
+#          each short-lived tree instead of freeing nodes one by one
+#
+# --stats prints elapsed time, peak RSS and time spent in the cyclic GC
+# (measured with gc.callbacks), plus a BENCH_STATS JSON line the harness
+# stores as script_stats; --verify checks the node counts. --max-depth
+# defaults to $BENCH_SIZE or 16.
+
+import os
+import sys
 
 class TreeNode:
     def __init__(self, left=None, right=None):
@@ -20,31 +35,204 @@ def check_tree(node):
         return 1
     return 1 + check_tree(node.left) + check_tree(node.right)
 
-def main():
-    max_depth = 16  # Manageable for all implementations
-    min_depth = 4
+class SlotsNode:
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left=None, right=None):
+        self.left = left
+        self.right = right
+
+def make_tree_slots(depth):
+    """Create a binary tree of __slots__ nodes"""
+    if depth <= 0:
+        return SlotsNode()
+    return SlotsNode(make_tree_slots(depth - 1), make_tree_slots(depth - 1))
+
+LEAF = (None, None)
+
+def make_tree_tuple(depth):
+    """Create a binary tree of (left, right) tuples"""
+    if depth <= 0:
+        return LEAF
+    return (make_tree_tuple(depth - 1), make_tree_tuple(depth - 1))
+
+def check_tree_tuple(node):
+    """Compute checksum of a tuple tree"""
+    left, right = node
+    if left is None:
+        return 1
+    return 1 + check_tree_tuple(left) + check_tree_tuple(right)
+
+class Arena:
+    """Nodes are indexes into parallel left/right arrays (-1 = no child)"""
+
+    def __init__(self):
+        from array import array
+        self.left = array('i')
+        self.right = array('i')
+
+    def make_tree(self, depth):
+        """Allocate a tree of given depth at the end of the arena"""
+        node = len(self.left)
+        self.left.append(-1)
+        self.right.append(-1)
+        if depth > 0:
+            self.left[node] = self.make_tree(depth - 1)
+            self.right[node] = self.make_tree(depth - 1)
+        return node
+
+    def check_tree(self, node):
+        """Compute checksum by walking the index arrays"""
+        left = self.left[node]
+        if left < 0:
+            return 1
+        return 1 + self.check_tree(left) + self.check_tree(self.right[node])
+
+    def mark(self):
+        return len(self.left)
 
+    def reset(self, mark):
+        """Free every node allocated after mark in one slice deletion"""
+        del self.left[mark:]
+        del self.right[mark:]
+
+def run_trees(make, check, max_depth, min_depth, reset=None):
+    """
+    The benchmark body for any representation: stretch tree, long-lived
+    tree, then many short-lived trees. `reset`, if given, is called after
+    each short-lived tree (arena bulk free).
+    """
     # Stretch tree
     stretch_depth = max_depth + 1
-    stretch_tree = make_tree(stretch_depth)
-    stretch_check = check_tree(stretch_tree)
+    stretch_tree = make(stretch_depth)
+    stretch_check = check(stretch_tree)
 
     # Long-lived tree
-    long_lived_tree = make_tree(max_depth)
+    long_lived_tree = make(max_depth)
 
     # Create and destroy many trees
     total_checks = 0
     for depth in range(min_depth, max_depth + 1, 2):
         iterations = 1 << (max_depth - depth + min_depth)
         for _ in range(iterations):
-            tree = make_tree(depth)
-            total_checks += check_tree(tree)
+            tree = make(depth)
+            total_checks += check(tree)
+            if reset:
+                reset()
 
     # Final checksum of long-lived tree
-    long_check = check_tree(long_lived_tree)
+    long_check = check(long_lived_tree)
+    return stretch_check, total_checks, long_check
+
+def run_variant(variant, max_depth, min_depth):
+    """Run the benchmark with one node representation"""
+    if variant == 'class':
+        return run_trees(make_tree, check_tree, max_depth, min_depth)
+    if variant == 'slots':
+        return run_trees(make_tree_slots, check_tree, max_depth, min_depth)
+    if variant == 'tuple':
+        return run_trees(make_tree_tuple, check_tree_tuple, max_depth, min_depth)
+    arena = Arena()
+    # Stretch and long-lived trees are allocated first; everything after
+    # this mark is short-lived and released in bulk
+    stretch = arena.make_tree(max_depth + 1)
+    long_lived = arena.make_tree(max_depth)
+    mark = arena.mark()
+    stretch_check = arena.check_tree(stretch)
+    total_checks = 0
+    for depth in range(min_depth, max_depth + 1, 2):
+        iterations = 1 << (max_depth - depth + min_depth)
+        for _ in range(iterations):
+            total_checks += arena.check_tree(arena.make_tree(depth))
+            arena.reset(mark)
+    return stretch_check, total_checks, arena.check_tree(long_lived)
+
+VARIANTS = ('class', 'slots', 'tuple', 'arena')
+
+def expected_checks(max_depth, min_depth):
+    """Node counts every variant must report: a depth-d tree has 2^(d+1)-1 nodes"""
+    nodes = lambda d: (1 << (d + 1)) - 1
+    total = sum((1 << (max_depth - d + min_depth)) * nodes(d)
+                for d in range(min_depth, max_depth + 1, 2))
+    return nodes(max_depth + 1), total, nodes(max_depth)
+
+class GCTimer:
+    """Accumulate time spent in cyclic GC collections via gc.callbacks"""
+
+    def __init__(self):
+        import gc
+        import time
+        self.gc = gc
+        self.clock = time.perf_counter_ns
+        self.total_ns = 0
+        self.collections = [0, 0, 0]
+        self._start = 0
+
+    def __call__(self, phase, info):
+        if phase == 'start':
+            self._start = self.clock()
+        else:
+            self.total_ns += self.clock() - self._start
+            self.collections[info['generation']] += 1
+
+    def __enter__(self):
+        self.gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.gc.callbacks.remove(self)
+
+def parse_args(argv):
+    """
+    Return (variant, max_depth, verify, stats). argparse is only imported
+    when flags are given, so the default baseline run pays no extra import time.
+    """
+    default_depth = int(os.environ.get('BENCH_SIZE', 16))
+    if not argv:
+        return 'class', default_depth, False, False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-004 binary trees')
+    parser.add_argument('--variant', choices=VARIANTS, default='class')
+    parser.add_argument('--max-depth', type=int, default=default_depth)
+    parser.add_argument('--verify', action='store_true', help='check node counts')
+    parser.add_argument('--stats', action='store_true',
+                        help='print elapsed time, peak RSS and GC time to stderr')
+    args = parser.parse_args(argv)
+    return args.variant, args.max_depth, args.verify, args.stats
+
+def main():
+    variant, max_depth, verify, stats = parse_args(sys.argv[1:])
+    min_depth = 4
+
+    if not stats:
+        checks = run_variant(variant, max_depth, min_depth)
+    else:
+        import resource
+        import time
+        start = time.perf_counter()
+        with GCTimer() as gc_timer:
+            checks = run_variant(variant, max_depth, min_depth)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        gen0, gen1, gen2 = gc_timer.collections
+        print(f"{variant}: {elapsed_ms:.2f}ms, peak RSS {peak_kb / 1024:.1f}MB, "
+              f"GC {gc_timer.total_ns / 1e6:.2f}ms in {gen0 + gen1 + gen2} collections "
+              f"(gen0={gen0} gen1={gen1} gen2={gen2})", file=sys.stderr)
+        # Machine-readable copy, recorded by the harness as script_stats
+        import json
+        gc_ms = gc_timer.total_ns / 1e6
+        print("BENCH_STATS " + json.dumps({
+            "elapsed_ms": round(elapsed_ms, 3), "gc_ms": round(gc_ms, 3),
+            "gc_share": round(gc_ms / elapsed_ms, 4) if elapsed_ms else None,
+            "gc_collections": gc_timer.collections, "peak_kb": peak_kb,
+        }), file=sys.stderr)
 
-    # Silent for benchmarking
-    # Expected: stretch_check, total_checks, long_check all > 0
+    # Output node counts for verification
+    print(*checks)
+    # Expected: 262143 14592688 131071
+    if verify:
+        expected = expected_checks(max_depth, min_depth)
+        assert checks == expected, f"{variant}: checks {checks} != expected {expected}"
 
 if __name__ == "__main__":
     main()
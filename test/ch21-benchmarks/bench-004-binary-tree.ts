@@ -26,7 +26,7 @@ function checkTree(node: TreeNode): number {
 }
 
 function main(): void {
-    const maxDepth = 16;
+    const maxDepth = Number(Deno.env.get("BENCH_SIZE") ?? 16);
     const minDepth = 4;
 
     // Stretch tree
@@ -50,7 +50,9 @@ function main(): void {
     // Final checksum
     const longCheck = checkTree(longLivedTree);
 
-    // Silent for benchmarking
+    // Output node counts for verification
+    console.log(`${stretchCheck} ${totalChecks} ${longCheck}`);
+    // Expected: 262143 14592688 131071
 }
 
 main();
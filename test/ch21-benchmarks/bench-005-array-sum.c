@@ -1,5 +1,12 @@
 // BENCH-005: Array Sum (1 million integers) - C
 #include <stdio.h>
+#include <stdlib.h>
+
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
 
 long long array_sum(int n) {
     long long sum = 0;
@@ -10,7 +17,8 @@ long long array_sum(int n) {
 }
 
 int main() {
-    long long result = array_sum(1000000);
+    long long result = array_sum((int)bench_size(1000000));
+    printf("%lld\n", result);
     // Expected: 499999500000
     return 0;
 }
@@ -1,6 +1,20 @@
 // BENCH-005: Array Sum (1 million integers) - Go
 package main
 
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func arraySum(n int) int {
 	sum := 0
 	for i := 0; i < n; i++ {
@@ -10,6 +24,7 @@ func arraySum(n int) int {
 }
 
 func main() {
-	result := arraySum(1000000)
-	_ = result // Expected: 499999500000
+	result := arraySum(benchSize(1000000))
+	fmt.Println(result)
+	// Expected: 499999500000
 }
@@ -8,5 +8,6 @@ function array_sum(n)
     sum
 end
 
-result = array_sum(1000000)
+result = array_sum(parse(Int, get(ENV, "BENCH_SIZE", "1000000")))
+println(result)
 # Expected: 499999500000
@@ -1,5 +1,28 @@
 #!/usr/bin/env python3
 # BENCH-005: Array Sum (1 million integers) - Python
+# Size: BENCH_SIZE environment variable (default 1000000)
+#
+# Variants (--variant), all summing 0..n-1:
+#   loop           Baseline: `total += i` over range (default)
+#   builtin        sum(range(n))
+#   itertools      sum over itertools.islice(itertools.count(), n)
+#   numpy          np.arange(n).sum() in int64 (requires numpy; needs 8n bytes)
+#   numpy-chunked  the same in CHUNK-sized slices, summed as Python ints, so
+#                  n is not limited by memory (requires numpy)
+#   closed-form    n(n-1)/2
+#
+# NumPy sums in int64 and wraps silently, so the numpy variants refuse sizes
+# whose sum (or chunk sum) could exceed 2^63-1. --n scales the problem (up to
+# 10^9 and beyond; default: $BENCH_SIZE or 1000000); --verify checks the result
+# against the closed form; --stats prints the summing time.
+
+import os
+import sys
+
+INT64_MAX = 2 ** 63 - 1
+
+# Elements per numpy-chunked slice: 32MB of int64
+CHUNK = 1 << 22
 
 def array_sum(n):
     total = 0
@@ -7,5 +30,96 @@ def array_sum(n):
         total += i
     return total
 
-result = array_sum(1000000)
-# Expected: 499999500000
+def array_sum_builtin(n):
+    """Builtin sum over range: the loop runs in C"""
+    return sum(range(n))
+
+def array_sum_itertools(n):
+    """Sum over an itertools iterator instead of range"""
+    from itertools import count, islice
+    return sum(islice(count(), n))
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        sys.exit("numpy variants require numpy (pip install numpy)")
+    return np
+
+def _check_int64(bound, what):
+    if bound > INT64_MAX:
+        raise OverflowError(f"{what} can reach {bound}, beyond int64; "
+                            "use numpy-chunked or closed-form")
+
+def array_sum_numpy(n):
+    """One int64 arange, summed in NumPy"""
+    np = _numpy()
+    _check_int64(n * (n - 1) // 2, f"sum of 0..{n - 1}")
+    return int(np.arange(n, dtype=np.int64).sum())
+
+def array_sum_numpy_chunked(n, chunk=CHUNK):
+    """int64 aranges of at most `chunk` elements; chunk sums add up as Python ints"""
+    np = _numpy()
+    total = 0
+    for start in range(0, n, chunk):
+        end = min(start + chunk, n)
+        _check_int64((end - 1) * (end - start), f"sum of {start}..{end - 1}")
+        total += int(np.arange(start, end, dtype=np.int64).sum())
+    return total
+
+def array_sum_closed_form(n):
+    """Gauss: 0 + 1 + ... + (n-1) = n(n-1)/2"""
+    return n * (n - 1) // 2
+
+VARIANTS = {
+    'loop': array_sum,
+    'builtin': array_sum_builtin,
+    'itertools': array_sum_itertools,
+    'numpy': array_sum_numpy,
+    'numpy-chunked': array_sum_numpy_chunked,
+    'closed-form': array_sum_closed_form,
+}
+
+def parse_args(argv):
+    """
+    Return (n, variant, verify, stats). argparse is only imported when flags
+    are given, so the default baseline run pays no extra import time.
+    """
+    default_n = int(os.environ.get('BENCH_SIZE', 1000000))
+    if not argv:
+        return default_n, 'loop', False, False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-005 array sum')
+    parser.add_argument('--variant', choices=VARIANTS, default='loop')
+    parser.add_argument('--n', type=int, default=default_n,
+                        help='integers to sum (default: $BENCH_SIZE or 1000000)')
+    parser.add_argument('--verify', action='store_true',
+                        help='check the result against n(n-1)/2')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the summing time to stderr')
+    args = parser.parse_args(argv)
+    return args.n, args.variant, args.verify, args.stats
+
+def main():
+    n, variant, verify, stats = parse_args(sys.argv[1:])
+    if variant.startswith('numpy'):
+        _numpy()  # ~100ms import: keep it out of the --stats timing
+    if stats:
+        import time
+        start = time.perf_counter()
+    try:
+        result = VARIANTS[variant](n)
+    except OverflowError as e:
+        sys.exit(f"{variant}: {e}")
+    if stats:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"{variant} n={n}: {elapsed_ms:.2f}ms", file=sys.stderr)
+    print(result)
+    # Expected: 499999500000
+    if verify:
+        expected = array_sum_closed_form(n)
+        assert result == expected, f"Expected {expected}, got {result}"
+        print("✓ Verification passed")
+
+if __name__ == "__main__":
+    main()
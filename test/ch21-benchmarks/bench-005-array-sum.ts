@@ -8,5 +8,6 @@ function arraySum(n: number): number {
     return sum;
 }
 
-const result = arraySum(1000000);
+const result = arraySum(Number(Deno.env.get("BENCH_SIZE") ?? 1000000));
+console.log(result);
 // Expected: 499999500000
@@ -1,8 +1,15 @@
 // BENCH-006: File Line Processing - C
 #include <stdio.h>
+#include <stdlib.h>
 #include <string.h>
 #include <ctype.h>
 
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
+
 int count_error_lines(const char *filename) {
     FILE *file = fopen(filename, "r");
     if (!file) {
@@ -32,7 +39,9 @@ int count_error_lines(const char *filename) {
 }
 
 int main() {
-    int result = count_error_lines("testdata/bench-006-logs-100mb.txt");
+    char filename[64];
+    snprintf(filename, sizeof(filename), "testdata/bench-006-logs-%ldmb.txt", bench_size(100));
+    int result = count_error_lines(filename);
     printf("%d\n", result);
     // Expected: 126076
     return 0;
@@ -5,9 +5,18 @@ import (
 	"bufio"
 	"fmt"
 	"os"
+	"strconv"
 	"strings"
 )
 
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func countErrorLines(filename string) (int, error) {
 	file, err := os.Open(filename)
 	if err != nil {
@@ -31,7 +40,7 @@ func countErrorLines(filename string) (int, error) {
 }
 
 func main() {
-	result, err := countErrorLines("testdata/bench-006-logs-100mb.txt")
+	result, err := countErrorLines(fmt.Sprintf("testdata/bench-006-logs-%dmb.txt", benchSize(100)))
 	if err != nil {
 		panic(err)
 	}
@@ -11,6 +11,7 @@ function count_error_lines(filename)
     return count
 end
 
-result = count_error_lines("testdata/bench-006-logs-100mb.txt")
+size_mb = get(ENV, "BENCH_SIZE", "100")
+result = count_error_lines("testdata/bench-006-logs-$(size_mb)mb.txt")
 println(result)
 # Expected: 126076
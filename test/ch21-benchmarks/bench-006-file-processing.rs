@@ -2,6 +2,11 @@
 use std::fs::File;
 use std::io::{BufRead, BufReader};
 
+// Problem size: the BENCH_SIZE environment variable, or `default` when unset
+fn bench_size(default: usize) -> usize {
+    std::env::var("BENCH_SIZE").ok().and_then(|s| s.parse().ok()).unwrap_or(default)
+}
+
 fn count_error_lines(filename: &str) -> std::io::Result<usize> {
     let file = File::open(filename)?;
     let reader = BufReader::new(file);
@@ -18,7 +23,7 @@ fn count_error_lines(filename: &str) -> std::io::Result<usize> {
 }
 
 fn main() -> std::io::Result<()> {
-    let result = count_error_lines("testdata/bench-006-logs-100mb.txt")?;
+    let result = count_error_lines(&format!("testdata/bench-006-logs-{}mb.txt", bench_size(100)))?;
     println!("{}", result);
     // Expected: 126076
     Ok(())
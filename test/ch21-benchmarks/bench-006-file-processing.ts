@@ -16,6 +16,7 @@ async function countErrorLines(filename: string): Promise<number> {
     return count;
 }
 
-const result = await countErrorLines('testdata/bench-006-logs-100mb.txt');
+const sizeMb = Deno.env.get("BENCH_SIZE") ?? "100";
+const result = await countErrorLines(`testdata/bench-006-logs-${sizeMb}mb.txt`);
 console.log(result);
 // Expected: 126076
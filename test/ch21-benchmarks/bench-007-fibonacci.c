@@ -2,6 +2,13 @@
 // Tests: function call overhead, stack management
 
 #include <stdio.h>
+#include <stdlib.h>
+
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
 
 int fibonacci(int n) {
     if (n <= 1) {
@@ -11,7 +18,8 @@ int fibonacci(int n) {
 }
 
 int main() {
-    int result = fibonacci(20);
-    // Silent for benchmarking
+    int result = fibonacci((int)bench_size(20));
+    printf("%d\n", result);
+    // Expected: 6765
     return 0;
 }
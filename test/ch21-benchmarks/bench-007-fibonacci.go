@@ -1,6 +1,20 @@
 // BENCH-007: Fibonacci recursive (n=20) - Go
 package main
 
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func fibonacci(n int) int {
 	if n <= 1 {
 		return n
@@ -9,8 +23,7 @@ func fibonacci(n int) int {
 }
 
 func main() {
-	result := fibonacci(20)
-	_ = result
-	// Silent for benchmarking
+	result := fibonacci(benchSize(20))
+	fmt.Println(result)
 	// Expected: 6765
 }
@@ -8,8 +8,8 @@ function fibonacci(n::Int64)::Int64
 end
 
 function main()
-    result = fibonacci(20)
-    # Silent for benchmarking
+    result = fibonacci(parse(Int, get(ENV, "BENCH_SIZE", "20")))
+    println(result)
     # Expected: 6765
 end
 
@@ -2,6 +2,20 @@
 # BENCH-007: Fibonacci recursive (n=20)
 # Python baseline implementation
 # Note: Reduced from n=30 to n=20 for practical timing in interpreted modes
+# Size: BENCH_SIZE environment variable (default n=20)
+#
+# Call-overhead variants (--variant):
+#   recursive  Baseline: doubly recursive fibonacci (default), 2*fib(n+1)-1 calls
+#   memoized   the same recursion under functools.lru_cache: 2n-1 calls
+#   iterative  the recursion tree walked with an explicit stack, no calls
+#   counted    the baseline recursion counting its own calls; prints the call
+#              count and calls per second to stderr, so stdout stays the answer
+#
+# --n scales the problem (e.g. 30, 35; default: $BENCH_SIZE or 20); --stats
+# prints the elapsed time and calls per second to stderr.
+
+import os
+import sys
 
 def fibonacci(n):
     """Calculate nth Fibonacci number recursively"""
@@ -9,10 +23,101 @@ def fibonacci(n):
         return n
     return fibonacci(n - 1) + fibonacci(n - 2)
 
+def fibonacci_memoized(n):
+    """The same recursion with every result cached (fresh cache per call)"""
+    from functools import lru_cache
+
+    @lru_cache(maxsize=None)
+    def fib(k):
+        if k <= 1:
+            return k
+        return fib(k - 1) + fib(k - 2)
+
+    return fib(n)
+
+def fibonacci_iterative(n):
+    """Walk the same recursion tree with an explicit stack: one push per call"""
+    total = 0
+    stack = [n]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        k = pop()
+        if k <= 1:
+            total += k
+        else:
+            push(k - 1)
+            push(k - 2)
+    return total
+
+calls = 0
+
+def fibonacci_counted(n):
+    """Baseline recursion that also counts its calls in the global `calls`"""
+    global calls
+    calls += 1
+    if n <= 1:
+        return n
+    return fibonacci_counted(n - 1) + fibonacci_counted(n - 2)
+
+VARIANTS = {
+    'recursive': fibonacci,
+    'memoized': fibonacci_memoized,
+    'iterative': fibonacci_iterative,
+    'counted': fibonacci_counted,
+}
+
+def fibonacci_linear(n):
+    """Reference value in O(n), for checking the variants at any n"""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+def call_count(n, variant='recursive'):
+    """Calls (or, for iterative, stack pops) a variant makes for fib(n)"""
+    if variant == 'memoized':
+        return max(2 * n - 1, 1)
+    return 2 * fibonacci_linear(n + 1) - 1
+
+def parse_args(argv):
+    """
+    Return (n, variant, stats). argparse is only imported when flags are
+    given, so the default baseline run pays no extra import time.
+    """
+    default_n = int(os.environ.get('BENCH_SIZE', 20))
+    if not argv:
+        return default_n, 'recursive', False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-007 fibonacci')
+    parser.add_argument('--variant', choices=VARIANTS, default='recursive')
+    parser.add_argument('--n', type=int, default=default_n,
+                        help='fibonacci index (default: $BENCH_SIZE or 20)')
+    parser.add_argument('--stats', action='store_true',
+                        help='print elapsed time and calls per second to stderr')
+    args = parser.parse_args(argv)
+    return args.n, args.variant, args.stats
+
 def main():
-    result = fibonacci(20)
-    print(f"fib(20) = {result}")
-    assert result == 6765, f"Expected 6765, got {result}"
+    n, variant, stats = parse_args(sys.argv[1:])
+    if variant == 'counted' or stats:
+        import time
+        start = time.perf_counter()
+    result = VARIANTS[variant](n)
+    if variant == 'counted' or stats:
+        elapsed = time.perf_counter() - start
+    print(f"fib({n}) = {result}")
+    if n == 20:
+        assert result == 6765, f"Expected 6765, got {result}"
+    if variant != 'recursive':
+        expected = fibonacci_linear(n)
+        assert result == expected, f"Expected {expected}, got {result}"
+    if variant == 'counted':
+        assert calls == call_count(n), f"Expected {call_count(n)} calls, got {calls}"
+        print(f"calls: {calls}, {calls / elapsed:.0f} calls/s", file=sys.stderr)
+    if stats:
+        print(f"{variant} n={n}: {elapsed * 1000:.2f}ms, "
+              f"{call_count(n, variant) / elapsed:,.0f} calls/s", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -8,8 +8,8 @@ function fibonacci(n: number): number {
 }
 
 function main(): void {
-    const result = fibonacci(20);
-    // Silent for benchmarking
+    const result = fibonacci(Number(Deno.env.get("BENCH_SIZE") ?? 20));
+    console.log(result);
     // Expected: 6765
 }
 
@@ -6,6 +6,12 @@
 #include <stdbool.h>
 #include <math.h>
 
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
+
 bool is_prime(int n) {
     if (n < 2) {
         return false;
@@ -49,11 +55,13 @@ int* generate_primes(int count, int *out_count) {
 }
 
 int main() {
-    int count = 10000;
+    int count = (int)bench_size(10000);
     int primes_count;
     int *primes = generate_primes(count, &primes_count);
 
-    // Silent for benchmarking
+    // Output the last prime for verification
+    printf("%d\n", primes[primes_count - 1]);
+    // Expected: 104729
     free(primes);
     return 0;
 }
@@ -1,6 +1,20 @@
 // BENCH-008: Prime generation (first 10K primes) - Go
 package main
 
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func generatePrimes(count int) []int {
 	primes := make([]int, 0, count)
 	candidate := 2
@@ -29,9 +43,9 @@ func generatePrimes(count int) []int {
 }
 
 func main() {
-	count := 10000
+	count := benchSize(10000)
 	primes := generatePrimes(count)
-	_ = primes
-	// Silent for benchmarking
+	// Output the last prime for verification
+	fmt.Println(primes[len(primes)-1])
 	// Expected: 10000 primes, last one is 104729
 }
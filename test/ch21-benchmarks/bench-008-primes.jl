@@ -27,9 +27,10 @@ function generate_primes(count::Int64)::Vector{Int64}
 end
 
 function main()
-    count = 10000
+    count = parse(Int, get(ENV, "BENCH_SIZE", "10000"))
     primes = generate_primes(count)
-    # Silent for benchmarking
+    # Output the last prime for verification
+    println(primes[end])
     # Expected: 10000 primes, last one is 104729
 end
 
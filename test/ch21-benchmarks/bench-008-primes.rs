@@ -32,6 +32,11 @@ fn generate_primes(count: i32) -> Vec<i32> {
     }
     primes
 }
+// Problem size: the BENCH_SIZE environment variable, or `default` when unset
+fn bench_size(default: usize) -> usize {
+    std::env::var("BENCH_SIZE").ok().and_then(|s| s.parse().ok()).unwrap_or(default)
+}
 fn main() {
-    let primes = generate_primes(10000);
+    let primes = generate_primes(bench_size(10000) as i32);
+    println!("{}", primes[primes.len() - 1]);
 }
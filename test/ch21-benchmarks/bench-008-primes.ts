@@ -25,9 +25,10 @@ function generatePrimes(count: number): number[] {
 }
 
 function main(): void {
-    const count = 10000;
+    const count = Number(Deno.env.get("BENCH_SIZE") ?? 10000);
     const primes = generatePrimes(count);
-    // Silent for benchmarking
+    // Output the last prime for verification
+    console.log(primes[primes.length - 1]);
     // Expected: 10000 primes, last one is 104729
 }
 
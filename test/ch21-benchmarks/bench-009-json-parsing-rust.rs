@@ -3,6 +3,11 @@
 use std::env;
 use std::fs;
 
+// Problem size: the BENCH_SIZE environment variable, or `default` when unset
+fn bench_size(default: usize) -> usize {
+    std::env::var("BENCH_SIZE").ok().and_then(|s| s.parse().ok()).unwrap_or(default)
+}
+
 // Using serde_json for parsing
 // Note: This requires serde_json to be available
 
@@ -22,12 +27,11 @@ fn parse_and_access(filename: &str) -> Result<String, Box<dyn std::error::Error>
 fn main() -> Result<(), Box<dyn std::error::Error>> {
     let filename = env::args()
         .nth(1)
-        .unwrap_or_else(|| "test-data/sample-50mb.json".to_string());
+        .unwrap_or_else(|| format!("test-data/sample-{}mb.json", bench_size(50)));
 
     let city = parse_and_access(&filename)?;
-    let _ = city;
-    // Silent for benchmarking
-    // Expected: "London" or other city name
+    println!("{}", city);
+    // Expected: "Berlin" for the seed-42 test data
 
     Ok(())
 }
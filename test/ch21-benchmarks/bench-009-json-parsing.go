@@ -4,8 +4,10 @@ package main
 
 import (
 	"encoding/json"
+	"fmt"
 	"io"
 	"os"
+	"strconv"
 )
 
 type Location struct {
@@ -39,6 +41,14 @@ type Data struct {
 	Users []User `json:"users"`
 }
 
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func parseAndAccess(filename string) (string, error) {
 	file, err := os.Open(filename)
 	if err != nil {
@@ -62,7 +72,7 @@ func parseAndAccess(filename string) (string, error) {
 }
 
 func main() {
-	filename := "test-data/sample-50mb.json"
+	filename := fmt.Sprintf("test-data/sample-%dmb.json", benchSize(50))
 	if len(os.Args) > 1 {
 		filename = os.Args[1]
 	}
@@ -72,7 +82,6 @@ func main() {
 		panic(err)
 	}
 
-	_ = city
-	// Silent for benchmarking
-	// Expected: "London" or other city name
+	fmt.Println(city)
+	// Expected: "Berlin" for the seed-42 test data
 }
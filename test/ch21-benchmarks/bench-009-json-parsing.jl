@@ -13,10 +13,10 @@ function parse_and_access(filename::String)::String
 end
 
 function main()
-    filename = length(ARGS) > 0 ? ARGS[1] : "test-data/sample-50mb.json"
+    filename = length(ARGS) > 0 ? ARGS[1] : "test-data/sample-$(get(ENV, "BENCH_SIZE", "50"))mb.json"
     city = parse_and_access(filename)
-    # Silent for benchmarking
-    # Expected: "London" or other city name
+    println(city)
+    # Expected: "Berlin" for the seed-42 test data
 end
 
 main()
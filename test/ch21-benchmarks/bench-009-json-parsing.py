@@ -1,10 +1,24 @@
 #!/usr/bin/env python3
 # BENCH-009: JSON parsing (50MB file) - Python
 # Parse large JSON and access deeply nested value
+#
+# Variants (--variant):
+#   load  Baseline: json.load the whole document, then index into it (default)
+#   lazy  Resolve the path while scanning an mmap of the file: unneeded
+#         subtrees are skipped without being materialized and scanning stops
+#         as soon as the target value is found
+#
+# --stats prints elapsed time and peak RSS to stderr.
 
 import json
+import os
 import sys
 
+# Size: BENCH_SIZE environment variable, the document size in MB (default 50)
+DEFAULT_FILE = f"test-data/sample-{os.environ.get('BENCH_SIZE', '50')}mb.json"
+
+TARGET_PATH = "users[500].profile.location.city"
+
 def parse_and_access(filename):
     """Parse JSON file and access deeply nested value"""
     with open(filename, 'r') as f:
@@ -14,11 +28,143 @@ def parse_and_access(filename):
     city = data['users'][500]['profile']['location']['city']
     return city
 
+def parse_path(expression):
+    """Split a path like users[500].profile into ['users', 500, 'profile']"""
+    import re
+    return [name if name else int(index)
+            for name, index in re.findall(r'([^.\[\]]+)|\[(\d+)\]', expression)]
+
+class LazyJSON:
+    """
+    Path lookup over a memory-mapped JSON file.
+
+    Only the bytes on the way to the target are touched: objects and
+    arrays that are not on the path are skipped by jumping between
+    structural characters with regex searches, and strings are skipped
+    whole. Nothing but the final value is decoded.
+    """
+
+    def __init__(self, buf):
+        import re
+        self.buf = buf
+        self.ws = re.compile(rb'[ \t\n\r]*')
+        self.string = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+        self.structural = re.compile(rb'["{}\[\]]')
+        self.scalar = re.compile(rb'[^,}\]\s]+')
+
+    def _skip_ws(self, pos):
+        return self.ws.match(self.buf, pos).end()
+
+    def _expect(self, pos, char):
+        pos = self._skip_ws(pos)
+        if self.buf[pos:pos + 1] != char:
+            raise ValueError(f"expected {char!r} at byte {pos}")
+        return pos + 1
+
+    def _skip_value(self, pos):
+        """Return the offset just past the value starting at pos"""
+        first = self.buf[pos:pos + 1]
+        if first == b'"':
+            return self.string.match(self.buf, pos).end()
+        if first not in (b'{', b'['):
+            return self.scalar.match(self.buf, pos).end()
+        depth = 0
+        while True:
+            match = self.structural.search(self.buf, pos)
+            if match is None:
+                raise ValueError("unterminated container")
+            char = match.group()
+            if char == b'"':
+                pos = self.string.match(self.buf, match.start()).end()
+                continue
+            pos = match.end()
+            depth += 1 if char in (b'{', b'[') else -1
+            if depth == 0:
+                return pos
+
+    def _member(self, pos, key):
+        """From an object at pos, return the offset of key's value"""
+        pos = self._expect(pos, b'{')
+        while True:
+            pos = self._skip_ws(pos)
+            if self.buf[pos:pos + 1] == b'}':
+                raise KeyError(key)
+            match = self.string.match(self.buf, pos)
+            if match is None:
+                raise ValueError(f"expected object key at byte {pos}")
+            pos = self._skip_ws(self._expect(match.end(), b':'))
+            if json.loads(match.group()) == key:
+                return pos
+            pos = self._skip_ws(self._skip_value(pos))
+            if self.buf[pos:pos + 1] != b',':
+                raise KeyError(key)
+            pos += 1
+
+    def _element(self, pos, index):
+        """From an array at pos, return the offset of element `index`"""
+        pos = self._expect(pos, b'[')
+        for _ in range(index):
+            pos = self._skip_ws(pos)
+            if self.buf[pos:pos + 1] == b']':
+                raise IndexError(index)
+            pos = self._skip_ws(self._skip_value(pos))
+            if self.buf[pos:pos + 1] != b',':
+                raise IndexError(index)
+            pos += 1
+        pos = self._skip_ws(pos)
+        if self.buf[pos:pos + 1] == b']':
+            raise IndexError(index)
+        return pos
+
+    def get(self, path):
+        """Decode and return the value at path (a list of keys and indexes)"""
+        pos = self._skip_ws(0)
+        for step in path:
+            pos = self._element(pos, step) if isinstance(step, int) else self._member(pos, step)
+        return json.loads(self.buf[pos:self._skip_value(pos)])
+
+def parse_and_access_lazy(filename, expression=TARGET_PATH):
+    """Resolve the nested value lazily from an mmap of the file"""
+    import mmap
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return LazyJSON(mm).get(parse_path(expression))
+
+VARIANTS = {
+    'load': parse_and_access,
+    'lazy': parse_and_access_lazy,
+}
+
+def parse_args(argv):
+    """
+    Return (filename, variant, stats). argparse is only imported when flags
+    are given, so the default baseline run pays no extra import time.
+    """
+    if len(argv) <= 1 and not any(a.startswith('-') for a in argv):
+        return (argv[0] if argv else DEFAULT_FILE), 'load', False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-009 JSON parsing')
+    parser.add_argument('filename', nargs='?', default=DEFAULT_FILE)
+    parser.add_argument('--variant', choices=VARIANTS, default='load')
+    parser.add_argument('--stats', action='store_true',
+                        help='print elapsed time and peak RSS to stderr')
+    args = parser.parse_args(argv)
+    return args.filename, args.variant, args.stats
+
 def main():
-    filename = sys.argv[1] if len(sys.argv) > 1 else "test-data/sample-50mb.json"
-    city = parse_and_access(filename)
-    # Silent for benchmarking
-    # Expected: "London" or other city name
+    filename, variant, stats = parse_args(sys.argv[1:])
+    if stats:
+        import resource
+        import time
+        start = time.perf_counter()
+    city = VARIANTS[variant](filename)
+    print(city)
+    # Expected: "Berlin" for the seed-42 test data
+    if stats:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"{variant}: {city} in {elapsed_ms:.2f}ms, peak RSS {peak_kb / 1024:.1f}MB",
+              file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -11,10 +11,10 @@ async function parseAndAccess(filename: string): Promise<string> {
 }
 
 async function main(): Promise<void> {
-    const filename = Deno.args[0] || "test-data/sample-50mb.json";
+    const filename = Deno.args[0] || `test-data/sample-${Deno.env.get("BENCH_SIZE") ?? "50"}mb.json`;
     const city = await parseAndAccess(filename);
-    // Silent for benchmarking
-    // Expected: "London" or other city name
+    console.log(city);
+    // Expected: "Berlin" for the seed-42 test data
 }
 
 main();
@@ -1,5 +1,12 @@
 // BENCH-011: Nested Loops (1000x1000 iterations) - C
 #include <stdio.h>
+#include <stdlib.h>
+
+// Problem size: the BENCH_SIZE environment variable, or `def` when unset
+static long bench_size(long def) {
+    const char *size = getenv("BENCH_SIZE");
+    return size ? atol(size) : def;
+}
 
 long long nested_loops(int outer, int inner) {
     long long total = 0;
@@ -12,7 +19,9 @@ long long nested_loops(int outer, int inner) {
 }
 
 int main() {
-    long long result = nested_loops(1000, 1000);
+    int n = (int)bench_size(1000);
+    long long result = nested_loops(n, n);
+    printf("%lld\n", result);
     // Expected: 249500250000
     return 0;
 }
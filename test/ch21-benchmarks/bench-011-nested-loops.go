@@ -1,6 +1,20 @@
 // BENCH-011: Nested Loops (1000x1000 iterations) - Go
 package main
 
+import (
+	"fmt"
+	"os"
+	"strconv"
+)
+
+// benchSize returns the BENCH_SIZE environment variable, or def when unset
+func benchSize(def int) int {
+	if n, err := strconv.Atoi(os.Getenv("BENCH_SIZE")); err == nil {
+		return n
+	}
+	return def
+}
+
 func nestedLoops(outer, inner int) int {
 	total := 0
 	for i := 0; i < outer; i++ {
@@ -12,6 +26,8 @@ func nestedLoops(outer, inner int) int {
 }
 
 func main() {
-	result := nestedLoops(1000, 1000)
-	_ = result // Expected: 249500250000
+	n := benchSize(1000)
+	result := nestedLoops(n, n)
+	fmt.Println(result)
+	// Expected: 249500250000
 }
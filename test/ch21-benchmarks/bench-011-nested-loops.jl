@@ -10,5 +10,7 @@ function nested_loops(outer, inner)
     total
 end
 
-result = nested_loops(1000, 1000)
+n = parse(Int, get(ENV, "BENCH_SIZE", "1000"))
+result = nested_loops(n, n)
+println(result)
 # Expected: 249500250000
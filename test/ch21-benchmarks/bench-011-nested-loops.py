@@ -1,5 +1,29 @@
 #!/usr/bin/env python3
 # BENCH-011: Nested Loops (1000x1000 iterations) - Python
+# Size: BENCH_SIZE environment variable (default 1000, i.e. 1000x1000)
+#
+# Variants (--variant), all summing i*j over 0..n-1 x 0..n-1:
+#   loop           Baseline: two nested for loops (default)
+#   builtin        sum() over a nested generator expression
+#   itertools      sum(starmap(mul, product(range(n), range(n))))
+#   numpy          np.outer(i, j).sum() in int64 (requires numpy; needs 8n² bytes)
+#   numpy-chunked  np.outer on blocks of rows of at most CHUNK products, block
+#                  sums added as Python ints (requires numpy)
+#   closed-form    (n(n-1)/2)², since sum(i*j) = sum(i) * sum(j)
+#
+# NumPy multiplies and sums in int64 and wraps silently, so the numpy variants
+# refuse sizes whose sum (or block sum) could exceed 2^63-1. --n scales the
+# problem (n² iterations: n=31623 is 10^9; default: $BENCH_SIZE or 1000);
+# --verify checks the result against the closed form; --stats prints the
+# summing time.
+
+import os
+import sys
+
+INT64_MAX = 2 ** 63 - 1
+
+# Products per numpy-chunked block: 32MB of int64
+CHUNK = 1 << 22
 
 def nested_loops(outer, inner):
     total = 0
@@ -8,5 +32,105 @@ def nested_loops(outer, inner):
             total += i * j
     return total
 
-result = nested_loops(1000, 1000)
-# Expected: 249500250000
+def nested_loops_builtin(outer, inner):
+    """Builtin sum over a nested generator: same n² products, no explicit loop body"""
+    return sum(i * j for i in range(outer) for j in range(inner))
+
+def nested_loops_itertools(outer, inner):
+    """Every (i, j) pair from itertools.product, multiplied by operator.mul in C"""
+    from itertools import product, starmap
+    from operator import mul
+    return sum(starmap(mul, product(range(outer), range(inner))))
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        sys.exit("numpy variants require numpy (pip install numpy)")
+    return np
+
+def _check_int64(bound, what):
+    if bound > INT64_MAX:
+        raise OverflowError(f"{what} can reach {bound}, beyond int64; "
+                            "use numpy-chunked or closed-form")
+
+def _triangle(n):
+    return n * (n - 1) // 2
+
+def nested_loops_numpy(outer, inner):
+    """The full outer-product matrix, summed in NumPy"""
+    np = _numpy()
+    _check_int64(_triangle(outer) * _triangle(inner), f"sum over {outer}x{inner}")
+    i = np.arange(outer, dtype=np.int64)
+    j = np.arange(inner, dtype=np.int64)
+    return int(np.outer(i, j).sum())
+
+def nested_loops_numpy_chunked(outer, inner, chunk=CHUNK):
+    """Outer products of blocks of rows; block sums add up as Python ints"""
+    np = _numpy()
+    j = np.arange(inner, dtype=np.int64)
+    rows = max(1, chunk // max(inner, 1))
+    total = 0
+    for start in range(0, outer, rows):
+        end = min(start + rows, outer)
+        _check_int64((_triangle(end) - _triangle(start)) * _triangle(inner),
+                     f"sum over rows {start}..{end - 1}")
+        total += int(np.outer(np.arange(start, end, dtype=np.int64), j).sum())
+    return total
+
+def nested_loops_closed_form(outer, inner):
+    """sum(i*j) factors into sum(i) * sum(j)"""
+    return _triangle(outer) * _triangle(inner)
+
+VARIANTS = {
+    'loop': nested_loops,
+    'builtin': nested_loops_builtin,
+    'itertools': nested_loops_itertools,
+    'numpy': nested_loops_numpy,
+    'numpy-chunked': nested_loops_numpy_chunked,
+    'closed-form': nested_loops_closed_form,
+}
+
+def parse_args(argv):
+    """
+    Return (n, variant, verify, stats). argparse is only imported when flags
+    are given, so the default baseline run pays no extra import time.
+    """
+    default_n = int(os.environ.get('BENCH_SIZE', 1000))
+    if not argv:
+        return default_n, 'loop', False, False
+    import argparse
+    parser = argparse.ArgumentParser(description='BENCH-011 nested loops')
+    parser.add_argument('--variant', choices=VARIANTS, default='loop')
+    parser.add_argument('--n', type=int, default=default_n,
+                        help='loop bound, n x n iterations (default: $BENCH_SIZE or 1000)')
+    parser.add_argument('--verify', action='store_true',
+                        help='check the result against (n(n-1)/2)²')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the summing time to stderr')
+    args = parser.parse_args(argv)
+    return args.n, args.variant, args.verify, args.stats
+
+def main():
+    n, variant, verify, stats = parse_args(sys.argv[1:])
+    if variant.startswith('numpy'):
+        _numpy()  # ~100ms import: keep it out of the --stats timing
+    if stats:
+        import time
+        start = time.perf_counter()
+    try:
+        result = VARIANTS[variant](n, n)
+    except OverflowError as e:
+        sys.exit(f"{variant}: {e}")
+    if stats:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"{variant} n={n}: {elapsed_ms:.2f}ms", file=sys.stderr)
+    print(result)
+    # Expected: 249500250000
+    if verify:
+        expected = nested_loops_closed_form(n, n)
+        assert result == expected, f"Expected {expected}, got {result}"
+        print("✓ Verification passed")
+
+if __name__ == "__main__":
+    main()
@@ -10,5 +10,7 @@ function nestedLoops(outer: number, inner: number): number {
     return total;
 }
 
-const result = nestedLoops(1000, 1000);
+const n = Number(Deno.env.get("BENCH_SIZE") ?? 1000);
+const result = nestedLoops(n, n);
+console.log(result);
 // Expected: 249500250000
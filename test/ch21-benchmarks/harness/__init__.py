@@ -0,0 +1,14 @@
+"""
+Chapter 21 benchmark orchestrator
+
+Replaces the per-benchmark run-bench-NNN-full.sh scripts: discovers every
+bench-NNN-*.{py,ts,jl,go,rs,c,ruchy} implementation, compiles each mode once,
+times every run in-process and writes results/bench-NNN-results-full.json.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness                     # all benchmarks, all modes
+    python3 -m harness --bench 007 011     # selected benchmarks
+    python3 -m harness --mode python c     # selected modes
+"""
+
+TOOL = "ch21 harness v1.0.0"
@@ -0,0 +1,148 @@
+"""Command-line entry point: python3 -m harness"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .discovery import BENCH_DIR, discover
+from .history import DEFAULT_DB, connect, record
+from .inprocess import KERNEL_ITERATIONS
+from .measure import ADAPTIVE
+from .modes import MODES, python_variant
+from .preflight import MAX_LOAD, disable_aslr, inspect, pin, print_report
+from .results import capture_environment
+from .runner import MEASURED_ITERATIONS, WARMUP_ITERATIONS, print_summary, run_sweep
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness",
+                                     description="Run Chapter 21 benchmarks in all execution modes")
+    parser.add_argument("--bench", nargs="+", metavar="NNN",
+                        help="benchmark numbers to run (default: all discovered)")
+    parser.add_argument("--mode", nargs="+", metavar="MODE",
+                        help=f"modes to run (default: all): {', '.join(MODES)}, "
+                             "or python-VARIANT")
+    parser.add_argument("--variants", action="store_true",
+                        help="also run each benchmark's alternative Python baselines "
+                             "(e.g. python-mmap for BENCH-006)")
+    parser.add_argument("--warmup", type=int, default=WARMUP_ITERATIONS)
+    parser.add_argument("--iterations", type=int, default=MEASURED_ITERATIONS)
+    parser.add_argument("--adaptive", action="store_true",
+                        help="adaptive sampling instead of fixed --warmup/--iterations: warm up "
+                             "until steady, then sample until the 95%% CI is within --target-ci "
+                             "of the mean or --budget runs out")
+    parser.add_argument("--target-ci", type=float, default=ADAPTIVE["target_ci"], metavar="FRACTION",
+                        help=f"relative CI half-width to stop at (default: {ADAPTIVE['target_ci']})")
+    parser.add_argument("--budget", type=float, default=ADAPTIVE["budget_s"], metavar="SECONDS",
+                        help=f"time budget per mode (default: {ADAPTIVE['budget_s']:g})")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="run up to N (benchmark, mode) pairs in parallel, "
+                             "each pinned to its own physical core (default: 1, serial)")
+    parser.add_argument("--python-kernel", type=int, nargs="?", const=KERNEL_ITERATIONS,
+                        default=0, metavar="N",
+                        help="also time Python kernels in-process for N iterations "
+                             f"(default when given: {KERNEL_ITERATIONS})")
+    parser.add_argument("--counters", type=int, nargs="?", const=3, default=0, metavar="N",
+                        help="N extra untimed runs per mode under perf_event_open counters "
+                             "(instructions, cycles, IPC, cache/branch misses, context "
+                             "switches; default when given: 3)")
+    parser.add_argument("--profile", action="store_true",
+                        help="one extra untimed run per mode under a sampling profiler, writing "
+                             "RESULTS_DIR/profiles/bench-NNN/MODE/{stacks.collapsed,flamegraph.svg}")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="one extra untimed run per Python mode under tracemalloc, "
+                             "recording its peak and allocated blocks")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="skip checking each mode's output against golden/bench-NNN.txt "
+                             "before timing it")
+    parser.add_argument("--preflight", choices=["warn", "strict", "off"], default="warn",
+                        help="noise checks before timing (governor, boost, ASLR, load, SMT, "
+                             "thermal): warn (default), strict (abort if any fails) or off")
+    parser.add_argument("--max-load", type=float, default=MAX_LOAD, metavar="PER_CPU",
+                        help=f"1-minute load per CPU counted as noisy (default: {MAX_LOAD:g})")
+    parser.add_argument("--pin", type=int, nargs="?", const=-1, default=None, metavar="CPU",
+                        help="run everything on one CPU (default when given: an isolcpus core, "
+                             "else one with idle SMT siblings away from CPU 0)")
+    parser.add_argument("--no-aslr", action="store_true",
+                        help="disable address space randomization for benchmark processes")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="rebuild compiled modes even when the build cache has them")
+    parser.add_argument("--no-build-cache", action="store_true",
+                        help="build into throwaway .temp files instead of .temp/build-cache")
+    parser.add_argument("--results-dir", default=str(BENCH_DIR / "results"))
+    parser.add_argument("--history", default=str(DEFAULT_DB), metavar="DB",
+                        help="append results to this SQLite history (see harness.history)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="do not append results to the history")
+    parser.add_argument("--list", action="store_true",
+                        help="list discovered benchmarks and their sources, then exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    unknown = [m for m in args.mode or [] if m not in MODES and not python_variant(m)]
+    if unknown:
+        print(f"Unknown mode(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    benchmarks = discover(only=set(args.bench) if args.bench else None)
+    if not benchmarks:
+        print("No benchmarks found", file=sys.stderr)
+        return 1
+
+    if args.list:
+        for bench in benchmarks:
+            langs = ", ".join(sorted(bench["sources"]))
+            variants = f"  variants: {', '.join(bench['variants'])}" if bench["variants"] else ""
+            print(f"{bench['id']}  {bench['name']:<40} [{langs}]{variants}")
+        return 0
+
+    results_dir = Path(args.results_dir)
+    temp_dir = BENCH_DIR / ".temp"
+    temp_dir.mkdir(exist_ok=True)
+    if args.pin is not None:
+        try:
+            cpu = pin(None if args.pin < 0 else args.pin)
+        except (OSError, IndexError) as e:
+            print(f"❌ Cannot pin to CPU {args.pin}: {e}", file=sys.stderr)
+            return 2
+        print(f"Pinned to CPU {cpu}", file=sys.stderr)
+    aslr_disabled = args.no_aslr and disable_aslr()
+    if args.no_aslr and not aslr_disabled:
+        print("  ⚠️  Could not disable ASLR (personality refused)", file=sys.stderr)
+    preflight = inspect(args.max_load, aslr_disabled) if args.preflight != "off" else {}
+    environment = capture_environment(preflight)
+    modes = args.mode or list(MODES)
+
+    print("Benchmark harness", file=sys.stderr)
+    print(f"  CPU: {environment['cpu']}", file=sys.stderr)
+    print(f"  RAM: {environment['ram']}", file=sys.stderr)
+    print(f"  OS:  {environment['os']}", file=sys.stderr)
+    print(f"  Date: {environment['timestamp']}", file=sys.stderr)
+    if preflight:
+        print("Pre-flight:", file=sys.stderr)
+        print_report(preflight)
+        if preflight["noisy"] and args.preflight == "strict":
+            print(f"❌ Machine too noisy for timing ({', '.join(preflight['noisy'])}); "
+                  "fix it or rerun with --preflight warn", file=sys.stderr)
+            return 3
+
+    adaptive = {"target_ci": args.target_ci, "budget_s": args.budget} if args.adaptive else None
+    history = None if args.no_history else connect(args.history)
+    for data in run_sweep(benchmarks, modes, environment, results_dir, temp_dir,
+                          args.warmup, args.iterations, args.jobs, args.python_kernel, args.variants,
+                          args.tracemalloc, adaptive, not args.no_build_cache, args.rebuild,
+                          args.counters, args.profile, not args.no_verify):
+        print_summary(data)
+        if history:
+            record(history, data, results_dir=results_dir)
+    if history:
+        history.close()
+    if preflight and preflight["noisy"]:
+        print(f"\n⚠️  Timings taken on a noisy machine ({', '.join(preflight['noisy'])}); "
+              "see environment.preflight in the results", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
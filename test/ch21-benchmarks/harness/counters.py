@@ -0,0 +1,217 @@
+"""
+Hardware/software performance counters for a benchmark run via perf_event_open(2).
+
+No perf binary is needed: counters are opened (disabled, enable_on_exec,
+inherited by children) on a forked child that is held on a pipe until they
+are in place, then released to exec the benchmark. Counts are scaled for
+multiplexing. Counters the CPU or kernel does not offer (common in VMs) are
+recorded as None.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.counters python3 bench-011-nested-loops.py
+"""
+
+import ctypes
+import os
+import platform
+import signal
+import struct
+import sys
+
+# perf_event_open syscall numbers
+SYSCALLS = {"x86_64": 298, "aarch64": 241, "riscv64": 241, "ppc64le": 319}
+
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+
+# Result key -> (type, config)
+EVENTS = {
+    "instructions": (PERF_TYPE_HARDWARE, 1),
+    "cycles": (PERF_TYPE_HARDWARE, 0),
+    "cache_references": (PERF_TYPE_HARDWARE, 2),
+    "cache_misses": (PERF_TYPE_HARDWARE, 3),
+    "branches": (PERF_TYPE_HARDWARE, 4),
+    "branch_misses": (PERF_TYPE_HARDWARE, 5),
+    "context_switches": (PERF_TYPE_SOFTWARE, 3),
+    "cpu_migrations": (PERF_TYPE_SOFTWARE, 4),
+    "page_faults": (PERF_TYPE_SOFTWARE, 2),
+}
+
+# perf_event_attr flag bits
+DISABLED = 1 << 0
+INHERIT = 1 << 1
+EXCLUDE_KERNEL = 1 << 5
+EXCLUDE_HV = 1 << 6
+ENABLE_ON_EXEC = 1 << 12
+
+# read_format: value, time_enabled, time_running
+READ_FORMAT = 1 | 2
+
+ATTR_SIZE = 64  # PERF_ATTR_SIZE_VER0
+
+
+class CountersUnavailable(Exception):
+    """Raised when perf_event_open cannot be used on this system"""
+
+
+_libc = None
+
+
+def _syscall_number():
+    number = SYSCALLS.get(platform.machine())
+    if number is None:
+        raise CountersUnavailable(f"perf_event_open: unsupported architecture {platform.machine()}")
+    return number
+
+
+def _perf_event_open(event_type, config, pid, exclude_kernel):
+    global _libc
+    number = _syscall_number()
+    if _libc is None:
+        _libc = ctypes.CDLL(None, use_errno=True)
+    flags = DISABLED | INHERIT | ENABLE_ON_EXEC | EXCLUDE_HV
+    if exclude_kernel:
+        flags |= EXCLUDE_KERNEL
+    # type, size, config, sample_period, sample_type, read_format, flags,
+    # wakeup_events, bp_type, config1
+    attr = struct.pack("IIQQQQQIIQ", event_type, ATTR_SIZE, config, 0, 0, READ_FORMAT, flags,
+                       0, 0, 0)
+    buf = ctypes.create_string_buffer(attr, ATTR_SIZE)
+    fd = _libc.syscall(number, buf, pid, -1, -1, 0)
+    if fd < 0:
+        return None, ctypes.get_errno()
+    return fd, 0
+
+
+def _open_counters(pid):
+    """Open every event on pid; returns {key: fd or None} and the errnos seen"""
+    fds = {}
+    errors = set()
+    try:
+        for key, (event_type, config) in EVENTS.items():
+            # Hardware counters in user space only (allowed at perf_event_paranoid 2);
+            # software events such as context switches happen in the kernel
+            fd, err = _perf_event_open(event_type, config, pid, event_type == PERF_TYPE_HARDWARE)
+            if fd is None and event_type == PERF_TYPE_SOFTWARE:
+                fd, err = _perf_event_open(event_type, config, pid, True)
+            fds[key] = fd
+            if err:
+                errors.add(err)
+    except BaseException:
+        for fd in fds.values():
+            if fd is not None:
+                os.close(fd)
+        raise
+    return fds, errors
+
+
+def _read_scaled(fd):
+    value, enabled, running = struct.unpack("QQQ", os.read(fd, 24))
+    if running == 0:
+        return None if enabled else value
+    return int(value * enabled / running) if running < enabled else value
+
+
+def count(argv, cwd=None):
+    """
+    Run argv once (output discarded) with counters attached.
+
+    Returns {"exit_code", and one key per EVENTS entry (None if unavailable)}.
+    Raises CountersUnavailable if no counter at all could be opened.
+    """
+    _syscall_number()  # unsupported architecture: fail before forking
+    ready_r, ready_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(ready_w)
+            os.read(ready_r, 1)
+            if cwd:
+                os.chdir(cwd)
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for target in (0, 1, 2):
+                os.dup2(devnull, target)
+            os.execvp(argv[0], argv)
+        finally:
+            os._exit(127)
+
+    os.close(ready_r)
+    try:
+        fds, errors = _open_counters(pid)
+    except BaseException:
+        # The child is still parked on the pipe: kill it rather than let it
+        # exec unmeasured, and reap it
+        os.kill(pid, signal.SIGKILL)
+        os.close(ready_w)
+        os.waitpid(pid, 0)
+        raise
+    os.write(ready_w, b"x")
+    os.close(ready_w)
+    _, status = os.waitpid(pid, 0)
+
+    result = {"exit_code": os.waitstatus_to_exitcode(status)}
+    for key, fd in fds.items():
+        if fd is None:
+            result[key] = None
+            continue
+        try:
+            result[key] = _read_scaled(fd)
+        finally:
+            os.close(fd)
+    if all(fd is None for fd in fds.values()):
+        raise CountersUnavailable("perf_event_open failed: " +
+                                  ", ".join(os.strerror(e) for e in sorted(errors)))
+    return result
+
+
+def summarize_counters(runs):
+    """Mean of each counter over runs, plus derived IPC and miss rates"""
+    summary = {"runs": len(runs), "source": "perf_event_open"}
+    for key in EVENTS:
+        values = [r[key] for r in runs if r[key] is not None]
+        summary[key] = round(sum(values) / len(values)) if len(values) == len(runs) else None
+
+    def ratio(a, b, digits):
+        if summary[a] is None or not summary[b]:
+            return None
+        return round(summary[a] / summary[b], digits)
+
+    summary["ipc"] = ratio("instructions", "cycles", 3)
+    summary["cache_miss_rate"] = ratio("cache_misses", "cache_references", 4)
+    summary["branch_miss_rate"] = ratio("branch_misses", "branches", 4)
+    return summary
+
+
+def measure_counters(argv, cwd, runs):
+    """
+    `runs` extra, untimed counter runs of argv, summarized.
+
+    Kept separate from the timed iterations so counter setup never shows up
+    in mean_ms. Raises RuntimeError if a run exits non-zero.
+    """
+    samples = []
+    for _ in range(runs):
+        sample = count(argv, cwd)
+        if sample["exit_code"] != 0:
+            raise RuntimeError(f"exit status {sample['exit_code']} during counter run")
+        samples.append(sample)
+    return summarize_counters(samples)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python3 -m harness.counters CMD [ARGS...]", file=sys.stderr)
+        return 2
+    try:
+        summary = summarize_counters([count(argv)])
+    except CountersUnavailable as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    for key, value in summary.items():
+        print(f"{key:<18} {'n/a' if value is None else value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Find benchmark implementations in the ch21-benchmarks directory"""
+
+import re
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent.parent
+
+# Human-readable names (same strings the run-bench-NNN-full.sh scripts used)
+BENCHMARK_NAMES = {
+    "002": "Matrix multiplication (100x100)",
+    "003": "String concatenation (10K operations)",
+    "004": "Binary tree allocation (depth=16)",
+    "005": "Array sum (1M integers)",
+    "006": "File processing (100MB log)",
+    "007": "Fibonacci recursive (n=20)",
+    "008": "Prime generation (first 10K primes)",
+    "009": "JSON parsing (50MB file)",
+    "011": "Nested loops (1000x1000)",
+    "012": "Startup time (Hello World)",
+}
+
+# Alternative Python baselines selectable with `--variant NAME` in the
+# benchmark's .py file; run as extra "python-NAME" modes with --variants
+PYTHON_VARIANTS = {
+    "002": ["row-cached", "blocked", "numpy"],
+    "003": ["naive", "generator", "stringio", "bytearray", "repeat"],
+    "004": ["slots", "tuple", "arena"],
+    "005": ["builtin", "itertools", "numpy", "numpy-chunked", "closed-form"],
+    "006": ["mmap", "mmap-parallel"],
+    "007": ["memoized", "iterative", "counted"],
+    "008": ["sieve", "segmented", "segmented-parallel"],
+    "009": ["lazy"],
+    "011": ["builtin", "itertools", "numpy", "numpy-chunked", "closed-form"],
+}
+
+# Source extension for each language; Rust also accepts a "-rust.rs" suffix
+EXTENSIONS = {
+    "python": ".py",
+    "deno": ".ts",
+    "julia": ".jl",
+    "go": ".go",
+    "rust": ".rs",
+    "c": ".c",
+    "ruchy": ".ruchy",
+}
+
+_PY_BASELINE = re.compile(r"^bench-(\d{3})-([a-z0-9-]+)\.py$")
+
+
+def find_source(bench_dir, stem, language):
+    """Return the source file for one language, or None if not implemented"""
+    ext = EXTENSIONS[language]
+    candidates = [bench_dir / f"{stem}{ext}"]
+    if language == "rust":
+        candidates.append(bench_dir / f"{stem}-rust.rs")
+    for path in candidates:
+        if path.is_file():
+            return path
+    return None
+
+
+def discover(bench_dir=BENCH_DIR, only=None):
+    """
+    Discover benchmarks keyed by their Python baseline.
+
+    The canonical stem (bench-NNN-slug) comes from the .py file so that
+    helper variants such as bench-008-primes-verify.ruchy are not picked up.
+    Returns a list of dicts sorted by benchmark number.
+    """
+    benchmarks = []
+    for path in sorted(bench_dir.glob("bench-*.py")):
+        match = _PY_BASELINE.match(path.name)
+        if not match:
+            continue
+        number = match.group(1)
+        if only and number not in only:
+            continue
+        stem = path.stem
+        sources = {}
+        for language in EXTENSIONS:
+            source = find_source(bench_dir, stem, language)
+            if source:
+                sources[language] = source
+        benchmarks.append({
+            "number": number,
+            "id": f"BENCH-{number}",
+            "stem": stem,
+            "name": BENCHMARK_NAMES.get(number, stem),
+            "sources": sources,
+            "variants": PYTHON_VARIANTS.get(number, []),
+        })
+    return benchmarks
@@ -0,0 +1,195 @@
+"""
+Profiling runs: collapsed stacks and SVG flamegraphs per (benchmark, mode)
+
+Python modes are sampled with py-spy when installed, else with
+harness.pysample; every other mode (compiled, transpiled, Ruchy AST and
+bytecode VMs, deno, julia) is sampled with `perf record -g`. Output goes to
+results/profiles/bench-NNN/<mode>/{stacks.collapsed,flamegraph.svg}.
+
+    python3 -m harness.flamegraph stacks.collapsed flamegraph.svg "BENCH-008 ruchy-ast"
+renders an SVG from any collapsed-stack file.
+"""
+
+import collections
+import html
+import shutil
+import subprocess
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+from .modes import language_of
+
+PERF_FREQUENCY = 999
+
+
+class ProfileError(Exception):
+    """Raised when a mode cannot be profiled (no profiler, or the run failed)"""
+
+
+def _run(argv, cwd):
+    proc = subprocess.run(argv, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        detail = proc.stderr.decode(errors="replace").strip().splitlines()
+        raise ProfileError(f"{argv[0]} failed: {detail[-1] if detail else proc.returncode}")
+
+
+def profile_python(argv, cwd, collapsed):
+    """Sample a Python run into collapsed stacks (py-spy if available)"""
+    if shutil.which("py-spy"):
+        _run(["py-spy", "record", "--format", "raw", "--output", str(collapsed), "--"] + argv, cwd)
+    else:
+        _run([argv[0], "-m", "harness.pysample", str(collapsed)] + argv[1:], cwd)
+
+
+def collapse_perf_script(text):
+    """
+    Fold `perf script` output into collapsed stacks (as stackcollapse-perf.pl).
+
+    Each sample is a header line ("comm pid ... event:") followed by one
+    "addr symbol+off (dso)" line per frame, innermost first, and a blank line.
+    """
+    counts = collections.Counter()
+    comm = None
+    frames = []
+    for line in text.splitlines() + [""]:
+        if not line.strip():
+            if comm is not None:
+                counts[";".join([comm] + frames[::-1])] += 1
+            comm, frames = None, []
+        elif not line[0].isspace():
+            comm = line.split()[0]
+        else:
+            parts = line.split(None, 1)
+            symbol = parts[1] if len(parts) > 1 else parts[0]
+            symbol = symbol.rsplit(" (", 1)[0].split("+0x")[0]
+            if symbol == "[unknown]" and "(" in line:
+                symbol = f"[{Path(line.rsplit('(', 1)[1].rstrip(')')).name}]"
+            frames.append(symbol.replace(";", ":"))
+    return counts
+
+
+def profile_native(argv, cwd, collapsed):
+    """Sample any other run with perf record -g and fold the result"""
+    if shutil.which("perf") is None:
+        raise ProfileError("perf not installed")
+    with tempfile.TemporaryDirectory() as tmp:
+        data = Path(tmp) / "perf.data"
+        _run(["perf", "record", "-F", str(PERF_FREQUENCY), "-g", "-o", str(data), "--"] + argv, cwd)
+        proc = subprocess.run(["perf", "script", "-i", str(data)], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL)
+        if proc.returncode != 0:
+            raise ProfileError("perf script failed")
+        counts = collapse_perf_script(proc.stdout.decode(errors="replace"))
+    with open(collapsed, "w") as f:
+        for stack, n in sorted(counts.items()):
+            f.write(f"{stack} {n}\n")
+
+
+def read_collapsed(path):
+    """{stack: count} from a collapsed-stack file"""
+    counts = collections.Counter()
+    with open(path) as f:
+        for line in f:
+            stack, _, n = line.rstrip("\n").rpartition(" ")
+            if stack and n.isdigit():
+                counts[stack] += int(n)
+    return counts
+
+
+def _color(name):
+    """Stable warm colour per function name, like flamegraph.pl's default palette"""
+    h = zlib.crc32(name.encode())
+    return f"rgb({205 + h % 50},{(h >> 8) % 180 + 50},{(h >> 16) % 55})"
+
+
+def render_svg(counts, title, width=1200, frame_height=16):
+    """
+    Render collapsed stacks as a standalone SVG flamegraph (root at the bottom).
+
+    Frame widths are proportional to samples; hovering shows the sample count
+    and share of the total.
+    """
+    root = {"children": {}, "value": 0}
+    for stack, n in counts.items():
+        root["value"] += n
+        node = root
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"children": {}, "value": 0})
+            node["value"] += n
+
+    total = root["value"] or 1
+    scale = (width - 20) / total
+    rects = []
+    depth_max = 0
+
+    def walk(node, x, depth):
+        nonlocal depth_max
+        depth_max = max(depth_max, depth)
+        for name, child in sorted(node["children"].items()):
+            w = child["value"] * scale
+            if w >= 0.5:
+                rects.append((name, child["value"], x, depth, w))
+                walk(child, x, depth + 1)
+            x += w
+
+    walk(root, 10.0, 0)
+    height = (depth_max + 1) * frame_height + 60
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'font-family="Verdana" font-size="11">',
+           f'<rect width="100%" height="100%" fill="#f8f8f8"/>',
+           f'<text x="{width / 2}" y="24" text-anchor="middle" font-size="15">'
+           f'{html.escape(title)} ({total} samples)</text>']
+    for name, value, x, depth, w in rects:
+        y = height - 20 - (depth + 1) * frame_height
+        label = html.escape(name)
+        chars = int(w / 7)
+        text = label if len(name) <= chars else (html.escape(name[:chars - 2]) + ".." if chars > 3 else "")
+        out.append(f'<g><title>{label} ({value} samples, {100 * value / total:.2f}%)</title>'
+                   f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{frame_height - 1}" '
+                   f'fill="{_color(name)}" rx="2"/>'
+                   f'<text x="{x + 3:.1f}" y="{y + frame_height - 4}">{text}</text></g>')
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+def profile_job(job, cwd, profiles_dir):
+    """
+    One extra, untimed profiled run of a prepared job.
+
+    Writes <profiles_dir>/bench-NNN/<mode>/stacks.collapsed and
+    flamegraph.svg and returns that directory relative to profiles_dir's
+    parent (the results directory). Raises ProfileError.
+    """
+    python = language_of(job["mode"]) == "python"
+    if not python and shutil.which("perf") is None:
+        raise ProfileError("perf not installed")
+    out_dir = Path(profiles_dir) / f"bench-{job['bench']['number']}" / job["mode"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    collapsed = out_dir / "stacks.collapsed"
+    if python:
+        profile_python(job["argv"], cwd, collapsed)
+    else:
+        profile_native(job["argv"], cwd, collapsed)
+    counts = read_collapsed(collapsed)
+    if not counts:
+        raise ProfileError("no samples collected (run too short?)")
+    title = f"{job['bench']['id']} {job['mode']}"
+    (out_dir / "flamegraph.svg").write_text(render_svg(counts, title))
+    return out_dir.relative_to(Path(profiles_dir).parent)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3):
+        print("usage: python3 -m harness.flamegraph STACKS.collapsed OUT.svg [TITLE]", file=sys.stderr)
+        return 2
+    counts = read_collapsed(argv[0])
+    Path(argv[1]).write_text(render_svg(counts, argv[2] if len(argv) == 3 else argv[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Append-only results history (SQLite) and regression detection across Ruchy versions.
+
+Every sweep appends one row per (benchmark, mode) with its raw samples, keyed
+by Ruchy version and an environment fingerprint, so results are never lost
+when results/bench-NNN-results-full.json is overwritten.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.history import results/bench-*-results-full.json --version 3.172.0
+    python3 -m harness.history versions
+    python3 -m harness.history compare 3.172.0 3.174.0 [--mode ruchy-bytecode] [--bench 011]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+
+from .discovery import BENCH_DIR
+from .samples import elapsed_ms
+from .stats import mann_whitney
+
+DEFAULT_DB = BENCH_DIR / "results" / "history.sqlite"
+
+# A slowdown is flagged when it is both significant and at least this large
+ALPHA = 0.01
+MIN_SLOWDOWN = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    benchmark TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    ruchy_version TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    tool TEXT,
+    mean_ms REAL NOT NULL,
+    median_ms REAL,
+    stddev_ms REAL,
+    peak_kb INTEGER,
+    raw_results TEXT NOT NULL,
+    environment TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_key ON runs (benchmark, mode, ruchy_version, fingerprint);
+CREATE UNIQUE INDEX IF NOT EXISTS runs_once ON runs (benchmark, mode, timestamp, fingerprint);
+"""
+
+
+def fingerprint(environment):
+    """Short hash identifying the machine (CPU, RAM, OS); timestamps excluded"""
+    key = "|".join(str(environment.get(k, "")) for k in ("cpu", "ram", "os"))
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+def normalize_version(version):
+    """"ruchy 3.174.0" -> "3.174.0"; anything without a version number is kept as is"""
+    match = re.search(r"\d+\.\d+\.\d+\S*", version or "")
+    return match.group() if match else (version or "unknown")
+
+
+def connect(db_path=DEFAULT_DB):
+    """Open (creating if needed) the history database"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record(conn, data, version=None, results_dir="."):
+    """
+    Append every mode of one results document (the write_results dict).
+
+    Samples come from the sidecar next to it in results_dir, or from
+    raw_results in older files, which also carry the environment per mode.
+
+    Rows already present (same benchmark, mode, timestamp and machine) are
+    skipped, so re-importing a file is harmless. Returns the rows added.
+    """
+    version = normalize_version(version or data.get("metadata", {}).get("ruchy_version"))
+    added = 0
+    with conn:
+        for mode, entry in data["modes"].items():
+            environment = data.get("environment") or entry.get("environment", {})
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO runs (benchmark, name, mode, ruchy_version, fingerprint,"
+                " timestamp, tool, mean_ms, median_ms, stddev_ms, peak_kb, raw_results,"
+                " environment) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (data["benchmark"], data["name"], mode, version, fingerprint(environment),
+                 environment.get("timestamp", data.get("metadata", {}).get("timestamp", "")),
+                 entry.get("tool"), entry["mean_ms"], entry.get("median_ms"),
+                 entry.get("stddev_ms"), entry.get("memory", {}).get("peak_kb"),
+                 json.dumps(elapsed_ms(entry, results_dir)), json.dumps(environment)))
+            added += cursor.rowcount
+    return added
+
+
+def samples(conn, version, benchmark=None, mode=None):
+    """
+    {(benchmark, mode, fingerprint): [samples pooled over every run]} for one version
+    """
+    query = "SELECT benchmark, mode, fingerprint, raw_results FROM runs WHERE ruchy_version = ?"
+    params = [version]
+    if benchmark:
+        query += " AND benchmark = ?"
+        params.append(benchmark)
+    if mode:
+        query += " AND mode = ?"
+        params.append(mode)
+    pooled = {}
+    for bench, run_mode, fp, raw in conn.execute(query, params):
+        pooled.setdefault((bench, run_mode, fp), []).extend(float(x) for x in json.loads(raw))
+    return pooled
+
+
+def slowdown_p_value(old, new):
+    """One-sided Mann-Whitney U p-value for 'new is slower than old'"""
+    return mann_whitney(new, old, alternative="greater")[1]
+
+
+def compare(conn, old_version, new_version, benchmark=None, mode=None,
+            alpha=ALPHA, min_slowdown=MIN_SLOWDOWN, any_environment=False):
+    """
+    Compare two versions per (benchmark, mode) measured on the same machine.
+
+    Returns a list of dicts sorted by ratio (slowest first): benchmark, mode,
+    old_ms/new_ms (medians), ratio (new/old), p_value and regression (True
+    when p_value < alpha and ratio >= 1 + min_slowdown). With any_environment,
+    samples from different machines are pooled (not recommended).
+    """
+    old = samples(conn, old_version, benchmark, mode)
+    new = samples(conn, new_version, benchmark, mode)
+    if any_environment:
+        old = _merge_environments(old)
+        new = _merge_environments(new)
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        old_samples, new_samples = old[key], new[key]
+        if len(old_samples) < 2 or len(new_samples) < 2:
+            continue
+        old_ms = statistics.median(old_samples)
+        new_ms = statistics.median(new_samples)
+        ratio = new_ms / old_ms if old_ms else float("inf")
+        p_value = slowdown_p_value(old_samples, new_samples)
+        rows.append({
+            "benchmark": key[0],
+            "mode": key[1],
+            "fingerprint": key[2],
+            "old_ms": old_ms,
+            "new_ms": new_ms,
+            "ratio": ratio,
+            "p_value": p_value,
+            "regression": p_value < alpha and ratio >= 1 + min_slowdown,
+        })
+    return sorted(rows, key=lambda r: r["ratio"], reverse=True)
+
+
+def _merge_environments(pooled):
+    merged = {}
+    for (bench, mode, _), values in pooled.items():
+        merged.setdefault((bench, mode, "*"), []).extend(values)
+    return merged
+
+
+def _benchmark_id(number):
+    return number if number.upper().startswith("BENCH-") else f"BENCH-{number}"
+
+
+def cmd_import(conn, args):
+    total = 0
+    for path in args.files:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            added = record(conn, data, args.version, Path(path).parent)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️  Skipping {path}: {e}", file=sys.stderr)
+            continue
+        total += added
+        print(f"  {path}: {added} rows", file=sys.stderr)
+    print(f"✅ Imported {total} rows into {args.db}", file=sys.stderr)
+    return 0
+
+
+def cmd_versions(conn, args):
+    query = ("SELECT ruchy_version, fingerprint, COUNT(*), MIN(timestamp), MAX(timestamp)"
+             " FROM runs GROUP BY ruchy_version, fingerprint ORDER BY MIN(timestamp)")
+    print(f"{'Version':<16} {'Machine':<14} {'Rows':>6}  First / last run")
+    for version, fp, count, first, last in conn.execute(query):
+        print(f"{version:<16} {fp:<14} {count:>6}  {first} / {last}")
+    return 0
+
+
+def cmd_compare(conn, args):
+    old_version = normalize_version(args.old)
+    new_version = normalize_version(args.new)
+    rows = compare(conn, old_version, new_version,
+                   _benchmark_id(args.bench) if args.bench else None, args.mode,
+                   args.alpha, args.min_slowdown, args.any_environment)
+    if not rows:
+        print(f"No (benchmark, mode) pairs measured on the same machine for both "
+              f"{old_version} and {new_version}", file=sys.stderr)
+        return 1
+
+    print(f"{'Benchmark':<10} {'Mode':<18} {old_version:>12} {new_version:>12} "
+          f"{'Change':>8} {'p':>8}")
+    print("-" * 74)
+    for r in rows:
+        flag = "  ❌ REGRESSION" if r["regression"] else ""
+        print(f"{r['benchmark']:<10} {r['mode']:<18} {r['old_ms']:>10.2f}ms {r['new_ms']:>10.2f}ms "
+              f"{(r['ratio'] - 1) * 100:>+7.1f}% {r['p_value']:>8.4f}{flag}")
+
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"\n❌ {len(regressions)} significant slowdown(s) "
+              f"(p < {args.alpha:g}, ≥ {args.min_slowdown * 100:g}% slower)", file=sys.stderr)
+        return 1
+    print(f"\n✅ No significant slowdowns from {old_version} to {new_version}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.history",
+                                     description="Query the benchmark results history")
+    parser.add_argument("--db", default=str(DEFAULT_DB))
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    importer = sub.add_parser("import", help="append results JSON files to the history")
+    importer.add_argument("files", nargs="+")
+    importer.add_argument("--version",
+                          help="Ruchy version to record (default: the file's metadata.ruchy_version)")
+
+    sub.add_parser("versions", help="list recorded Ruchy versions and machines")
+
+    comparer = sub.add_parser("compare", help="flag significant slowdowns between two versions")
+    comparer.add_argument("old")
+    comparer.add_argument("new")
+    comparer.add_argument("--bench", metavar="NNN")
+    comparer.add_argument("--mode")
+    comparer.add_argument("--alpha", type=float, default=ALPHA,
+                          help=f"significance level (default: {ALPHA})")
+    comparer.add_argument("--min-slowdown", type=float, default=MIN_SLOWDOWN,
+                          help=f"smallest slowdown worth flagging, as a fraction "
+                               f"(default: {MIN_SLOWDOWN})")
+    comparer.add_argument("--any-environment", action="store_true",
+                          help="pool samples from different machines")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    try:
+        return {"import": cmd_import, "versions": cmd_versions,
+                "compare": cmd_compare}[args.command](conn, args)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
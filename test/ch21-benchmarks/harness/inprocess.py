@@ -0,0 +1,110 @@
+"""
+In-process kernel timing for the Python baselines
+
+Imports a bench-NNN-*.py module and times only its kernel function with
+perf_counter_ns over many iterations, so CPython startup (what BENCH-012
+measures) is reported separately from compute time.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.inprocess 007 --iterations 50
+    python3 -m harness.inprocess 002 --json
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+
+from .discovery import discover
+from .measure import summarize
+
+# Benchmark -> (kernel function, argument builder, result check).
+# Arguments are built once, outside the timed region.
+KERNELS = {
+    "002": ("matrix_multiply",
+            lambda m: (m.create_test_matrix(100, seed=42), m.create_test_matrix(100, seed=43), 100),
+            lambda r: f"{sum(sum(row) for row in r):.6f}" == "248683.505429"),
+    "005": ("array_sum", lambda m: (1000000,), lambda r: r == 499999500000),
+    "007": ("fibonacci", lambda m: (20,), lambda r: r == 6765),
+    "008": ("generate_primes", lambda m: (10000,), lambda r: r[-1] == 104729),
+    "011": ("nested_loops", lambda m: (1000, 1000), lambda r: r == 249500250000),
+}
+
+KERNEL_WARMUP = 3
+KERNEL_ITERATIONS = 30
+
+
+def load_module(path):
+    """Import a bench-NNN-*.py file (hyphenated names cannot use import)"""
+    name = path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_kernel(number, iterations=KERNEL_ITERATIONS, warmup=KERNEL_WARMUP):
+    """
+    Time one benchmark's kernel in this process.
+
+    Raises ValueError if the benchmark has no registered kernel and
+    AssertionError if the kernel returns a wrong answer.
+    """
+    if number not in KERNELS:
+        raise ValueError(f"BENCH-{number} has no in-process kernel")
+    bench = discover(only={number})[0]
+    module = load_module(bench["sources"]["python"])
+    func_name, build_args, check = KERNELS[number]
+    func = getattr(module, func_name)
+    args = build_args(module)
+
+    result = func(*args)
+    assert check(result), f"BENCH-{number} {func_name} returned a wrong result"
+    for _ in range(warmup):
+        func(*args)
+
+    samples_ns = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func(*args)
+        samples_ns.append(time.perf_counter_ns() - start)
+
+    samples_ms = [ns / 1e6 for ns in samples_ns]
+    stats = {"function": func_name, "iterations": iterations, "warmup": warmup}
+    stats.update(summarize(samples_ms))
+    stats["raw_results"] = [round(x, 4) for x in samples_ms]
+    return stats
+
+
+def kernel_command(number, iterations=KERNEL_ITERATIONS):
+    """argv that runs time_kernel in a fresh interpreter and prints JSON"""
+    return ["python3", "-m", "harness.inprocess", number,
+            "--iterations", str(iterations), "--json"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.inprocess",
+                                     description="Time Python benchmark kernels in-process")
+    parser.add_argument("bench", nargs="+", choices=sorted(KERNELS), metavar="NNN")
+    parser.add_argument("--iterations", type=int, default=KERNEL_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=KERNEL_WARMUP)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {n: time_kernel(n, args.iterations, args.warmup) for n in args.bench}
+    if args.json:
+        json.dump(results, sys.stdout)
+        print()
+        return 0
+
+    print(f"{'Benchmark':<10} {'Kernel':<18} {'Mean (ms)':>10} {'Median (ms)':>12} {'StdDev (ms)':>12}")
+    print("-" * 66)
+    for number, stats in results.items():
+        print(f"BENCH-{number:<4} {stats['function']:<18} {stats['mean_ms']:>10.2f} "
+              f"{stats['median_ms']:>12.2f} {stats['stddev_ms']:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+// Minimal fork/exec/wait4 launcher for the ch21 benchmark harness.
+//
+// A process exec'd directly from Python inherits Python's RSS high-water
+// mark in ru_maxrss, so every mode would report at least the harness's own
+// ~16MB. Forking from this tiny process keeps the floor at ~1MB.
+//
+// Usage: launcher FD CMD [ARGS...]
+// Writes one line to FD once CMD exits:
+//   elapsed_ns maxrss_kb utime_us stime_us exit_code cpu
+
+#define _GNU_SOURCE
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/resource.h>
+#include <sys/wait.h>
+#include <time.h>
+#include <unistd.h>
+
+// CPU the (exited, not yet reaped) child last ran on: field 39 of /proc/PID/stat
+static int last_cpu(pid_t pid) {
+    char path[64];
+    char buf[4096];
+    snprintf(path, sizeof path, "/proc/%d/stat", (int)pid);
+    FILE *f = fopen(path, "r");
+    if (!f) {
+        return -1;
+    }
+    size_t n = fread(buf, 1, sizeof buf - 1, f);
+    fclose(f);
+    buf[n] = '\0';
+    // Skip past the parenthesised comm, which may contain spaces
+    char *p = strrchr(buf, ')');
+    if (!p) {
+        return -1;
+    }
+    int field = 2;
+    for (p++; *p && field < 39; p++) {
+        if (*p == ' ') {
+            field++;
+        }
+    }
+    return field == 39 ? atoi(p) : -1;
+}
+
+int main(int argc, char **argv) {
+    if (argc < 3) {
+        fprintf(stderr, "usage: launcher FD CMD [ARGS...]\n");
+        return 2;
+    }
+    int out = atoi(argv[1]);
+    fcntl(out, F_SETFD, FD_CLOEXEC);
+
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    pid_t pid = fork();
+    if (pid < 0) {
+        perror("fork");
+        return 2;
+    }
+    if (pid == 0) {
+        execvp(argv[2], argv + 2);
+        _exit(127);
+    }
+
+    // Stop the clock at exit, before reaping, so /proc/PID/stat is still readable
+    siginfo_t info;
+    waitid(P_PID, pid, &info, WEXITED | WNOWAIT);
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    int cpu = last_cpu(pid);
+
+    int status;
+    struct rusage ru;
+    wait4(pid, &status, 0, &ru);
+    int code = WIFEXITED(status) ? WEXITSTATUS(status) : 128 + WTERMSIG(status);
+
+    long long elapsed_ns = (long long)(end.tv_sec - start.tv_sec) * 1000000000LL
+                         + (end.tv_nsec - start.tv_nsec);
+    long long utime_us = (long long)ru.ru_utime.tv_sec * 1000000LL + ru.ru_utime.tv_usec;
+    long long stime_us = (long long)ru.ru_stime.tv_sec * 1000000LL + ru.ru_stime.tv_usec;
+    dprintf(out, "%lld %ld %lld %lld %d %d\n",
+            elapsed_ns, ru.ru_maxrss, utime_us, stime_us, code, cpu);
+    return 0;
+}
@@ -0,0 +1,33 @@
+"""Build the fork/exec/wait4 launcher (launcher.c) used for honest ru_maxrss"""
+
+import hashlib
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+LAUNCHER_SOURCE = Path(__file__).resolve().parent / "launcher.c"
+
+
+def build_launcher(temp_dir):
+    """
+    Compile launcher.c into temp_dir once per source version.
+
+    Returns the binary path, or None (with a warning) when gcc is missing or
+    the build fails; runs then spawn directly from Python and their peak RSS
+    includes the harness's own high-water mark.
+    """
+    digest = hashlib.sha256(LAUNCHER_SOURCE.read_bytes()).hexdigest()[:12]
+    binary = Path(temp_dir) / f"launcher-{digest}"
+    if binary.exists():
+        return binary
+    if shutil.which("gcc") is None:
+        print("  ⚠️  gcc not found: peak RSS will include the harness's own RSS", file=sys.stderr)
+        return None
+    proc = subprocess.run(["gcc", "-O2", str(LAUNCHER_SOURCE), "-o", str(binary)],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        print("  ⚠️  launcher build failed: peak RSS will include the harness's own RSS",
+              file=sys.stderr)
+        return None
+    return binary
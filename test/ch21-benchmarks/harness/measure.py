@@ -0,0 +1,341 @@
+"""In-process timing of benchmark runs (replaces bashrs bench + python3 -c parsing)"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .counters import CountersUnavailable, measure_counters
+from .flamegraph import ProfileError, profile_job
+from .samples import columns
+
+# Benchmarks whose Python script reports in-process stats under --stats as a
+# "BENCH_STATS {json}" line on stderr
+SCRIPT_STATS = {"004"}
+STATS_PREFIX = "BENCH_STATS "
+
+
+def _last_cpu(pid):
+    """CPU the (exited, not yet reaped) process last ran on, from /proc/<pid>/stat"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # Field 39 "processor"; split after the parenthesised comm, which may contain spaces
+    fields = stat.rsplit(")", 1)[1].split()
+    return int(fields[36])
+
+
+def _spawn_direct(argv, cwd, env=None):
+    """
+    Fallback when no launcher is available: spawn from this process.
+
+    The child is first waited for without being reaped (WNOWAIT) so
+    /proc/<pid>/stat can still be read, then reaped with wait4. Its
+    ru_maxrss includes this interpreter's RSS (inherited at exec).
+    """
+    start = time.perf_counter_ns()
+    proc = subprocess.Popen(argv, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+    elapsed_ns = time.perf_counter_ns() - start
+    cpu = _last_cpu(proc.pid)
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return elapsed_ns, rusage.ru_maxrss, int(rusage.ru_utime * 1e6), \
+        int(rusage.ru_stime * 1e6), proc.returncode, cpu
+
+
+def _spawn_launcher(argv, cwd, launcher, env=None):
+    """Spawn through the C launcher, which times, reaps and reports the run"""
+    read_fd, write_fd = os.pipe()
+    try:
+        proc = subprocess.Popen([str(launcher), str(write_fd)] + argv, cwd=cwd, env=env,
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, pass_fds=(write_fd,))
+        os.close(write_fd)
+        write_fd = None
+        with os.fdopen(read_fd, "rb") as report:
+            read_fd = None
+            line = report.read()
+        proc.wait()
+    finally:
+        for fd in (read_fd, write_fd):
+            if fd is not None:
+                os.close(fd)
+    if proc.returncode != 0 or not line:
+        raise RuntimeError(f"launcher failed (status {proc.returncode})")
+    elapsed_ns, maxrss_kb, utime_us, stime_us, code, cpu = (int(x) for x in line.split())
+    return elapsed_ns, maxrss_kb, utime_us, stime_us, code, (cpu if cpu >= 0 else None)
+
+
+def run_once(argv, cwd, launcher=None, env=None):
+    """
+    Execute argv once with output discarded.
+
+    Returns a sample dict: elapsed_ns (monotonic clock) and elapsed_ms,
+    maxrss_kb (the run's peak RSS, as VmHWM), user_ns/sys_ns CPU time (rusage
+    has microsecond resolution) and user_ms/sys_ms, exit_code and cpu (the
+    core the process finished on). With a launcher (see harness.launcher) the peak
+    RSS is the benchmark's own rather than floored at the harness's. env
+    replaces the inherited environment (e.g. to set BENCH_SIZE).
+    """
+    if launcher:
+        result = _spawn_launcher(argv, cwd, launcher, env)
+    else:
+        result = _spawn_direct(argv, cwd, env)
+    elapsed_ns, maxrss_kb, utime_us, stime_us, code, cpu = result
+    return {
+        "elapsed_ns": elapsed_ns,
+        "elapsed_ms": elapsed_ns / 1e6,
+        "maxrss_kb": maxrss_kb,
+        "user_ns": utime_us * 1000,
+        "sys_ns": stime_us * 1000,
+        "user_ms": utime_us / 1e3,
+        "sys_ms": stime_us / 1e3,
+        "exit_code": code,
+        "cpu": cpu,
+    }
+
+
+def summarize(samples_ms):
+    """Summary statistics in the shape of results/bench-NNN-results-full.json"""
+    return {
+        "mean_ms": round(statistics.fmean(samples_ms), 4),
+        "median_ms": round(statistics.median(samples_ms), 4),
+        "stddev_ms": round(statistics.stdev(samples_ms), 4) if len(samples_ms) > 1 else 0.0,
+        "min_ms": round(min(samples_ms), 4),
+        "max_ms": round(max(samples_ms), 4),
+    }
+
+
+def _run_checked(argv, cwd, launcher, phase="", env=None):
+    sample = run_once(argv, cwd, launcher, env)
+    if sample["exit_code"] != 0:
+        raise RuntimeError(f"exit status {sample['exit_code']}{phase}")
+    return sample
+
+
+def _sample_stats(samples, launcher):
+    """
+    Summary plus raw_results at full (ns) precision; the per-sample columns
+    go under "samples" and are moved to the binary sidecar by write_results,
+    which keeps raw_results out of the JSON.
+    """
+    samples_ms = [s["elapsed_ms"] for s in samples]
+    stats = summarize(samples_ms)
+    stats["raw_results"] = [s["elapsed_ns"] / 1e6 for s in samples]
+    stats["memory"] = summarize_memory([s["maxrss_kb"] for s in samples],
+                                       "launcher wait4" if launcher else "wait4 (includes harness RSS)")
+    stats["samples"] = columns(samples)
+    return stats
+
+
+def measure(argv, cwd, warmup, iterations, launcher=None, env=None):
+    """
+    Run warmup iterations (discarded) then measured iterations.
+
+    Raises RuntimeError if any run exits non-zero, so a crashing mode is
+    reported instead of being timed as a fast one.
+    """
+    for _ in range(warmup):
+        _run_checked(argv, cwd, launcher, " during warmup", env)
+    samples = [_run_checked(argv, cwd, launcher, env=env) for _ in range(iterations)]
+    return _sample_stats(samples, launcher)
+
+
+# Two-sided 95% Student t quantiles for 1..30 degrees of freedom (1.96 beyond)
+T95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+       2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+       2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+# Defaults for adaptive sampling (harness --adaptive)
+ADAPTIVE = {
+    "target_ci": 0.02,        # stop once the 95% CI half-width is within 2% of the mean
+    "budget_s": 30.0,         # wall-clock budget per mode, warmup included
+    "min_iterations": 5,
+    "max_iterations": 1000,
+    "max_warmup": 10,
+    "steady_window": 3,       # warmup ends when this many runs agree...
+    "steady_tolerance": 0.10, # ...to within 10% of their median
+}
+
+
+def relative_ci(samples_ms):
+    """Half-width of the 95% confidence interval of the mean, relative to the mean"""
+    n = len(samples_ms)
+    if n < 2:
+        return float("inf")
+    t = T95[n - 2] if n - 2 < len(T95) else 1.96
+    return t * statistics.stdev(samples_ms) / n ** 0.5 / statistics.fmean(samples_ms)
+
+
+def _steady(times_ms, window, tolerance):
+    if len(times_ms) < window:
+        return False
+    recent = times_ms[-window:]
+    return (max(recent) - min(recent)) <= tolerance * statistics.median(recent)
+
+
+def measure_adaptive(argv, cwd, launcher=None, policy=None, env=None):
+    """
+    Sample until the mean is known precisely enough or the time budget runs out.
+
+    Warmup runs (discarded) continue until the last steady_window runs agree
+    within steady_tolerance, max_warmup is reached, or a quarter of the budget
+    is used. Measured runs continue until the relative 95% CI half-width is at
+    most target_ci (after min_iterations), the next run would overrun the
+    budget, or max_iterations is reached. Slow modes therefore stop after a
+    few runs and fast ones collect many. The outcome is recorded in
+    stats["sampling"].
+    """
+    policy = dict(ADAPTIVE, **(policy or {}))
+    started = time.perf_counter()
+    budget = policy["budget_s"]
+
+    warmup_ms = []
+    warmup_reason = "max warmup"
+    while len(warmup_ms) < policy["max_warmup"]:
+        warmup_ms.append(_run_checked(argv, cwd, launcher, " during warmup", env)["elapsed_ms"])
+        if _steady(warmup_ms, policy["steady_window"], policy["steady_tolerance"]):
+            warmup_reason = "steady state"
+            break
+        if time.perf_counter() - started >= budget / 4:
+            warmup_reason = "time budget"
+            break
+
+    samples = []
+    while True:
+        samples.append(_run_checked(argv, cwd, launcher, env=env))
+        samples_ms = [s["elapsed_ms"] for s in samples]
+        n = len(samples)
+        ci = relative_ci(samples_ms)
+        if n >= policy["min_iterations"] and ci <= policy["target_ci"]:
+            reason = "converged"
+            break
+        if n >= policy["max_iterations"]:
+            reason = "max iterations"
+            break
+        spent = time.perf_counter() - started
+        if n >= 2 and spent + statistics.fmean(samples_ms) / 1000 > budget:
+            reason = "time budget"
+            break
+
+    stats = _sample_stats(samples, launcher)
+    stats["warmup"] = len(warmup_ms)
+    stats["iterations"] = len(samples)
+    stats["sampling"] = {
+        "adaptive": True,
+        "stop_reason": reason,
+        "warmup_reason": warmup_reason,
+        "relative_ci": round(ci, 4),
+        "target_ci": policy["target_ci"],
+        "budget_s": budget,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+    }
+    return stats
+
+
+def summarize_memory(rss_kb, source="wait4"):
+    """
+    Peak-RSS summary from each iteration's wait4 ru_maxrss (the kernel's
+    high-water mark for the process, same as VmHWM in /proc/<pid>/status).
+    Per-run values are kept in the samples sidecar (maxrss_kb column).
+    """
+    peak_kb = max(rss_kb)
+    mean_kb = int(statistics.fmean(rss_kb))
+    return {
+        "peak_kb": peak_kb,
+        "mean_kb": mean_kb,
+        "peak_mb": round(peak_kb / 1024, 2),
+        "mean_mb": round(mean_kb / 1024, 2),
+        "source": source,
+    }
+
+
+def measure_kernel(command, cwd):
+    """Run an in-process kernel timer (see harness.inprocess) and return its stats"""
+    proc = subprocess.run(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        detail = proc.stderr.decode(errors="replace").strip().splitlines()
+        raise RuntimeError(f"kernel timing failed: {detail[-1] if detail else proc.returncode}")
+    return next(iter(json.loads(proc.stdout).values()))
+
+
+def measure_tracemalloc(argv, cwd):
+    """
+    One extra, untimed run of a Python job under tracemalloc (harness.tracemem).
+
+    Returns {"peak_kb", "final_kb", "allocated_blocks"}.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".json") as out:
+        command = [argv[0], "-m", "harness.tracemem", out.name] + argv[1:]
+        proc = subprocess.run(command, cwd=cwd, stdin=subprocess.DEVNULL,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if proc.returncode != 0:
+            detail = proc.stderr.decode(errors="replace").strip().splitlines()
+            raise RuntimeError(f"tracemalloc run failed: {detail[-1] if detail else proc.returncode}")
+        return json.load(out)
+
+
+def measure_script_stats(argv, cwd):
+    """
+    One extra, untimed run of a Python job with --stats.
+
+    Returns the JSON object of the "BENCH_STATS {...}" line the script writes
+    to stderr (e.g. BENCH-004's GC time and share of the run).
+    """
+    proc = subprocess.run(argv + ["--stats"], cwd=cwd, stdin=subprocess.DEVNULL,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    lines = proc.stderr.decode(errors="replace").splitlines()
+    if proc.returncode != 0:
+        raise RuntimeError(f"--stats run failed: {lines[-1] if lines else proc.returncode}")
+    for line in lines:
+        if line.startswith(STATS_PREFIX):
+            return json.loads(line[len(STATS_PREFIX):])
+    raise RuntimeError(f"--stats run printed no {STATS_PREFIX.strip()} line")
+
+
+def measure_job(job, cwd, warmup, iterations):
+    """
+    Measure one prepared job: whole-process timing, plus kernel-only timing
+    when the job carries a kernel_command. Both are kept so that speedups
+    can separate interpreter startup from compute. Jobs flagged with
+    tracemalloc get one more untimed run for Python allocation stats; jobs
+    with an adaptive policy ignore warmup/iterations (see measure_adaptive).
+    Compiled modes carry their build info (compile time, cache hit); jobs
+    with counters = N get N untimed perf_event_open runs (harness.counters);
+    jobs with a profiles_dir get one untimed profiled run (harness.flamegraph);
+    jobs with script_stats get one untimed --stats run (measure_script_stats).
+    """
+    if job.get("adaptive") is not None:
+        stats = measure_adaptive(job["argv"], cwd, job.get("launcher"), job["adaptive"])
+    else:
+        stats = measure(job["argv"], cwd, warmup, iterations, job.get("launcher"))
+    if job.get("build"):
+        stats["build"] = job["build"]
+    if job.get("counters"):
+        try:
+            stats["counters"] = measure_counters(job["argv"], cwd, job["counters"])
+        except CountersUnavailable as e:
+            print(f"  ⚠️  {e}: no counters recorded", file=sys.stderr)
+    if job.get("profiles_dir"):
+        try:
+            stats["profile"] = str(profile_job(job, cwd, job["profiles_dir"]))
+        except ProfileError as e:
+            print(f"  ⚠️  {job['mode']}: not profiled: {e}", file=sys.stderr)
+    if job.get("tracemalloc"):
+        stats["memory"]["tracemalloc"] = measure_tracemalloc(job["argv"], cwd)
+    if job.get("script_stats"):
+        stats["script_stats"] = measure_script_stats(job["argv"], cwd)
+    if job.get("kernel_command"):
+        kernel = measure_kernel(job["kernel_command"], cwd)
+        stats["process_mean_ms"] = stats["mean_ms"]
+        stats["kernel_mean_ms"] = kernel["mean_ms"]
+        stats["startup_ms"] = round(max(stats["mean_ms"] - kernel["mean_ms"], 0.0), 2)
+        stats["kernel"] = kernel
+    return stats
@@ -0,0 +1,196 @@
+"""Execution modes: how each mode is compiled (once) and launched (per run)"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+
+# Result key -> (source language, required executables), in report order
+MODES = {
+    "python": ("python", ["python3"]),
+    "deno": ("deno", ["deno"]),
+    "julia": ("julia", ["julia"]),
+    "go": ("go", ["go"]),
+    "rust": ("rust", ["rustc"]),
+    "c": ("c", ["gcc"]),
+    "ruchy-ast": ("ruchy", ["ruchy"]),
+    "ruchy-bytecode": ("ruchy", ["ruchy"]),
+    "ruchy-transpiled": ("ruchy", ["ruchy", "rustc"]),
+    "ruchy-compiled": ("ruchy", ["ruchy"]),
+}
+
+# Benchmarks whose Deno port reads an input file; read access is granted to
+# the input directories only
+DENO_READS_INPUT = {"006", "009"}
+DENO_INPUT_DIRS = "testdata,test-data"
+
+VARIANT_PREFIX = "python-"
+
+
+def python_variant(mode):
+    """Variant name for a "python-NAME" mode, or None for the standard modes"""
+    if mode not in MODES and mode.startswith(VARIANT_PREFIX):
+        return mode[len(VARIANT_PREFIX):]
+    return None
+
+
+def language_of(mode):
+    """Source language a mode runs (Python variants run the .py baseline)"""
+    return "python" if python_variant(mode) else MODES[mode][0]
+
+
+class BuildError(Exception):
+    """Raised when a mode cannot be prepared (missing tool or failed compile)"""
+
+
+def missing_tools(mode):
+    """Return the executables a mode needs that are not on PATH"""
+    tools = ["python3"] if python_variant(mode) else MODES[mode][1]
+    return [tool for tool in tools if shutil.which(tool) is None]
+
+
+def _compile(argv, stdout=None):
+    """Run one compile command, raising BuildError with its stderr on failure"""
+    if stdout is None:
+        proc = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    else:
+        with open(stdout, "wb") as out:
+            proc = subprocess.run(argv, stdout=out, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        detail = proc.stderr.decode(errors="replace").strip().splitlines()
+        raise BuildError(f"{' '.join(argv[:2])} failed: {detail[-1] if detail else proc.returncode}")
+
+
+# Compiled modes: build steps as (argv template, stdout file or None).
+# {src} is the benchmark source, {out} the binary, {rs} an intermediate .rs file.
+BUILD_STEPS = {
+    "go": [(["go", "build", "-o", "{out}", "{src}"], None)],
+    "rust": [(["rustc", "-O", "{src}", "-o", "{out}"], None)],
+    "c": [(["gcc", "-O3", "{src}", "-o", "{out}", "-lm"], None)],
+    "ruchy-transpiled": [(["ruchy", "transpile", "{src}"], "{rs}"),
+                         (["rustc", "-O", "{rs}", "-o", "{out}"], None)],
+    "ruchy-compiled": [(["ruchy", "compile", "{src}", "-o", "{out}"], None)],
+}
+
+VERSION_COMMANDS = {
+    "go": ["go", "version"],
+    "rustc": ["rustc", "--version"],
+    "gcc": ["gcc", "--version"],
+    "ruchy": ["ruchy", "--version"],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_version(tool):
+    """First line of the tool's version output (cached for the sweep)"""
+    try:
+        proc = subprocess.run(VERSION_COMMANDS[tool], stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    lines = proc.stdout.decode(errors="replace").splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def build_key(mode, source):
+    """
+    Content address of a build: hash of the source bytes, the version of
+    every compiler in the chain and the exact build commands (flags).
+    """
+    steps = BUILD_STEPS[mode]
+    tools = sorted({argv[0] for argv, _ in steps})
+    key = {
+        "mode": mode,
+        "source": hashlib.sha256(source.read_bytes()).hexdigest(),
+        "compilers": {tool: compiler_version(tool) for tool in tools},
+        "steps": steps,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:20]
+
+
+def _run_steps(mode, source, binary):
+    """Run the build steps for mode; returns the wall-clock compile time in ms"""
+    rust_file = binary + ".rs"
+    fill = {"src": str(source), "out": binary, "rs": rust_file}
+    started = time.perf_counter()
+    try:
+        for argv, stdout in BUILD_STEPS[mode]:
+            _compile([arg.format(**fill) for arg in argv],
+                     stdout.format(**fill) if stdout else None)
+    finally:
+        if os.path.exists(rust_file):
+            os.remove(rust_file)
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def build(mode, source, cache_dir, rebuild=False):
+    """
+    Return (binary, build_info) for a compiled mode, using the build cache.
+
+    Binaries live in cache_dir under their build key, next to a .json
+    holding the compile time measured when they were built, so unchanged
+    sources are never recompiled across sweeps. build_info is
+    {"compile_ms", "cached", "key"}; compile_ms is the original build's
+    time even on a cache hit.
+    """
+    key = build_key(mode, source)
+    binary = cache_dir / f"{mode}-{key}"
+    meta = binary.with_name(binary.name + ".json")
+    if not rebuild and binary.exists() and meta.exists():
+        with open(meta) as f:
+            return str(binary), dict(json.load(f), cached=True)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = f"{binary}.{os.getpid()}.tmp"
+    try:
+        compile_ms = _run_steps(mode, source, staging)
+        os.replace(staging, binary)
+    finally:
+        if os.path.exists(staging):
+            os.remove(staging)
+    info = {"compile_ms": compile_ms, "key": key}
+    with open(meta, "w") as f:
+        json.dump(info, f)
+    return str(binary), dict(info, cached=False)
+
+
+def prepare(mode, source, temp_dir, tag, cache_dir=None, rebuild=False):
+    """
+    Compile source ONCE for mode (not timed) and return the argv for each run.
+
+    Returns (argv, artifacts, build_info): artifacts are temp files to remove
+    later; build_info is None for interpreted modes. With cache_dir, compiled
+    modes reuse binaries from the content-addressed build cache (see build).
+    """
+    missing = missing_tools(mode)
+    if missing:
+        raise BuildError(f"not installed: {', '.join(missing)}")
+
+    if mode in BUILD_STEPS:
+        if cache_dir is not None:
+            binary, info = build(mode, source, cache_dir, rebuild)
+            return [binary], [], info
+        binary = str(temp_dir / f"{mode}-{tag}")
+        compile_ms = _run_steps(mode, source, binary)
+        return [binary], [binary], {"compile_ms": compile_ms, "cached": False}
+
+    source = str(source)
+    if mode == "python":
+        return ["python3", source], [], None
+    if python_variant(mode):
+        return ["python3", source, "--variant", python_variant(mode)], [], None
+    if mode == "deno":
+        argv = ["deno", "run", "--allow-env=BENCH_SIZE", source]
+        if os.path.basename(source).split("-")[1] in DENO_READS_INPUT:
+            argv.insert(2, f"--allow-read={DENO_INPUT_DIRS}")
+        return argv, [], None
+    if mode == "julia":
+        return ["julia", source], [], None
+    if mode == "ruchy-ast":
+        return ["ruchy", "run", source], [], None
+    if mode == "ruchy-bytecode":
+        return ["ruchy", "--vm-mode", "bytecode", "run", source], [], None
+    raise BuildError(f"Unknown mode: {mode}")
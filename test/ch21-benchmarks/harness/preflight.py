@@ -0,0 +1,251 @@
+"""
+Pre-flight noise checks and the environment fingerprint stored with results
+
+Reads the conditions that make timings irreproducible from /sys and /proc:
+CPU frequency governor, turbo/boost, ASLR, background load, SMT and thermal
+throttling. Each check is {"value", "status", "detail"} with status "ok",
+"warn" (the condition adds noise) or "unknown" (not readable here, e.g. no
+cpufreq inside a VM). The report goes into every result's environment under
+"preflight"; runner.run_sweep adds an "after" snapshot so throttling or load
+that appeared during the sweep is recorded too.
+
+--pin moves the harness (and so every benchmark process it starts) onto one
+core: an isolcpus core if there is one, else one whose SMT siblings are idle
+and which does not host CPU 0. --no-aslr turns off address space
+randomization for the benchmark processes (personality ADDR_NO_RANDOMIZE).
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.preflight
+    python3 -m harness.preflight --json
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from .scheduler import isolated_cores, siblings
+
+CPU_DIR = "/sys/devices/system/cpu"
+
+# 1-minute load average per usable CPU above which the machine counts as busy
+MAX_LOAD = 0.25
+
+# Thermal zone temperature (°C) at which throttling is likely
+THERMAL_WARN_C = 85.0
+
+ADDR_NO_RANDOMIZE = 0x0040000
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _cpu_list(text):
+    """CPUs in a kernel cpu list such as "0-3,8" (empty for "" or None)"""
+    cpus = set()
+    for part in (text or "").split(","):
+        if part:
+            lo, _, hi = part.partition("-")
+            cpus.update(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+
+def _check(value, status, detail=""):
+    return {"value": value, "status": status, "detail": detail}
+
+
+def check_governor(cpus):
+    governors = {}
+    for cpu in sorted(cpus):
+        governor = _read(f"{CPU_DIR}/cpu{cpu}/cpufreq/scaling_governor")
+        if governor:
+            governors.setdefault(governor, []).append(cpu)
+    if not governors:
+        return _check(None, "unknown", "no cpufreq in /sys")
+    if set(governors) == {"performance"}:
+        return _check(governors, "ok")
+    return _check(governors, "warn", "frequency scales with load; set the performance governor")
+
+
+def check_boost():
+    no_turbo = _read(f"{CPU_DIR}/intel_pstate/no_turbo")
+    if no_turbo is not None:
+        enabled = no_turbo == "0"
+    else:
+        boost = _read(f"{CPU_DIR}/cpufreq/boost")
+        if boost is None:
+            return _check(None, "unknown", "no intel_pstate/no_turbo or cpufreq/boost")
+        enabled = boost == "1"
+    if enabled:
+        return _check("enabled", "warn", "clock depends on temperature and active cores")
+    return _check("disabled", "ok")
+
+
+def check_aslr(disabled_for_children=False):
+    value = _read("/proc/sys/kernel/randomize_va_space")
+    if disabled_for_children:
+        return _check(value, "ok", "disabled for benchmark processes by --no-aslr")
+    if value is None:
+        return _check(None, "unknown", "cannot read /proc/sys/kernel/randomize_va_space")
+    if value == "0":
+        return _check(value, "ok")
+    return _check(value, "warn", "memory layout changes between runs; use --no-aslr")
+
+
+def check_load(cpus, max_load=MAX_LOAD):
+    fields = (_read("/proc/loadavg") or "").split()
+    if len(fields) < 4:
+        return _check(None, "unknown", "cannot read /proc/loadavg")
+    running, total = (int(x) for x in fields[3].split("/"))
+    value = {"load1": float(fields[0]), "load5": float(fields[1]), "load15": float(fields[2]),
+             "running": running - 1, "tasks": total, "cpus": len(cpus)}
+    per_cpu = value["load1"] / max(len(cpus), 1)
+    if per_cpu > max_load:
+        return _check(value, "warn", f"load {per_cpu:.2f} per CPU exceeds {max_load:g}")
+    return _check(value, "ok")
+
+
+def check_smt(cpus):
+    """
+    Warn when the benchmark processes may land on two SMT siblings at once.
+
+    A single usable CPU (e.g. after --pin) is fine even on an SMT host: its
+    siblings are reported in "idle_siblings", but only other processes can
+    run there.
+    """
+    active = _read(f"{CPU_DIR}/smt/active")
+    shared = sorted(cpu for cpu in cpus if len(siblings(cpu)) > 1)
+    value = {"active": active == "1" if active is not None else None, "cpus_with_siblings": shared}
+    if len(cpus) == 1:
+        value["idle_siblings"] = sorted(set.union(*(siblings(cpu) for cpu in cpus)) - cpus)
+        return _check(value, "ok", "single CPU: benchmarks never share a core with each other")
+    if active is None and not shared:
+        return _check(value, "unknown", "no smt/active in /sys")
+    if shared:
+        return _check(value, "warn", "SMT siblings share execution units; use --pin")
+    return _check(value, "ok")
+
+
+def throttle_count():
+    """Sum of the kernel's core and package thermal throttle counters, or None"""
+    counts = [int(v) for path in glob.glob(f"{CPU_DIR}/cpu*/thermal_throttle/*_throttle_count")
+              for v in [_read(path)] if v and v.isdigit()]
+    return sum(counts) if counts else None
+
+
+def max_temperature():
+    """Hottest thermal zone in °C, or None"""
+    temps = [int(v) / 1000 for path in glob.glob("/sys/class/thermal/thermal_zone*/temp")
+             for v in [_read(path)] if v and v.lstrip("-").isdigit()]
+    return max(temps) if temps else None
+
+
+def check_thermal():
+    value = {"throttle_count": throttle_count(), "max_temp_c": max_temperature()}
+    if value["throttle_count"] is None and value["max_temp_c"] is None:
+        return _check(value, "unknown", "no thermal_throttle counters or thermal zones")
+    if value["max_temp_c"] is not None and value["max_temp_c"] >= THERMAL_WARN_C:
+        return _check(value, "warn", f"{value['max_temp_c']:.0f}°C: close to throttling")
+    return _check(value, "ok")
+
+
+def inspect(max_load=MAX_LOAD, aslr_disabled=False):
+    """Run every check for the CPUs this process may use"""
+    cpus = set(os.sched_getaffinity(0))
+    checks = {
+        "governor": check_governor(cpus),
+        "boost": check_boost(),
+        "aslr": check_aslr(aslr_disabled),
+        "load": check_load(cpus, max_load),
+        "smt": check_smt(cpus),
+        "thermal": check_thermal(),
+    }
+    return {
+        "checks": checks,
+        "affinity": sorted(cpus),
+        "isolated_cpus": sorted(_cpu_list(_read(f"{CPU_DIR}/isolated"))),
+        "noisy": [name for name, c in checks.items() if c["status"] == "warn"],
+    }
+
+
+def after_run(report):
+    """
+    Add an "after" snapshot to a report once timing is done.
+
+    Throttle events during the sweep mark it noisy even if pre-flight was clean.
+    """
+    fields = (_read("/proc/loadavg") or "").split()
+    before = report["checks"]["thermal"]["value"]["throttle_count"]
+    now = throttle_count()
+    events = now - before if now is not None and before is not None else None
+    report["after"] = {
+        "load1": float(fields[0]) if fields else None,
+        "throttle_events": events,
+        "max_temp_c": max_temperature(),
+    }
+    if events and "thermal" not in report["noisy"]:
+        report["noisy"].append("thermal")
+    return report
+
+
+def pin(cpu=None):
+    """
+    Restrict this process (and its children) to one CPU; returns it.
+
+    Without a cpu, prefers an isolcpus core, then the first core isolated_cores
+    picks (SMT siblings idle, away from CPU 0).
+    """
+    if cpu is None:
+        allowed = set(os.sched_getaffinity(0))
+        isolated = sorted(_cpu_list(_read(f"{CPU_DIR}/isolated")) & allowed)
+        cpu = isolated[0] if isolated else isolated_cores()[0]
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+def disable_aslr():
+    """Set ADDR_NO_RANDOMIZE for processes started from now on; False if refused"""
+    import ctypes
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        current = libc.personality(0xFFFFFFFF)
+    except (OSError, AttributeError):
+        return False
+    return current != -1 and libc.personality(current | ADDR_NO_RANDOMIZE) != -1
+
+
+def print_report(report, file=sys.stderr):
+    marks = {"ok": "✅", "warn": "⚠️ ", "unknown": "- "}
+    for name, check in report["checks"].items():
+        value = check["value"]
+        if isinstance(value, dict):
+            value = ", ".join(f"{k}={v}" for k, v in value.items())
+        detail = f" ({check['detail']})" if check["detail"] else ""
+        print(f"  {marks[check['status']]} {name:<9} {value if value is not None else 'n/a'}{detail}",
+              file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.preflight",
+                                     description="Check the machine for timing noise")
+    parser.add_argument("--max-load", type=float, default=MAX_LOAD,
+                        help=f"1-minute load per CPU counted as busy (default: {MAX_LOAD:g})")
+    parser.add_argument("--json", action="store_true", help="print the fingerprint as JSON")
+    args = parser.parse_args(argv)
+
+    report = inspect(args.max_load)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, sys.stdout)
+    return 1 if report["noisy"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
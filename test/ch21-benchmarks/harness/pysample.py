@@ -0,0 +1,53 @@
+"""
+Sampling profiler for a Python benchmark, writing collapsed stacks
+
+A CPU-time interval timer (ITIMER_PROF) interrupts the script every
+INTERVAL seconds and the handler records the current Python stack, in the
+"frame;frame;frame count" format flamegraph tools read. Used by
+harness.flamegraph when py-spy is not installed:
+    python3 -m harness.pysample OUT.collapsed bench-008-primes.py [args...]
+"""
+
+import collections
+import os
+import runpy
+import signal
+import sys
+
+INTERVAL = 0.001
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("usage: python3 -m harness.pysample OUT.collapsed SCRIPT [ARGS...]", file=sys.stderr)
+        return 2
+    out_path, script = argv[0], argv[1]
+    script_path = os.path.abspath(script)
+    counts = collections.Counter()
+
+    def sample(signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            if code.co_filename == script_path and code.co_name == "<module>":
+                break
+            frame = frame.f_back
+        counts[";".join(reversed(stack))] += 1
+
+    sys.argv = argv[1:]
+    signal.signal(signal.SIGPROF, sample)
+    signal.setitimer(signal.ITIMER_PROF, INTERVAL, INTERVAL)
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        with open(out_path, "w") as f:
+            for stack, n in sorted(counts.items()):
+                f.write(f"{stack} {n}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
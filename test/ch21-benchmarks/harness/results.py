@@ -0,0 +1,117 @@
+"""Environment capture and results/bench-NNN-results-full.json output"""
+
+import json
+import platform
+import subprocess
+from datetime import datetime
+
+from . import TOOL
+from . import preflight as noise
+from .samples import write_sidecar
+
+
+def _cpu_model():
+    """CPU model name from /proc/cpuinfo (same value lscpu reports)"""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or "unknown"
+
+
+def _total_ram():
+    """Total RAM in the same style as `free -h` (e.g. 125Gi)"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemTotal:"):
+                    kib = int(line.split()[1])
+                    return f"{kib / 1024 / 1024:.0f}Gi"
+    except OSError:
+        pass
+    return "unknown"
+
+
+def _ruchy_version():
+    """First line of `ruchy --version`, or "unknown" if ruchy is not installed"""
+    try:
+        proc = subprocess.run(["ruchy", "--version"], stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    lines = proc.stdout.decode(errors="replace").splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def capture_environment(preflight=None):
+    """
+    Environment captured once per sweep for reproducibility.
+
+    preflight is a harness.preflight.inspect() report; one is taken if not given.
+    """
+    uname = platform.uname()
+    return {
+        "cpu": _cpu_model(),
+        "ram": _total_ram(),
+        "os": f"{uname.system} {uname.release}",
+        "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "preflight": preflight if preflight is not None else noise.inspect(),
+    }
+
+
+def mode_entry(bench, mode, stats, warmup, iterations):
+    """One entry under "modes" (schema matches the bashrs-era results)"""
+    entry = {
+        "name": bench["name"],
+        "mode": mode,
+        "iterations": iterations,
+        "warmup": warmup,
+    }
+    entry.update(stats)
+    entry["tool"] = TOOL
+    return entry
+
+
+def write_results(path, bench, modes, environment, invalid=None):
+    """
+    Write one benchmark's results file (atomically replaces the old one).
+
+    invalid maps modes that failed output verification to their details.
+    Per-sample columns (stats["samples"]) are written to the binary sidecar
+    bench-NNN-samples.bin next to path and replaced by a reference to it;
+    raw_results is then dropped, the sidecar holding the same times in ns.
+    The environment is stored once, at the top level.
+    """
+    per_mode = {mode: entry["samples"] for mode, entry in modes.items()
+                if isinstance(entry.get("samples"), dict) and "elapsed_ns" in entry["samples"]}
+    if per_mode:
+        sidecar = path.with_name(path.name.replace("-results-full.json", "-samples.bin"))
+        for mode, ref in write_sidecar(sidecar, per_mode).items():
+            modes[mode]["samples"] = ref
+            modes[mode].pop("raw_results", None)
+    uname = platform.uname()
+    data = {
+        "benchmark": bench["id"],
+        "name": bench["name"],
+        "tool": TOOL,
+        "modes": modes,
+        "environment": environment,
+        "metadata": {
+            "timestamp": environment["timestamp"],
+            "os": uname.system,
+            "arch": uname.machine,
+            "ruchy_version": _ruchy_version(),
+        },
+    }
+    if invalid:
+        data["invalid_modes"] = invalid
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    tmp.replace(path)
+    return data
@@ -0,0 +1,209 @@
+"""Sweep driver: compile each mode once, measure it, collect results"""
+
+import os
+import sys
+
+from .discovery import BENCH_DIR
+from .inprocess import KERNELS, kernel_command
+from .launcher import build_launcher
+from .measure import SCRIPT_STATS, measure_job
+from .modes import VARIANT_PREFIX, BuildError, language_of, prepare, python_variant
+from .preflight import after_run
+from .results import mode_entry, write_results
+from .scheduler import run_parallel
+from .verify import verify_jobs
+
+WARMUP_ITERATIONS = 3
+MEASURED_ITERATIONS = 10
+
+
+def bench_modes(bench, modes, variants=False):
+    """Modes to run for one benchmark, plus its Python variants when requested"""
+    selected = [m for m in modes if python_variant(m) is None or python_variant(m) in bench["variants"]]
+    if variants:
+        selected += [VARIANT_PREFIX + v for v in bench["variants"] if VARIANT_PREFIX + v not in selected]
+    return selected
+
+
+def prepare_jobs(benchmarks, modes, temp_dir, kernel_iterations=0, variants=False,
+                 tracemalloc=False, adaptive=None, build_cache=True, rebuild=False,
+                 counters=0, profiles_dir=None):
+    """
+    Build phase: compile every (benchmark, mode) pair once, before any timing.
+
+    Returns runnable jobs; modes without an implementation or whose build
+    fails are reported and dropped. With kernel_iterations > 0, Python jobs
+    that have a registered kernel also get in-process kernel timing; with
+    tracemalloc, Python jobs get an extra untimed tracemalloc run. An
+    adaptive policy dict (see measure.ADAPTIVE) switches every job to
+    adaptive sampling. Compiled modes come from the build cache in
+    temp_dir/build-cache unless build_cache is False; rebuild forces fresh
+    builds (which refresh the cache). With counters > 0, every job gets that
+    many extra untimed runs under hardware/software performance counters;
+    with profiles_dir, one profiled run writing a flamegraph.
+    """
+    jobs = []
+    launcher = build_launcher(temp_dir)
+    cache_dir = temp_dir / "build-cache" if build_cache else None
+    for bench in benchmarks:
+        for mode in bench_modes(bench, modes, variants):
+            language = language_of(mode)
+            source = bench["sources"].get(language)
+            if source is None:
+                print(f"  ⚠️  {bench['id']} {mode}: no {language} implementation, skipping",
+                      file=sys.stderr)
+                continue
+            try:
+                argv, artifacts, build = prepare(mode, source, temp_dir,
+                                                 f"{bench['number']}-{os.getpid()}",
+                                                 cache_dir, rebuild)
+            except BuildError as e:
+                print(f"  ❌ {bench['id']} {mode}: {e}", file=sys.stderr)
+                continue
+            job = {"bench": bench, "mode": mode, "argv": argv, "artifacts": artifacts,
+                   "launcher": launcher, "adaptive": adaptive, "build": build,
+                   "counters": counters, "profiles_dir": profiles_dir}
+            if build:
+                state = "cached" if build["cached"] else "built"
+                print(f"  {bench['id']} {mode}: {state} ({build['compile_ms']:.0f} ms compile)",
+                      file=sys.stderr)
+            if kernel_iterations and mode == "python" and bench["number"] in KERNELS:
+                job["kernel_command"] = kernel_command(bench["number"], kernel_iterations)
+            if tracemalloc and language == "python":
+                job["tracemalloc"] = True
+            if language == "python" and bench["number"] in SCRIPT_STATS:
+                job["script_stats"] = True
+            jobs.append(job)
+    return jobs
+
+
+def run_serial(jobs, cwd, warmup, iterations):
+    """Measure jobs one after another (the reference schedule)"""
+    for job in jobs:
+        print(f"Running: {job['bench']['name']} [{job['mode']}]", file=sys.stderr)
+        try:
+            job["stats"] = measure_job(job, cwd, warmup, iterations)
+        except Exception as e:
+            job["error"] = f"{type(e).__name__}: {e}" if not isinstance(e, RuntimeError) else str(e)
+            print(f"  ❌ {job['mode']}: {e}", file=sys.stderr)
+    return jobs
+
+
+def cleanup(jobs):
+    """Remove compiled binaries and intermediate sources from .temp"""
+    for job in jobs:
+        for path in job["artifacts"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def run_sweep(benchmarks, modes, environment, results_dir, temp_dir,
+              warmup=WARMUP_ITERATIONS, iterations=MEASURED_ITERATIONS, jobs=1,
+              kernel_iterations=0, variants=False, tracemalloc=False, adaptive=None,
+              build_cache=True, rebuild=False, counters=0, profile=False, verify=True):
+    """
+    Run every requested mode of every benchmark and write one results file
+    per benchmark. With jobs > 1 independent pairs run concurrently on
+    isolated cores (see scheduler.run_parallel). With verify, each mode first
+    runs once with its output checked against golden/bench-NNN.txt; modes
+    with wrong output are listed under "invalid_modes" and never timed.
+    """
+    prepared = prepare_jobs(benchmarks, modes, temp_dir, kernel_iterations, variants, tracemalloc,
+                            adaptive, build_cache, rebuild, counters,
+                            results_dir / "profiles" if profile else None)
+    try:
+        timed = verify_jobs(prepared, BENCH_DIR) if verify else prepared
+        if jobs > 1:
+            run_parallel(timed, BENCH_DIR, warmup, iterations, jobs)
+        else:
+            run_serial(timed, BENCH_DIR, warmup, iterations)
+    finally:
+        cleanup(prepared)
+    if environment.get("preflight"):
+        after_run(environment["preflight"])
+
+    written = []
+    for bench in benchmarks:
+        results = {}
+        invalid = {}
+        for job in prepared:
+            if job["bench"] is not bench:
+                continue
+            if "invalid" in job:
+                invalid[job["mode"]] = {"detail": job["invalid"],
+                                        "output": job["verification"].get("output", "")}
+            elif "stats" in job:
+                stats = job["stats"]
+                if "verification" in job:
+                    stats = dict(stats, verification=job["verification"]["status"])
+                results[job["mode"]] = mode_entry(bench, job["mode"], stats, warmup, iterations)
+        if not results and not invalid:
+            print(f"  ⚠️  {bench['id']}: no mode produced results, not writing", file=sys.stderr)
+            continue
+        path = results_dir / f"bench-{bench['number']}-results-full.json"
+        written.append(write_results(path, bench, results, environment, invalid))
+        print(f"✅ Results saved to: {path}", file=sys.stderr)
+    return written
+
+
+def _show(value, spec):
+    return "n/a" if value is None else format(value, spec)
+
+
+def print_summary(data):
+    """Per-benchmark table, sorted fastest first, with speedup vs Python"""
+    python_mean = data["modes"].get("python", {}).get("mean_ms")
+    print(f"\n{data['benchmark']}: {data['name']}")
+    print(f"{'Mode':<20} {'Mean (ms)':>10} {'Median (ms)':>12} {'StdDev (ms)':>12} {'Speedup':>9} "
+          f"{'Peak RSS':>10}")
+    print("-" * 79)
+    for name, stats in sorted(data["modes"].items(), key=lambda x: x[1]["mean_ms"]):
+        if name == "python":
+            speedup = "baseline"
+        elif python_mean:
+            speedup = f"{python_mean / stats['mean_ms']:.2f}x"
+        else:
+            speedup = "N/A"
+        print(f"{name:<20} {stats['mean_ms']:>10.2f} {stats['median_ms']:>12.2f} "
+              f"{stats['stddev_ms']:>12.2f} {speedup:>9} {stats['memory']['peak_mb']:>8.1f}MB")
+    pythons = {name: stats["mean_ms"] for name, stats in data["modes"].items()
+               if name == "python" or python_variant(name)}
+    best = min(pythons, key=pythons.get) if len(pythons) > 1 else None
+    if best and best != "python":
+        others = [name for name in data["modes"] if name not in pythons]
+        print(f"Speedup vs fastest Python ({best}): " + (", ".join(
+            f"{name} {pythons[best] / data['modes'][name]['mean_ms']:.2f}x" for name in others)
+            or "no other modes"))
+    adaptive = {name: stats["sampling"] for name, stats in data["modes"].items() if "sampling" in stats}
+    if adaptive:
+        print("Adaptive sampling: " + ", ".join(
+            f"{name} {data['modes'][name]['iterations']} runs ({s['stop_reason']}, "
+            f"±{s['relative_ci'] * 100:.1f}%)" for name, s in adaptive.items()))
+    builds = {name: stats["build"] for name, stats in data["modes"].items() if stats.get("build")}
+    if builds:
+        print("Compile time: " + ", ".join(
+            f"{name} {b['compile_ms']:.0f} ms{' (cached)' if b['cached'] else ''}"
+            for name, b in builds.items()))
+    gc = {name: stats["script_stats"] for name, stats in data["modes"].items()
+          if stats.get("script_stats", {}).get("gc_share") is not None}
+    if gc:
+        print("GC share (untimed --stats run): " + ", ".join(
+            f"{name} {s['gc_share'] * 100:.1f}% ({s['gc_ms']:.0f} ms)" for name, s in gc.items()))
+    counted = {name: stats["counters"] for name, stats in data["modes"].items() if "counters" in stats}
+    if counted:
+        print(f"\n{'Mode':<20} {'Instructions':>14} {'IPC':>6} {'Cache miss':>11} "
+              f"{'Branch miss':>12} {'Ctx switches':>13}")
+        for name, c in sorted(counted.items(), key=lambda x: data["modes"][x[0]]["mean_ms"]):
+            print(f"{name:<20} {_show(c['instructions'], ','):>14} {_show(c['ipc'], '.2f'):>6} "
+                  f"{_show(c['cache_miss_rate'], '.2%'):>11} "
+                  f"{_show(c['branch_miss_rate'], '.2%'):>12} "
+                  f"{_show(c['context_switches'], ','):>13}")
+    for name, entry in data.get("invalid_modes", {}).items():
+        print(f"{name:<20} ❌ INVALID (wrong output, not timed): {entry['detail']}")
+    kernel = data["modes"].get("python", {}).get("kernel")
+    if kernel:
+        print(f"{'python (kernel)':<20} {kernel['mean_ms']:>10.2f} {kernel['median_ms']:>12.2f} "
+              f"{kernel['stddev_ms']:>12.2f} {'':>9}  "
+              f"startup ≈ {data['modes']['python']['startup_ms']:.2f} ms")
@@ -0,0 +1,135 @@
+"""
+Per-sample binary sidecar: results/bench-NNN-samples.bin
+
+Every timed run is kept at full resolution: monotonic wall time in
+nanoseconds, user and sys CPU time from rusage (microsecond resolution,
+stored as ns), peak RSS and the CPU the run finished on. The file is
+columnar little-endian int64 after an 8-byte magic: for each mode, one block
+of `count` values per column, in COLUMNS order; unknown values are -1. The
+JSON results entry of each mode points into it:
+    "samples": {"file": "bench-NNN-samples.bin", "offset": 8, "count": 10,
+                "columns": ["elapsed_ns", ...]}
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.samples results/bench-012-results-full.json
+    python3 -m harness.samples results/bench-012-results-full.json --mode c --csv
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from array import array
+from pathlib import Path
+
+MAGIC = b"BSMP0001"
+COLUMNS = ("elapsed_ns", "user_ns", "sys_ns", "maxrss_kb", "cpu")
+
+
+def columns(samples):
+    """Column lists (COLUMNS order) from measure.run_once sample dicts"""
+    return {name: [-1 if s[name] is None else s[name] for s in samples] for name in COLUMNS}
+
+
+def _to_bytes(values):
+    block = array("q", values)
+    if sys.byteorder == "big":
+        block.byteswap()
+    return block.tobytes()
+
+
+def write_sidecar(path, per_mode):
+    """
+    Write {mode: columns} to path (atomically) and return {mode: reference}.
+
+    References are relative to the JSON file next to the sidecar.
+    """
+    path = Path(path)
+    refs = {}
+    chunks = [MAGIC]
+    offset = len(MAGIC)
+    for mode, cols in per_mode.items():
+        count = len(cols["elapsed_ns"])
+        refs[mode] = {"file": path.name, "offset": offset, "count": count,
+                      "columns": list(COLUMNS)}
+        for name in COLUMNS:
+            chunks.append(_to_bytes(cols[name]))
+        offset += 8 * count * len(COLUMNS)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".bin.tmp")
+    tmp.write_bytes(b"".join(chunks))
+    tmp.replace(path)
+    return refs
+
+
+def read_sidecar(results_dir, ref):
+    """Column lists for one mode from its JSON "samples" reference"""
+    with open(Path(results_dir) / ref["file"], "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{ref['file']}: not a samples sidecar")
+        f.seek(ref["offset"])
+        data = f.read(8 * ref["count"] * len(ref["columns"]))
+    block = array("q")
+    block.frombytes(data)
+    if sys.byteorder == "big":
+        block.byteswap()
+    n = ref["count"]
+    return {name: block[i * n:(i + 1) * n].tolist() for i, name in enumerate(ref["columns"])}
+
+
+def elapsed_ms(entry, results_dir):
+    """
+    Per-run wall times in ms for one results entry: from the sidecar, or from
+    raw_results in files written before the sidecar held them.
+    """
+    if "raw_results" in entry:
+        return [float(x) for x in entry["raw_results"]]
+    if isinstance(entry.get("samples"), dict) and "file" in entry["samples"]:
+        return [ns / 1e6 for ns in read_sidecar(results_dir, entry["samples"])["elapsed_ns"]]
+    return []
+
+
+def load(results_path, mode):
+    """Column lists for one mode of a results/bench-NNN-results-full.json file"""
+    results_path = Path(results_path)
+    with open(results_path) as f:
+        entry = json.load(f)["modes"][mode]
+    if "samples" not in entry:
+        raise KeyError(f"{mode}: no sample sidecar recorded")
+    return read_sidecar(results_path.parent, entry["samples"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.samples",
+                                     description="Inspect the per-sample sidecar of a results file")
+    parser.add_argument("results", help="results/bench-NNN-results-full.json")
+    parser.add_argument("--mode", nargs="+", metavar="MODE")
+    parser.add_argument("--csv", action="store_true", help="dump every sample as CSV")
+    args = parser.parse_args(argv)
+
+    with open(args.results) as f:
+        modes = json.load(f)["modes"]
+    selected = [m for m in args.mode or modes if "samples" in modes.get(m, {})]
+    if not selected:
+        print("No per-sample data recorded for the selected modes", file=sys.stderr)
+        return 1
+    if args.csv:
+        print("mode," + ",".join(COLUMNS))
+    else:
+        print(f"{'Mode':<20} {'Runs':>5} {'Median ns':>14} {'Min ns':>14} {'User ns':>14} "
+              f"{'Sys ns':>14}")
+    for mode in selected:
+        cols = read_sidecar(Path(args.results).parent, modes[mode]["samples"])
+        if args.csv:
+            for row in zip(*(cols[name] for name in COLUMNS)):
+                print(mode + "," + ",".join(str(v) for v in row))
+            continue
+        elapsed = cols["elapsed_ns"]
+        print(f"{mode:<20} {len(elapsed):>5} {statistics.median(elapsed):>14,.0f} "
+              f"{min(elapsed):>14,} {statistics.median(cols['user_ns']):>14,.0f} "
+              f"{statistics.median(cols['sys_ns']):>14,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+"""
+Scaling curves: each benchmark at a series of problem sizes, in every mode
+
+Every implementation reads its problem size from the BENCH_SIZE environment
+variable (default: the size the suite has always used); Ruchy sources have
+no confirmed environment API, so a sized copy is written to .temp with the
+integer on the line after their "// BENCH_SIZE" marker replaced.
+
+For each mode the medians are fitted to t = t0 + k * work^b, where work is
+the benchmark's operation count at that size (n^3 for matrix multiply, ...),
+so b close to 1 means the mode scales like the algorithm and t0 estimates
+its fixed (startup) cost. Crossovers against python and the largest size
+each mode runs within --viable-ms are reported too, with each mode's peak
+RSS at the largest size it ran. --variants adds the benchmark's python-NAME
+strategies (e.g. BENCH-003's string-building strategies), which then cross
+against the python baseline like any other mode; every pair of modes whose
+curves cross is listed as well, so strategies that share a fixed cost (the
+variants' argparse import) can be compared with each other directly.
+
+Work per second is measured between the two largest sizes, so the fixed cost
+cancels out; for BENCH-007 the work is the exact call count, making it calls
+per second, the dispatch-cost figure for comparing ruchy-ast and
+ruchy-bytecode. Slow interpreted modes stop at a per-benchmark ceiling
+(SIZES "ceilings") on the default sweep, so compiled modes are still timed at
+sizes where compute, not process startup, dominates.
+
+BENCH-012 (startup) has no size and is not swept.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.scaling --bench 011 --mode python c go
+    python3 -m harness.scaling --bench 002 --sizes 32 64 128 --viable-ms 500
+    python3 -m harness.scaling --bench 003 --mode python --variants
+"""
+
+import argparse
+import html
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from .discovery import BENCH_DIR, discover
+from .launcher import build_launcher
+from .measure import ADAPTIVE, measure, measure_adaptive
+from .modes import MODES, BuildError, language_of, prepare, python_variant
+from .runner import bench_modes
+from .results import capture_environment
+
+WARMUP_ITERATIONS = 1
+MEASURED_ITERATIONS = 5
+VIABLE_MS = 1000.0
+CUTOFF_MS = 30000.0
+
+_PHI = (1 + 5 ** 0.5) / 2
+
+# Benchmark -> size parameter, default size, default sweep and work model, plus
+# optional per-mode ceilings on the default sweep for slow interpreted modes
+# (Python variants share "python"'s) so the others still reach large sizes
+SIZES = {
+    "002": {"parameter": "matrix N", "default": 100,
+            "sizes": [16, 32, 64, 128, 256], "work": "n^3"},
+    "003": {"parameter": "concatenations", "default": 10000,
+            "sizes": [10000, 100000, 1000000, 10000000, 100000000], "work": "n"},
+    "004": {"parameter": "max tree depth", "default": 16,
+            "sizes": [8, 10, 12, 14, 16], "work": "n*2^n"},
+    "005": {"parameter": "integers summed", "default": 1000000,
+            "sizes": [10000, 100000, 1000000, 10000000, 100000000, 1000000000], "work": "n"},
+    "006": {"parameter": "log size (MB)", "default": 100,
+            "sizes": [12, 25, 50, 100], "work": "n"},
+    "007": {"parameter": "fibonacci n", "default": 20,
+            "sizes": [20, 23, 26, 29, 32, 35], "work": "fib-calls",
+            "ceilings": {"python": 32, "ruchy-ast": 26, "ruchy-bytecode": 29}},
+    "008": {"parameter": "primes generated", "default": 10000,
+            "sizes": [1250, 2500, 5000, 10000, 20000], "work": "n"},
+    "009": {"parameter": "JSON size (MB)", "default": 50,
+            "sizes": [6, 12, 25, 50], "work": "n"},
+    "011": {"parameter": "loop bound n (n x n)", "default": 1000,
+            "sizes": [100, 316, 1000, 3162, 10000, 31623], "work": "n^2"},
+}
+
+WORK = {
+    "n": lambda n: float(n),
+    "n^2": lambda n: float(n) ** 2,
+    "n^3": lambda n: float(n) ** 3,
+    # binary trees: about 2^d nodes built and walked at each of the ~n depths d
+    "n*2^n": lambda n: n * 2.0 ** n,
+    # calls made by doubly recursive fib(n): 2 * fib(n + 1) - 1
+    "fib-calls": lambda n: 2.0 * round(_PHI ** (n + 1) / 5 ** 0.5) - 1,
+}
+
+# Input files generated on demand: benchmark -> (path template, generator argv template)
+INPUTS = {
+    "006": ("testdata/bench-006-logs-{size}mb.txt",
+            ["scripts/generate-logfile-parallel.py", "{path}", "--size", "{size}MB",
+             "--expected", "testdata/bench-006-expected-errors-{size}mb.txt"]),
+    "009": ("test-data/sample-{size}mb.json",
+            ["scripts/generate-json-test-data.py", "{path}", "--size", "{size}MB"]),
+}
+
+# Generators for the default size, whose file is the suite's reference input:
+# it must match the golden/expected values, so it comes from the original
+# generator (the parallel log generator draws different lines for the same seed)
+REFERENCE_INPUTS = {
+    "006": ["generate_test_logs.py"],
+}
+
+RUCHY_MARKER = "// BENCH_SIZE"
+
+
+def ensure_input(number, size):
+    """Generate the input file a file-driven benchmark needs at this size, if missing"""
+    if number not in INPUTS:
+        return
+    template, command = INPUTS[number]
+    if size == SIZES[number]["default"] and number in REFERENCE_INPUTS:
+        command = REFERENCE_INPUTS[number]
+    path = template.format(size=size)
+    if (BENCH_DIR / path).is_file():
+        return
+    print(f"  Generating {path}", file=sys.stderr)
+    (BENCH_DIR / path).parent.mkdir(parents=True, exist_ok=True)
+    argv = [sys.executable] + [arg.format(path=path, size=size) for arg in command]
+    proc = subprocess.run(argv, cwd=BENCH_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        detail = proc.stderr.decode(errors="replace").strip().splitlines()
+        raise RuntimeError(f"generating {path} failed: {detail[-1] if detail else proc.returncode}")
+
+
+def sized_source(source, size, temp_dir):
+    """
+    Copy of a Ruchy source with the integer after its BENCH_SIZE marker set to size.
+
+    Raises BuildError if the source has no marker.
+    """
+    lines = source.read_text().splitlines(keepends=True)
+    for i, line in enumerate(lines[:-1]):
+        if line.strip().startswith(RUCHY_MARKER):
+            lines[i + 1] = re.sub(r"\d+", str(size), lines[i + 1], count=1)
+            target = temp_dir / f"{source.stem}-size{size}{source.suffix}"
+            target.write_text("".join(lines))
+            return target
+    raise BuildError(f"{source.name} has no {RUCHY_MARKER} marker")
+
+
+def fit_power_law(work, times_ms):
+    """
+    Fit t = t0 + k * work^b (t0 >= 0, k >= 0) to medians by relative least squares.
+
+    b is searched on a grid from 0.2 to 4.0; for each b, t0 and k are the
+    weighted (1/t^2) linear least-squares solution, so every size counts
+    equally however long it takes. A flat curve (k = 0) is reported with
+    exponent 0: the time does not depend on the size at all, e.g. because
+    an optimizing compiler removed the work. Returns {"exponent",
+    "constant_ms", "fixed_ms", "r2"} (r2 of log times), or None with fewer
+    than 3 points.
+    """
+    if len(work) < 3:
+        return None
+    weights = [1 / t ** 2 for t in times_ms]
+    flat_ms = sum(wt * t for wt, t in zip(weights, times_ms)) / sum(weights)
+    best = (sum(wt * (t - flat_ms) ** 2 for wt, t in zip(weights, times_ms)), 0.0, flat_ms, 0.0)
+    for step in range(20, 401):
+        b = step / 100
+        xs = [w ** b for w in work]
+        sw = sum(weights)
+        sx = sum(wt * x for wt, x in zip(weights, xs))
+        sxx = sum(wt * x * x for wt, x in zip(weights, xs))
+        st = sum(wt * t for wt, t in zip(weights, times_ms))
+        sxt = sum(wt * x * t for wt, x, t in zip(weights, xs, times_ms))
+        det = sw * sxx - sx * sx
+        t0 = (sxx * st - sx * sxt) / det if det else -1.0
+        k = (sw * sxt - sx * st) / det if det else 0.0
+        if t0 < 0 or k <= 0:
+            t0, k = 0.0, sxt / sxx
+        sse = sum(wt * (t - t0 - k * x) ** 2 for wt, x, t in zip(weights, xs, times_ms))
+        if sse < best[0]:
+            best = (sse, b, t0, k)
+    _, b, t0, k = best
+    logs = [math.log(t) for t in times_ms]
+    mean_log = sum(logs) / len(logs)
+    ss_tot = sum((y - mean_log) ** 2 for y in logs)
+    ss_res = sum((math.log(t0 + k * w ** b) - y) ** 2 for w, y in zip(work, logs))
+    if k == 0:
+        b = 0.0
+    return {
+        "exponent": b,
+        "constant_ms": k,
+        "fixed_ms": round(t0, 3),
+        "r2": round(1 - ss_res / ss_tot, 4) if ss_tot else None,
+    }
+
+
+def crossover(sizes, times_ms, baseline_ms):
+    """
+    First size (log-interpolated) where a mode's curve crosses the baseline's.
+
+    Both are dicts size -> median ms. Returns {"size", "faster_above"} or None
+    if the curves do not cross within the shared sizes.
+    """
+    shared = [s for s in sizes if s in times_ms and s in baseline_ms]
+    ratios = [math.log(times_ms[s] / baseline_ms[s]) for s in shared]
+    for (s0, r0), (s1, r1) in zip(zip(shared, ratios), zip(shared[1:], ratios[1:])):
+        if r0 == 0 or (r0 > 0) != (r1 > 0):
+            if r0 == 0:
+                at = s0
+            else:
+                frac = r0 / (r0 - r1)
+                at = math.exp(math.log(s0) + frac * (math.log(s1) - math.log(s0)))
+            return {"size": round(at, 2), "faster_above": r1 < r0}
+    return None
+
+
+def pairwise_crossovers(sizes, modes):
+    """Every pair of modes whose curves cross: [{"mode", "other", "size", "faster_above"}]"""
+    medians = {mode: {p["size"]: p["median_ms"] for p in entry["points"]}
+               for mode, entry in modes.items()}
+    names = list(modes)
+    found = []
+    for i, mode in enumerate(names):
+        for other in names[i + 1:]:
+            cross = crossover(sizes, medians[mode], medians[other])
+            if cross:
+                found.append(dict(mode=mode, other=other, **cross))
+    return found
+
+
+def measure_mode(bench, mode, sizes, temp_dir, launcher, args):
+    """Median time at each size for one mode, stopping once a size exceeds the cutoff"""
+    source = bench["sources"][language_of(mode)]
+    cache_dir = temp_dir / "build-cache"
+    points = []
+    for size in sizes:
+        run_source = sized_source(source, size, temp_dir) if language_of(mode) == "ruchy" else source
+        artifacts = []
+        env = dict(os.environ, BENCH_SIZE=str(size))
+        try:
+            # inside the try so a failed build still removes the sized copy
+            argv, artifacts, build = prepare(mode, run_source, temp_dir,
+                                             f"scaling-{bench['number']}-{os.getpid()}", cache_dir)
+            if args.adaptive:
+                stats = measure_adaptive(argv, BENCH_DIR, launcher,
+                                         {"target_ci": args.target_ci, "budget_s": args.budget}, env)
+            else:
+                stats = measure(argv, BENCH_DIR, args.warmup, args.iterations, launcher, env)
+        except RuntimeError as e:
+            if not points:
+                raise
+            # e.g. a NumPy variant running out of memory: keep the sizes that ran
+            print(f"  ⚠️  {mode} size={size}: {e}, skipping larger sizes", file=sys.stderr)
+            break
+        finally:
+            for path in artifacts + ([run_source] if run_source != source else []):
+                if os.path.exists(path):
+                    os.remove(path)
+        points.append({
+            "size": size,
+            "work": WORK[SIZES[bench["number"]]["work"]](size),
+            "median_ms": stats["median_ms"],
+            "mean_ms": stats["mean_ms"],
+            "stddev_ms": stats["stddev_ms"],
+            "peak_kb": stats["memory"]["peak_kb"],
+            "raw_results": stats["raw_results"],
+        })
+        print(f"  {mode} size={size}: {stats['median_ms']:.2f} ms", file=sys.stderr)
+        if stats["median_ms"] > args.cutoff_ms:
+            print(f"  {mode}: over {args.cutoff_ms:g} ms, skipping larger sizes", file=sys.stderr)
+            break
+    return points
+
+
+def marginal_rate(points):
+    """
+    Work units per second between the two largest sizes (calls/s for BENCH-007).
+
+    Differencing cancels the fixed per-process cost, which dominates at small
+    sizes. None with fewer than 2 points or no time difference.
+    """
+    if len(points) < 2:
+        return None
+    a, b = points[-2], points[-1]
+    if b["median_ms"] <= a["median_ms"]:
+        return None
+    return round((b["work"] - a["work"]) / (b["median_ms"] - a["median_ms"]) * 1000, 1)
+
+
+def analyse(points, viable_ms):
+    """Fit, work rate, and largest measured size whose median stays within viable_ms"""
+    fit = fit_power_law([p["work"] for p in points], [p["median_ms"] for p in points])
+    viable = [p["size"] for p in points if p["median_ms"] <= viable_ms]
+    return {"points": points, "fit": fit, "work_per_second": marginal_rate(points),
+            "viable_size": max(viable) if viable else None}
+
+
+def _log_position(value, low, high, start, length):
+    if high == low:
+        return start + length / 2
+    return start + (math.log(value) - math.log(low)) / (math.log(high) - math.log(low)) * length
+
+
+def render_svg(report, width=800, height=500):
+    """Log-log plot of median time against size, one line per mode with its fit dashed"""
+    palette = ["#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd",
+               "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+    modes = report["modes"]
+    points = [p for entry in modes.values() for p in entry["points"]]
+    sizes = [p["size"] for p in points]
+    times = [p["median_ms"] for p in points]
+    x_lo, x_hi = min(sizes), max(sizes)
+    y_lo, y_hi = min(times) / 1.5, max(times) * 1.5
+    left, top, plot_w, plot_h = 70, 40, width - 230, height - 100
+
+    def xy(size, ms):
+        return (_log_position(size, x_lo, x_hi, left, plot_w),
+                top + plot_h - _log_position(ms, y_lo, y_hi, 0, plot_h))
+
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'font-family="Verdana" font-size="11">',
+           '<rect width="100%" height="100%" fill="#ffffff"/>',
+           f'<text x="{width / 2}" y="22" text-anchor="middle" font-size="14">'
+           f'{html.escape(report["benchmark"])}: {html.escape(report["name"])} (log-log)</text>',
+           f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#999"/>',
+           f'<text x="{left + plot_w / 2}" y="{height - 20}" text-anchor="middle">'
+           f'{html.escape(report["size_parameter"])}</text>',
+           f'<text x="16" y="{top + plot_h / 2}" text-anchor="middle" '
+           f'transform="rotate(-90 16 {top + plot_h / 2})">median ms</text>']
+    for size in sorted(set(sizes)):
+        x, _ = xy(size, y_lo)
+        out.append(f'<text x="{x:.1f}" y="{top + plot_h + 15}" text-anchor="middle">{size:g}</text>')
+    decade = 10 ** math.floor(math.log10(y_lo))
+    while decade <= y_hi:
+        if decade >= y_lo:
+            _, y = xy(x_lo, decade)
+            out.append(f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_w}" y2="{y:.1f}" '
+                       f'stroke="#eee"/><text x="{left - 5}" y="{y + 4:.1f}" '
+                       f'text-anchor="end">{decade:g}</text>')
+        decade *= 10
+    for i, (mode, entry) in enumerate(modes.items()):
+        color = palette[i % len(palette)]
+        coords = [xy(p["size"], p["median_ms"]) for p in entry["points"]]
+        out.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="'
+                   + " ".join(f"{x:.1f},{y:.1f}" for x, y in coords) + '"/>')
+        for (x, y), p in zip(coords, entry["points"]):
+            out.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{color}">'
+                       f'<title>{html.escape(mode)} size={p["size"]:g}: {p["median_ms"]:.2f} ms'
+                       f'</title></circle>')
+        fit = entry["fit"]
+        if fit:
+            work = WORK[report["work"]]
+            lo, hi = entry["points"][0]["size"], entry["points"][-1]["size"]
+            steps = [lo * (hi / lo) ** (j / 40) for j in range(41)]
+            curve = [xy(s, fit["fixed_ms"] + fit["constant_ms"] * work(s) ** fit["exponent"])
+                     for s in steps]
+            out.append(f'<polyline fill="none" stroke="{color}" stroke-dasharray="4 3" points="'
+                       + " ".join(f"{x:.1f},{y:.1f}" for x, y in curve
+                                  if top <= y <= top + plot_h) + '"/>')
+        label = mode + (f" (b={fit['exponent']:.2f})" if fit else "")
+        ly = top + 10 + i * 18
+        out.append(f'<line x1="{left + plot_w + 15}" y1="{ly}" x2="{left + plot_w + 35}" y2="{ly}" '
+                   f'stroke="{color}" stroke-width="2"/><text x="{left + plot_w + 40}" '
+                   f'y="{ly + 4}">{html.escape(label)}</text>')
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+def print_table(report):
+    print(f"\n{report['benchmark']}: {report['name']} — work ~ {report['work']}, "
+          f"viable = median ≤ {report['viable_ms']:g} ms")
+    print(f"{'Mode':<22} {'Exponent':>8} {'Fixed ms':>9} {'R²':>7} {'Viable to':>10} "
+          f"{'Peak MB':>8} {'Work/s':>9}  Crossover vs python")
+    print("-" * 105)
+    for mode, entry in report["modes"].items():
+        fit = entry["fit"] or {}
+        cross = entry.get("crossover_vs_python")
+        cross_text = "-" if not cross else (
+            f"{'faster' if cross['faster_above'] else 'slower'} above {cross['size']:g}")
+        exponent = f"{fit['exponent']:.2f}" if fit else "-"
+        fixed = f"{fit['fixed_ms']:.1f}" if fit else "-"
+        r2 = f"{fit['r2']:.3f}" if fit and fit["r2"] is not None else "-"
+        viable = f"{entry['viable_size']:g}" if entry["viable_size"] is not None else "none"
+        peak_kb = entry["points"][-1]["peak_kb"]
+        peak = f"{peak_kb / 1024:.1f}" if peak_kb else "-"
+        rate = f"{entry['work_per_second']:.3g}" if entry.get("work_per_second") else "-"
+        print(f"{mode:<22} {exponent:>8} {fixed:>9} {r2:>7} {viable:>10} {peak:>8} {rate:>9}  "
+              f"{cross_text}")
+    for cross in report.get("crossovers", []):
+        if "python" in (cross["mode"], cross["other"]):
+            continue  # already in the table
+        faster, slower = ((cross["mode"], cross["other"]) if cross["faster_above"]
+                          else (cross["other"], cross["mode"]))
+        print(f"  {faster} overtakes {slower} above {cross['size']:g}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.scaling",
+                                     description="Time benchmarks across problem sizes")
+    parser.add_argument("--bench", nargs="+", metavar="NNN",
+                        help=f"benchmarks to sweep (default: {' '.join(SIZES)})")
+    parser.add_argument("--mode", nargs="+", metavar="MODE", help="modes to include (default: all)")
+    parser.add_argument("--variants", action="store_true",
+                        help="also sweep each benchmark's alternative Python baselines")
+    parser.add_argument("--sizes", nargs="+", type=int, metavar="N",
+                        help="sizes to run (default: each benchmark's series)")
+    parser.add_argument("--warmup", type=int, default=WARMUP_ITERATIONS)
+    parser.add_argument("--iterations", type=int, default=MEASURED_ITERATIONS)
+    parser.add_argument("--adaptive", action="store_true",
+                        help="adaptive sampling at every size (see python3 -m harness --adaptive)")
+    parser.add_argument("--target-ci", type=float, default=ADAPTIVE["target_ci"], metavar="FRACTION")
+    parser.add_argument("--budget", type=float, default=ADAPTIVE["budget_s"], metavar="SECONDS")
+    parser.add_argument("--viable-ms", type=float, default=VIABLE_MS,
+                        help=f"time a size must stay within to count as viable (default: {VIABLE_MS:g})")
+    parser.add_argument("--cutoff-ms", type=float, default=CUTOFF_MS,
+                        help="stop a mode's sweep after a size slower than this "
+                             f"(default: {CUTOFF_MS:g})")
+    parser.add_argument("--results-dir", default=str(BENCH_DIR / "results" / "scaling"))
+    args = parser.parse_args(argv)
+
+    numbers = args.bench or list(SIZES)
+    unsized = [n for n in numbers if n not in SIZES]
+    if unsized:
+        print(f"No size parameter for: {', '.join(unsized)}", file=sys.stderr)
+        return 2
+    temp_dir = BENCH_DIR / ".temp"
+    temp_dir.mkdir(exist_ok=True)
+    results_dir = Path(args.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    launcher = build_launcher(temp_dir)
+    environment = capture_environment()
+
+    for bench in discover(only=set(numbers)):
+        spec = SIZES[bench["number"]]
+        sizes = sorted(args.sizes or spec["sizes"])
+        print(f"Scaling: {bench['name']} at {spec['parameter']} = {sizes}", file=sys.stderr)
+        try:
+            for size in sizes:
+                ensure_input(bench["number"], size)
+        except RuntimeError as e:
+            print(f"  ❌ {bench['id']}: {e}", file=sys.stderr)
+            continue
+
+        modes = {}
+        for mode in bench_modes(bench, args.mode or list(MODES), args.variants):
+            if language_of(mode) not in bench["sources"]:
+                continue
+            try:
+                ceiling = spec.get("ceilings", {}).get("python" if python_variant(mode) else mode)
+                mode_sizes = [s for s in sizes if args.sizes or ceiling is None or s <= ceiling]
+                points = measure_mode(bench, mode, mode_sizes, temp_dir, launcher, args)
+            except (BuildError, RuntimeError) as e:
+                print(f"  ❌ {mode}: {e}", file=sys.stderr)
+                continue
+            modes[mode] = analyse(points, args.viable_ms)
+        if not modes:
+            print(f"  ⚠️  {bench['id']}: no mode produced results, not writing", file=sys.stderr)
+            continue
+
+        baseline = modes.get("python")
+        if baseline:
+            base_ms = {p["size"]: p["median_ms"] for p in baseline["points"]}
+            for mode, entry in modes.items():
+                if mode != "python":
+                    entry["crossover_vs_python"] = crossover(
+                        sizes, {p["size"]: p["median_ms"] for p in entry["points"]}, base_ms)
+
+        report = {
+            "benchmark": bench["id"],
+            "name": bench["name"],
+            "size_parameter": spec["parameter"],
+            "default_size": spec["default"],
+            "work": spec["work"],
+            "sizes": sizes,
+            "viable_ms": args.viable_ms,
+            "modes": modes,
+            "crossovers": pairwise_crossovers(sizes, modes),
+            "environment": environment,
+        }
+        path = results_dir / f"bench-{bench['number']}-scaling.json"
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        (results_dir / f"bench-{bench['number']}-scaling.svg").write_text(render_svg(report))
+        print(f"✅ Results saved to: {path} (+ .svg)", file=sys.stderr)
+        print_table(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
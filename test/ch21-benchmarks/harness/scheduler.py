@@ -0,0 +1,114 @@
+"""Parallel, core-pinned execution of independent (benchmark, mode) jobs"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .measure import measure_job
+
+# Benchmarks that saturate memory bandwidth: co-running anything with them
+# would make their timings incomparable with serial runs, so they run alone.
+BANDWIDTH_HEAVY = {"002", "006"}
+
+
+def siblings(cpu):
+    """Logical CPUs sharing a physical core with cpu (SMT siblings, incl. itself)"""
+    path = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+    try:
+        with open(path) as f:
+            text = f.read().strip()
+    except OSError:
+        return {cpu}
+    cpus = set()
+    for part in text.split(","):
+        lo, _, hi = part.partition("-")
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+
+def isolated_cores():
+    """
+    One logical CPU per physical core available to this process.
+
+    SMT siblings are left idle so two jobs never share execution units, and
+    the core hosting CPU 0 is kept for the orchestrator and interrupts when
+    there is more than one core to choose from.
+    """
+    allowed = set(os.sched_getaffinity(0))
+    cores = []
+    seen = set()
+    for cpu in sorted(allowed):
+        if cpu in seen:
+            continue
+        sibs = siblings(cpu)
+        seen |= sibs
+        cores.append((cpu, sibs))
+    if len(cores) > 1:
+        cores = [(cpu, sibs) for cpu, sibs in cores if 0 not in sibs]
+    return [cpu for cpu, _ in cores]
+
+
+def _pinned_measure(job, cwd, warmup, iterations, cpu):
+    """Worker: pin to one core (inherited by the benchmark process), then measure"""
+    os.sched_setaffinity(0, {cpu})
+    return measure_job(job, cwd, warmup, iterations)
+
+
+def _label(job):
+    return f"{job['bench']['name']} [{job['mode']}]"
+
+
+def _record(job, future, cpu, exclusive):
+    """
+    Store a finished job's stats (or error) plus where and how it ran.
+
+    Any exception from the worker marks only this job as failed, so the
+    jobs that already finished (and those still queued) are kept.
+    """
+    try:
+        job["stats"] = future.result()
+        job["stats"]["affinity"] = {"pinned_cpu": cpu, "exclusive": exclusive}
+    except Exception as e:
+        job["error"] = f"{type(e).__name__}: {e}" if not isinstance(e, RuntimeError) else str(e)
+        print(f"  ❌ {_label(job)}: {e}", file=sys.stderr)
+
+
+def run_parallel(jobs, cwd, warmup, iterations, max_jobs):
+    """
+    Measure prepared jobs concurrently, each pinned to its own isolated core.
+
+    Bandwidth-heavy benchmarks are never co-scheduled: each runs on its own
+    with every other slot idle. Everything else is dispatched to the next
+    free core as soon as one becomes available.
+    """
+    cores = isolated_cores()[:max(1, max_jobs)]
+    heavy = [j for j in jobs if j["bench"]["number"] in BANDWIDTH_HEAVY]
+    light = [j for j in jobs if j["bench"]["number"] not in BANDWIDTH_HEAVY]
+    print(f"Scheduling {len(jobs)} jobs on cores {cores} "
+          f"({len(heavy)} bandwidth-heavy run exclusively)", file=sys.stderr)
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=len(cores), mp_context=context) as pool:
+        for job in heavy:
+            print(f"Running: {_label(job)} on cpu {cores[0]} (exclusive)", file=sys.stderr)
+            future = pool.submit(_pinned_measure, job, cwd, warmup, iterations, cores[0])
+            wait([future])
+            _record(job, future, cores[0], True)
+
+        free = list(cores)
+        running = {}
+        pending = list(reversed(light))
+        while pending or running:
+            while pending and free:
+                job = pending.pop()
+                cpu = free.pop(0)
+                print(f"Running: {_label(job)} on cpu {cpu}", file=sys.stderr)
+                future = pool.submit(_pinned_measure, job, cwd, warmup, iterations, cpu)
+                running[future] = (job, cpu)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job, cpu = running.pop(future)
+                _record(job, future, cpu, False)
+                free.append(cpu)
+    return jobs
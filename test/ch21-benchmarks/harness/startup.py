@@ -0,0 +1,311 @@
+"""
+Startup decomposition suite (extends BENCH-012)
+
+Times the BENCH-012 hello-world in every available mode plus a set of
+Python launch variants, separating:
+  - time to first output (first byte read from the stdout pipe) from
+    time to exit;
+  - warm runs from cold runs, where the page cache for the executable, its
+    shared libraries, the script and (for Python) every module loaded at
+    startup is dropped with posix_fadvise(POSIX_FADV_DONTNEED) first.
+It also parses `python3 -X importtime` into an import tree.
+
+Pages mapped by a live process cannot be evicted, so for the python3 the
+harness itself runs on, "cold" mostly means cold stdlib .py/.pyc files.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.startup
+    python3 -m harness.startup --iterations 50 --mode python c ruchy-compiled --no-cold
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+
+from .discovery import BENCH_DIR, discover
+from .measure import summarize
+from .modes import MODES, BuildError, language_of, prepare
+from .results import capture_environment
+
+ITERATIONS = 20
+IMPORTTIME_TOP = 15
+
+# Python launch variants: arm name -> interpreter flags
+PYTHON_ARMS = {
+    "python -S": ["-S"],
+    "python -I": ["-I"],
+    "python -I -S": ["-I", "-S"],
+    "python -u": ["-u"],
+    "python frozen_modules=off": ["-X", "frozen_modules=off"],
+}
+
+
+def first_output(argv, cwd):
+    """
+    Run argv once with stdout on a pipe.
+
+    Returns (first_output_ms, exit_ms, exit_code); first_output_ms is None if
+    nothing was written. Block-buffered stdout (e.g. Python without -u)
+    only reaches the pipe at exit, which is exactly what a consumer sees.
+    """
+    start = time.perf_counter_ns()
+    proc = subprocess.Popen(argv, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL)
+    first = os.read(proc.stdout.fileno(), 1)
+    first_ns = time.perf_counter_ns() - start if first else None
+    proc.stdout.read()
+    proc.stdout.close()
+    code = proc.wait()
+    exit_ns = time.perf_counter_ns() - start
+    return (first_ns / 1e6 if first_ns is not None else None), exit_ns / 1e6, code
+
+
+def _shared_libraries(executable):
+    if shutil.which("ldd") is None:
+        return []
+    proc = subprocess.run(["ldd", executable], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    libs = []
+    for line in proc.stdout.decode(errors="replace").splitlines():
+        for token in line.split():
+            if token.startswith("/"):
+                libs.append(token)
+                break
+    return libs
+
+
+def _python_startup_files(python, flags):
+    """Source and .pyc files of every module the interpreter loads with these flags"""
+    code = ("import sys, json; print(json.dumps([p for m in list(sys.modules.values()) "
+            "for p in (getattr(m, '__file__', None), getattr(m, '__cached__', None)) if p]))")
+    proc = subprocess.run([python] + flags + ["-c", code], stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL)
+    try:
+        return json.loads(proc.stdout)
+    except ValueError:
+        return []
+
+
+def cache_files(argv, cwd):
+    """Files whose page cache is dropped before a cold run of argv"""
+    executable = shutil.which(argv[0]) or argv[0]
+    executable = os.path.realpath(executable)
+    files = [executable] + _shared_libraries(executable)
+    files += [os.path.join(cwd, a) for a in argv[1:] if os.path.isfile(os.path.join(cwd, a))]
+    if Path(executable).name.startswith("python"):
+        flags = []
+        args = iter(argv[1:])
+        for arg in args:
+            if not arg.startswith("-"):
+                break
+            flags += [arg, next(args)] if arg == "-X" else [arg]
+        files += _python_startup_files(argv[0], flags)
+    return sorted({f for f in files if os.path.isfile(f)})
+
+
+def drop_page_cache(paths):
+    """posix_fadvise(DONTNEED) each file; returns how many were advised"""
+    dropped = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            dropped += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return dropped
+
+
+def _summary(samples):
+    stats = summarize(samples)
+    stats["raw_results"] = [round(x, 3) for x in samples]
+    return stats
+
+
+def measure_arm(argv, cwd, iterations, cold=True):
+    """
+    Warm and (optionally) cold time-to-first-output and time-to-exit.
+
+    Warm runs follow one discarded priming run. Each cold run is preceded
+    by dropping the page cache for cache_files(argv).
+    """
+    phases = {"warm": None}
+    if cold:
+        phases["cold"] = cache_files(argv, cwd)
+    result = {}
+    for phase, files in phases.items():
+        if files is None:
+            first_output(argv, cwd)
+        firsts, exits = [], []
+        for _ in range(iterations):
+            if files is not None:
+                drop_page_cache(files)
+            first, elapsed, code = first_output(argv, cwd)
+            if code != 0:
+                raise RuntimeError(f"exit status {code}")
+            exits.append(elapsed)
+            if first is not None:
+                firsts.append(first)
+        result[phase] = {
+            "first_output": _summary(firsts) if firsts else None,
+            "exit": _summary(exits),
+        }
+        if files is not None:
+            result[phase]["dropped_files"] = len(files)
+    return result
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output into a tree.
+
+    Lines are "import time: self [us] | cumulative | <indent>name" in
+    post-order (children before their parent, one extra level of indent
+    per nesting depth). Returns the top-level nodes, each
+    {"name", "self_us", "cumulative_us", "children"}.
+    """
+    pending = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        node = {"name": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us),
+                "children": pending.pop(depth + 1, [])}
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def importtime_report(argv, cwd, top=IMPORTTIME_TOP):
+    """Run a Python argv under -X importtime; total, slowest modules and tree"""
+    proc = subprocess.run([argv[0], "-X", "importtime"] + argv[1:], cwd=cwd,
+                          stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE)
+    tree = parse_importtime(proc.stderr.decode(errors="replace"))
+    flat = []
+
+    def walk(nodes):
+        for node in nodes:
+            flat.append(node)
+            walk(node["children"])
+
+    walk(tree)
+    return {
+        "total_us": sum(node["cumulative_us"] for node in tree),
+        "modules": len(flat),
+        "slowest_self": [{"name": n["name"], "self_us": n["self_us"]}
+                         for n in sorted(flat, key=lambda n: n["self_us"], reverse=True)[:top]],
+        "tree": tree,
+    }
+
+
+def build_zipapp(script, temp_dir):
+    """Package the script as a zipapp (python3 app.pyz) in temp_dir"""
+    staging = Path(tempfile.mkdtemp(dir=temp_dir))
+    shutil.copy(script, staging / "__main__.py")
+    target = Path(temp_dir) / "bench-012-startup.pyz"
+    zipapp.create_archive(staging, target)
+    shutil.rmtree(staging)
+    return target
+
+
+def arms(bench, modes, temp_dir):
+    """(arm name, argv) for each requested mode, plus the Python launch variants"""
+    cache_dir = temp_dir / "build-cache"
+    out = []
+    for mode in modes:
+        source = bench["sources"].get(language_of(mode))
+        if source is None:
+            continue
+        try:
+            argv, _, _ = prepare(mode, source, temp_dir, f"startup-{os.getpid()}", cache_dir)
+        except BuildError as e:
+            print(f"  ⚠️  {mode}: {e}", file=sys.stderr)
+            continue
+        out.append((mode, argv))
+        if mode == "python":
+            for name, flags in PYTHON_ARMS.items():
+                out.append((name, [argv[0]] + flags + argv[1:]))
+            out.append(("python zipapp", [argv[0], str(build_zipapp(source, temp_dir))]))
+    return out
+
+
+def print_table(results):
+    print(f"\n{'Arm':<26} {'Warm 1st out':>13} {'Warm exit':>10} {'Cold 1st out':>13} "
+          f"{'Cold exit':>10}  (median ms)")
+    print("-" * 79)
+
+    def cell(phase, key):
+        stats = phase and phase.get(key)
+        return f"{stats['median_ms']:.2f}" if stats else "-"
+
+    for name, arm in sorted(results.items(), key=lambda x: x[1]["warm"]["exit"]["median_ms"]):
+        print(f"{name:<26} {cell(arm['warm'], 'first_output'):>13} {cell(arm['warm'], 'exit'):>10} "
+              f"{cell(arm.get('cold'), 'first_output'):>13} {cell(arm.get('cold'), 'exit'):>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.startup",
+                                     description="BENCH-012 startup decomposition")
+    parser.add_argument("--mode", nargs="+", metavar="MODE", help="modes to include (default: all)")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--no-cold", action="store_true", help="skip the cold-cache runs")
+    parser.add_argument("--importtime-top", type=int, default=IMPORTTIME_TOP)
+    parser.add_argument("--output", default=str(BENCH_DIR / "results" / "bench-012-startup-decomposition.json"))
+    args = parser.parse_args(argv)
+
+    bench = discover(only={"012"})[0]
+    temp_dir = BENCH_DIR / ".temp"
+    temp_dir.mkdir(exist_ok=True)
+    results = {}
+    for name, arm_argv in arms(bench, args.mode or list(MODES), temp_dir):
+        print(f"Running: {name}", file=sys.stderr)
+        try:
+            results[name] = measure_arm(arm_argv, BENCH_DIR, args.iterations, not args.no_cold)
+        except RuntimeError as e:
+            print(f"  ❌ {name}: {e}", file=sys.stderr)
+    if not results:
+        print("No startup arms could be run", file=sys.stderr)
+        return 1
+
+    report = {
+        "benchmark": bench["id"],
+        "name": "Startup decomposition",
+        "iterations": args.iterations,
+        "arms": results,
+        "environment": capture_environment(),
+    }
+    if "python" in results:
+        report["python_importtime"] = importtime_report(["python3", str(bench["sources"]["python"])],
+                                                        BENCH_DIR, args.importtime_top)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"✅ Results saved to: {output}", file=sys.stderr)
+
+    print_table(results)
+    if "python_importtime" in report:
+        imports = report["python_importtime"]
+        print(f"\npython -X importtime: {imports['modules']} modules, "
+              f"{imports['total_us'] / 1000:.2f} ms cumulative; slowest (self):")
+        for entry in imports["slowest_self"]:
+            print(f"  {entry['self_us'] / 1000:>7.2f} ms  {entry['name']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
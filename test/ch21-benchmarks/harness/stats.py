@@ -0,0 +1,35 @@
+"""Rank statistics shared by the history regression check and the geomean report"""
+
+import math
+
+
+def mann_whitney(x, y, alternative="two-sided"):
+    """
+    Mann-Whitney U test: (U for x, p-value).
+
+    alternative is "two-sided" or "greater" (x tends to be larger than y).
+    Normal approximation with tie correction and continuity correction;
+    legacy samples are whole milliseconds, so ties are common.
+    """
+    n1, n2 = len(x), len(y)
+    pooled = sorted([(v, True) for v in x] + [(v, False) for v in y])
+    rank_sum_x = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j < len(pooled) and pooled[j][0] == pooled[i][0]:
+            j += 1
+        rank_sum_x += (i + j + 1) / 2 * sum(1 for _, from_x in pooled[i:j] if from_x)
+        tie_term += (j - i) ** 3 - (j - i)
+        i = j
+    u = rank_sum_x - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    if alternative == "greater":
+        z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+        return u, 0.5 * math.erfc(z / math.sqrt(2))
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
@@ -0,0 +1,40 @@
+"""
+Run a Python benchmark under tracemalloc and report its allocation profile
+
+Used for one extra, untimed run per Python mode (tracemalloc slows the
+interpreter down too much to share a run with timing):
+    python3 -m harness.tracemem OUT.json bench-004-binary-tree.py [args...]
+"""
+
+import json
+import runpy
+import sys
+import tracemalloc
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("usage: python3 -m harness.tracemem OUT.json SCRIPT [ARGS...]", file=sys.stderr)
+        return 2
+    out_path, script = argv[0], argv[1]
+
+    sys.argv = argv[1:]
+    tracemalloc.start()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.stop()
+        with open(out_path, "w") as f:
+            json.dump({
+                "peak_kb": peak // 1024,
+                "final_kb": current // 1024,
+                "allocated_blocks": blocks,
+            }, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
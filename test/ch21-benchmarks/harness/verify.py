@@ -0,0 +1,217 @@
+"""
+Output verification: every mode must print the right answer before it is timed
+
+Each benchmark has a golden file, golden/bench-NNN.txt, listing the values
+its output must contain. Lines starting with "#" are comments, except:
+  # tolerance: X       relative tolerance for non-integer numbers (default REL_TOL)
+  # values-from: PATH  take the values from PATH (relative to the benchmarks
+                       directory) when it exists, for generated inputs that
+                       come with their own expected answer
+Each golden line must match its own output line, in order: the line's
+numbers must be exactly the golden numbers (no extra or missing ones), and
+its words must include the golden words. Numbers used as labels, such as
+the 20 in "fib(20)" or the 10,000 in "10,000th", are not counted, and
+"10,000" reads as 10000. Output lines that match no golden line, such as
+Python's "✓ Verification passed", are allowed. Integers must match exactly.
+
+Golden files describe the default problem size, so runs with BENCH_SIZE set
+are not checked.
+
+Usage (from test/ch21-benchmarks):
+    python3 -m harness.verify
+    python3 -m harness.verify --bench 008 --mode c ruchy-transpiled
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+from .discovery import BENCH_DIR, discover
+from .modes import MODES, BuildError, language_of, prepare, python_variant
+
+GOLDEN_DIR = BENCH_DIR / "golden"
+REL_TOL = 1e-6
+TIMEOUT_S = 600
+SNIPPET_CHARS = 200
+
+_TOKEN = re.compile(r"[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][-+]?\d+)?|[A-Za-z_]+")
+
+
+def line_tokens(line):
+    """
+    {"text", "words", "values"} for one line of text.
+
+    Thousands separators are removed from numbers; numbers directly followed
+    by a letter ("10,000th") or in parentheses ("fib(20)") are labels and
+    left out of "values".
+    """
+    words, values = [], []
+    for match in _TOKEN.finditer(line):
+        token = match.group()
+        if not token[-1].isdigit():
+            words.append(token)
+            continue
+        before, after = line[match.start() - 1:match.start()], line[match.end():match.end() + 1]
+        if not (after.isalpha() or (before == "(" and after == ")")):
+            values.append(token.replace(",", ""))
+    return {"text": line.strip(), "words": words, "values": values}
+
+
+def _golden_lines(text):
+    return [line for line in map(line_tokens, text.splitlines()) if line["words"] or line["values"]]
+
+
+def load_golden(number, golden_dir=GOLDEN_DIR):
+    """{"lines", "tolerance"} from golden/bench-NNN.txt, or None if there is none"""
+    path = golden_dir / f"bench-{number}.txt"
+    if not path.is_file():
+        return None
+    tolerance = REL_TOL
+    expected = []
+    for line in path.read_text().splitlines():
+        if line.startswith("#"):
+            key, _, value = line[1:].partition(":")
+            if key.strip() == "tolerance":
+                tolerance = float(value)
+            elif key.strip() == "values-from" and (BENCH_DIR / value.strip()).is_file():
+                return {"lines": _golden_lines((BENCH_DIR / value.strip()).read_text()),
+                        "tolerance": tolerance}
+            continue
+        expected.append(line)
+    return {"lines": _golden_lines("\n".join(expected)), "tolerance": tolerance}
+
+
+def _is_int(token):
+    return token.lstrip("+-").isdigit()
+
+
+def token_matches(expected, actual, tolerance):
+    """Words compare exactly; integers exactly; other numbers within relative tolerance"""
+    if expected[-1].isdigit() != actual[-1].isdigit():
+        return False
+    if not expected[-1].isdigit():
+        return expected == actual
+    if _is_int(expected) and _is_int(actual):
+        return int(expected) == int(actual)
+    a, b = float(expected), float(actual)
+    return abs(a - b) <= tolerance * max(abs(a), abs(b))
+
+
+def _contains_in_order(words, expected):
+    remaining = iter(words)
+    return all(word in remaining for word in expected)
+
+
+def line_matches(expected, actual, tolerance):
+    """True if actual has exactly the expected numbers and contains its words in order"""
+    return (len(expected["values"]) == len(actual["values"])
+            and all(token_matches(e, a, tolerance) for e, a in zip(expected["values"], actual["values"]))
+            and _contains_in_order(actual["words"], expected["words"]))
+
+
+def compare(output, golden):
+    """None if each golden line matches its own output line in order, else what is missing"""
+    actual = [line_tokens(line) for line in output.splitlines()]
+    position = 0
+    for expected in golden["lines"]:
+        while position < len(actual) and not line_matches(expected, actual[position],
+                                                          golden["tolerance"]):
+            position += 1
+        if position == len(actual):
+            return f"no output line matching {expected['text']!r}"
+        position += 1
+    return None
+
+
+def capture(argv, cwd, env=None, timeout=TIMEOUT_S):
+    """Run argv once with stdout captured; returns (exit_code, stdout, stderr)"""
+    try:
+        proc = subprocess.run(argv, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, "", f"timed out after {timeout} s"
+    return proc.returncode, proc.stdout.decode(errors="replace"), proc.stderr.decode(errors="replace")
+
+
+def verify(argv, number, cwd=BENCH_DIR, env=None):
+    """
+    Run one mode once and check its output against the benchmark's golden file.
+
+    Returns {"status": "passed" | "failed" | "unchecked", "detail"}; failed
+    results also carry an "output" snippet.
+    """
+    if "BENCH_SIZE" in (os.environ if env is None else env):
+        return {"status": "unchecked", "detail": "BENCH_SIZE is set"}
+    golden = load_golden(number)
+    if golden is None:
+        return {"status": "unchecked", "detail": f"no golden/bench-{number}.txt"}
+    code, stdout, stderr = capture(argv, cwd, env)
+    if code != 0:
+        detail = stderr.strip().splitlines()
+        return {"status": "failed", "output": stdout[:SNIPPET_CHARS],
+                "detail": f"exit status {code}" + (f": {detail[-1]}" if detail else "")}
+    mismatch = compare(stdout, golden)
+    if mismatch:
+        return {"status": "failed", "detail": mismatch, "output": stdout[:SNIPPET_CHARS]}
+    return {"status": "passed", "detail": ""}
+
+
+def verify_jobs(jobs, cwd):
+    """
+    Verification stage: run every prepared job once with output captured.
+
+    Sets job["verification"]; jobs whose output is wrong also get
+    job["invalid"] and must not be timed. Returns the jobs that may be timed.
+    """
+    valid = []
+    for job in jobs:
+        result = verify(job["argv"], job["bench"]["number"], cwd, job.get("env"))
+        job["verification"] = result
+        if result["status"] == "failed":
+            job["invalid"] = result["detail"]
+            print(f"  ❌ {job['bench']['id']} {job['mode']}: wrong output ({result['detail']}), "
+                  f"marked invalid", file=sys.stderr)
+            continue
+        if result["status"] == "unchecked":
+            print(f"  ⚠️  {job['bench']['id']} {job['mode']}: not verified ({result['detail']})",
+                  file=sys.stderr)
+        valid.append(job)
+    return valid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m harness.verify",
+                                     description="Check every mode's output against golden files")
+    parser.add_argument("--bench", nargs="+", metavar="NNN")
+    parser.add_argument("--mode", nargs="+", metavar="MODE", help="modes to check (default: all)")
+    args = parser.parse_args(argv)
+
+    temp_dir = BENCH_DIR / ".temp"
+    temp_dir.mkdir(exist_ok=True)
+    failures = 0
+    for bench in discover(only=set(args.bench) if args.bench else None):
+        for mode in args.mode or list(MODES):
+            variant = python_variant(mode)
+            if language_of(mode) not in bench["sources"] or (variant and variant not in bench["variants"]):
+                continue
+            try:
+                run_argv, artifacts, _ = prepare(mode, bench["sources"][language_of(mode)], temp_dir,
+                                                 f"verify-{os.getpid()}", temp_dir / "build-cache")
+            except BuildError as e:
+                print(f"{bench['id']} {mode:<18} ⚠️  {e}")
+                continue
+            try:
+                result = verify(run_argv, bench["number"])
+            finally:
+                for path in artifacts:
+                    os.remove(path)
+            mark = {"passed": "✅", "failed": "❌", "unchecked": "⚠️ "}[result["status"]]
+            print(f"{bench['id']} {mode:<18} {mark} {result['status']} {result['detail']}".rstrip())
+            failures += result["status"] == "failed"
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -188,8 +188,9 @@ EOF
         min=$(python3 -c "import json; data = json.load(open('$bench_output')); print(f\"{data['benchmarks'][0]['statistics']['min_ms']:.2f}\")")
         max=$(python3 -c "import json; data = json.load(open('$bench_output')); print(f\"{data['benchmarks'][0]['statistics']['max_ms']:.2f}\")")
 
-        # Get raw results as comma-separated integers (rounded to nearest ms)
-        local raw_results=$(python3 -c "import json; data = json.load(open('$bench_output')); print(','.join([str(int(round(x))) for x in data['benchmarks'][0]['raw_results_ms']]))")
+        # Get raw results as comma-separated ms at full precision (whole-ms rounding
+        # erased the signal of 1-2ms benchmarks such as BENCH-012)
+        local raw_results=$(python3 -c "import json; data = json.load(open('$bench_output')); print(','.join([repr(float(x)) for x in data['benchmarks'][0]['raw_results_ms']]))")
 
         # Extract memory metrics if available (v6.25.0+)
         mem_peak_kb=$(python3 -c "import json; data = json.load(open('$bench_output')); mem = data['benchmarks'][0].get('memory'); print(int(mem['peak_kb']) if mem else 0)" 2>/dev/null || echo "0")
@@ -1,22 +1,62 @@
 #!/usr/bin/env python3
 # Calculate geometric mean across completed benchmarks
 # Shows honest overall performance vs Python baseline
+#
+# Speedups come with bootstrap confidence intervals resampled from each
+# mode's per-run times (the samples sidecar, or raw_results in older
+# results), the geometric mean is computed (and bootstrapped) in
+# log space, modes that rank next to each other on a benchmark are compared
+# with a Mann-Whitney U test, and Tukey-fence outliers are reported.
+# Resampling is vectorized with NumPy when it is installed and batched
+# through random.choices otherwise.
+#
+# Usage:
+#   python3 scripts/calculate-geometric-mean.py
+#   python3 scripts/calculate-geometric-mean.py --draws 20000 --confidence 0.99 --seed 1
 
+import argparse
 import json
+import math
+import random
+import statistics
 import sys
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared with the harness (run from test/ch21-benchmarks or scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from harness.samples import elapsed_ms  # noqa: E402
+from harness.stats import mann_whitney  # noqa: E402
+
+BOOTSTRAP_DRAWS = 10000
+CONFIDENCE = 0.95
+ALPHA = 0.05
+
 def geometric_mean(values):
-    """Calculate geometric mean of a list of values"""
+    """Geometric mean computed in log space (no overflow/underflow with many values)"""
     if not values:
         return 0
-    product = 1
-    for v in values:
-        product *= v
-    return product ** (1 / len(values))
+    return math.exp(math.fsum(math.log(v) for v in values) / len(values))
+
+def peak_memory_kb(mode_data):
+    """Peak RSS of a mode in KB, or None when it was not recorded (older results have 0)"""
+    peak_kb = mode_data.get('memory', {}).get('peak_kb', 0)
+    return peak_kb if peak_kb > 0 else None
+
+def tukey_outliers(samples, k=1.5):
+    """Indexes of samples outside [Q1 - k·IQR, Q3 + k·IQR]"""
+    if len(samples) < 4:
+        return []
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    low, high = q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+    return [i for i, x in enumerate(samples) if x < low or x > high]
 
-def load_benchmark_results(benchmark_file):
-    """Load benchmark results and extract speedups vs Python"""
+def load_benchmark_results(benchmark_file, drop_outliers=False):
+    """Load benchmark results and extract speedups, samples and peak-memory ratios vs Python"""
     with open(benchmark_file) as f:
         data = json.load(f)
 
@@ -24,27 +64,138 @@ def load_benchmark_results(benchmark_file):
         return None
 
     python_mean = data['modes']['python']['mean_ms']
+    python_peak = peak_memory_kb(data['modes']['python'])
     speedups = {}
+    samples = {}
+    outliers = {}
+    memory_ratios = {}
+    peaks_mb = {}
 
     for mode_name, mode_data in data['modes'].items():
+        raw = elapsed_ms(mode_data, Path(benchmark_file).parent)
+        flagged = tukey_outliers(raw)
+        if flagged:
+            outliers[mode_name] = [raw[i] for i in flagged]
+            if drop_outliers:
+                raw = [x for i, x in enumerate(raw) if i not in flagged]
+        if len(raw) >= 2:
+            samples[mode_name] = raw
+
         if mode_name == 'python':
             speedups[mode_name] = 1.0  # Baseline
         else:
             speedups[mode_name] = python_mean / mode_data['mean_ms']
 
+        peak = peak_memory_kb(mode_data)
+        if peak:
+            peaks_mb[mode_name] = peak / 1024
+            if python_peak:
+                memory_ratios[mode_name] = peak / python_peak
+
+    # Point estimates from the same samples the bootstrap resamples, so each
+    # speedup lies inside its own interval (mean_ms may be rounded, or come
+    # from a different sample set than the per-run times)
+    if 'python' in samples:
+        python_mean = statistics.fmean(samples['python'])
+        for mode_name, raw in samples.items():
+            speedups[mode_name] = python_mean / statistics.fmean(raw)
+
     return {
         'name': data['name'],
         'benchmark': data['benchmark'],
-        'speedups': speedups
+        'speedups': speedups,
+        'samples': samples,
+        'outliers': outliers,
+        'memory_ratios': memory_ratios,
+        'peaks_mb': peaks_mb
     }
 
+def bootstrap_means(samples, draws, rng):
+    """
+    Means of `draws` resamples (with replacement) of samples.
+
+    NumPy: one (draws × n) index matrix and a row mean. Fallback: a single
+    random.choices call for all draws, summed in n-sized batches.
+    """
+    n = len(samples)
+    if np is not None:
+        values = np.asarray(samples, dtype=float)
+        return values[rng.integers(0, n, size=(draws, n))].mean(axis=1)
+    flat = rng.choices(samples, k=draws * n)
+    return [total / n for total in map(sum, zip(*[iter(flat)] * n))]
+
+def bootstrap_log_speedups(bench, draws, rng):
+    """
+    Per mode, `draws` bootstrap replicates of log(python_mean / mode_mean).
+
+    Python and the mode are resampled independently; the python replicates
+    are shared by every mode of the benchmark.
+    """
+    if 'python' not in bench['samples']:
+        return {}
+    python_means = bootstrap_means(bench['samples']['python'], draws, rng)
+    replicates = {}
+    for mode, raw in bench['samples'].items():
+        if mode == 'python':
+            continue
+        mode_means = bootstrap_means(raw, draws, rng)
+        if np is not None:
+            replicates[mode] = np.log(python_means) - np.log(mode_means)
+        else:
+            replicates[mode] = [math.log(p / m) for p, m in zip(python_means, mode_means)]
+    return replicates
+
+def percentile_interval(replicates, confidence):
+    """Percentile bootstrap interval of log replicates, returned as speedups"""
+    tail = (1 - confidence) / 2
+    if np is not None:
+        low, high = np.quantile(replicates, [tail, 1 - tail])
+    else:
+        ordered = sorted(replicates)
+        last = len(ordered) - 1
+        low, high = ordered[round(tail * last)], ordered[round((1 - tail) * last)]
+    return math.exp(low), math.exp(high)
+
+def geomean_replicates(per_bench):
+    """Per-draw geometric mean across benchmarks: mean of the log replicates"""
+    if np is not None:
+        return np.mean(per_bench, axis=0)
+    count = len(per_bench)
+    return [math.fsum(column) / count for column in zip(*per_bench)]
+
+def neighbour_tests(bench):
+    """Mann-Whitney p-values between modes adjacent in this benchmark's speedup ranking"""
+    ranked = sorted((m for m in bench['samples']), key=lambda m: bench['speedups'][m], reverse=True)
+    return [(faster, slower, mann_whitney(bench['samples'][faster], bench['samples'][slower])[1])
+            for faster, slower in zip(ranked, ranked[1:])]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Geometric mean speedups vs Python, with uncertainty")
+    parser.add_argument("--results-dir", default="results")
+    parser.add_argument("--draws", type=int, default=BOOTSTRAP_DRAWS,
+                        help=f"bootstrap resamples (default: {BOOTSTRAP_DRAWS})")
+    parser.add_argument("--confidence", type=float, default=CONFIDENCE,
+                        help=f"confidence level of the intervals (default: {CONFIDENCE})")
+    parser.add_argument("--alpha", type=float, default=ALPHA,
+                        help=f"significance level of the Mann-Whitney tests (default: {ALPHA})")
+    parser.add_argument("--seed", type=int, default=None, help="bootstrap RNG seed")
+    parser.add_argument("--drop-outliers", action="store_true",
+                        help="exclude Tukey-fence outliers from the speedups and bootstrap")
+    return parser.parse_args()
+
 def main():
-    results_dir = Path("results")
+    args = parse_args()
+    results_dir = Path(args.results_dir)
+    rng = np.random.default_rng(args.seed) if np is not None else random.Random(args.seed)
 
     # Find all completed benchmark results
     completed_benchmarks = []
     for result_file in sorted(results_dir.glob("bench-*-results-full.json")):
-        result = load_benchmark_results(result_file)
+        try:
+            result = load_benchmark_results(result_file, args.drop_outliers)
+        except (OSError, ValueError, KeyError, ZeroDivisionError) as e:
+            print(f"⚠️  Skipping {result_file.name}: {e}", file=sys.stderr)
+            continue
         if result:
             completed_benchmarks.append(result)
 
@@ -52,9 +203,9 @@ def main():
         print("No completed benchmarks found", file=sys.stderr)
         return 1
 
-    print(f"\\n{'='*80}")
+    print(f"\n{'='*80}")
     print(f"GEOMETRIC MEAN ANALYSIS - {len(completed_benchmarks)} Completed Benchmarks")
-    print(f"{'='*80}\\n")
+    print(f"{'='*80}\n")
 
     # Collect all modes
     all_modes = set()
@@ -63,8 +214,16 @@ def main():
 
     all_modes = sorted(all_modes)
 
+    # Bootstrap every speedup once; the same replicates feed the per-benchmark
+    # intervals and the geometric-mean intervals
+    for bench in completed_benchmarks:
+        bench['replicates'] = bootstrap_log_speedups(bench, args.draws, rng)
+        bench['intervals'] = {mode: percentile_interval(reps, args.confidence)
+                              for mode, reps in bench['replicates'].items()}
+
     # Calculate geometric mean for each mode
     geometric_means = {}
+    geometric_intervals = {}
     for mode in all_modes:
         speedups = []
         for bench in completed_benchmarks:
@@ -74,6 +233,13 @@ def main():
         if speedups:
             geometric_means[mode] = geometric_mean(speedups)
 
+        # Only when every benchmark the mode ran on has samples to resample
+        ran = [b for b in completed_benchmarks if mode in b['speedups']]
+        if mode != 'python' and all(mode in b['replicates'] for b in ran):
+            per_bench = [b['replicates'][mode] for b in ran]
+            geometric_intervals[mode] = percentile_interval(geomean_replicates(per_bench),
+                                                            args.confidence)
+
     # Display results
     print("Individual Benchmark Results:")
     print(f"{'Benchmark':<40} | " + " | ".join(f"{mode:>15}" for mode in all_modes))
@@ -94,6 +260,41 @@ def main():
 
         print(f"{bench_name:<40} | " + " | ".join(speedup_strs))
 
+    level = f"{args.confidence * 100:g}%"
+    print()
+    print(f"{'='*80}")
+    print(f"SPEEDUP {level} CONFIDENCE INTERVALS ({args.draws} bootstrap draws):")
+    print(f"{'='*80}")
+    for bench in completed_benchmarks:
+        if not bench['intervals']:
+            continue
+        print(f"\n  {bench['benchmark']}: {bench['name']}")
+        for mode, (low, high) in sorted(bench['intervals'].items(),
+                                        key=lambda x: bench['speedups'][x[0]], reverse=True):
+            print(f"    {mode:<20} {bench['speedups'][mode]:>8.2f}x  [{low:.2f}x, {high:.2f}x]")
+
+    print()
+    print(f"{'='*80}")
+    print(f"SIGNIFICANCE (Mann-Whitney U between adjacent modes, alpha={args.alpha:g}):")
+    print(f"{'='*80}")
+    for bench in completed_benchmarks:
+        ties = [(f, s, p) for f, s, p in neighbour_tests(bench) if p >= args.alpha]
+        if ties:
+            print(f"\n  {bench['benchmark']}: not distinguishable")
+            for faster, slower, p in ties:
+                print(f"    {faster} {bench['speedups'][faster]:.2f}x vs "
+                      f"{slower} {bench['speedups'][slower]:.2f}x  (p={p:.3f})")
+
+    outlier_lines = [f"  {bench['benchmark']} {mode}: {', '.join(f'{x:.2f}' for x in values)}ms"
+                     for bench in completed_benchmarks for mode, values in bench['outliers'].items()]
+    if outlier_lines:
+        print()
+        print(f"{'='*80}")
+        print("OUTLIERS (outside 1.5×IQR Tukey fences"
+              f"{', excluded' if args.drop_outliers else ', kept; --drop-outliers excludes them'}):")
+        print(f"{'='*80}")
+        print("\n".join(outlier_lines))
+
     print()
     print(f"{'='*80}")
     print("GEOMETRIC MEAN (Overall Performance):")
@@ -106,9 +307,30 @@ def main():
     for mode, gmean in sorted_modes:
         if mode == 'python':
             print(f"  {mode:<20} {gmean:>8.2f}x  (baseline)")
+        elif mode in geometric_intervals:
+            low, high = geometric_intervals[mode]
+            print(f"  {mode:<20} {gmean:>8.2f}x  [{low:.2f}x, {high:.2f}x]")
         else:
             print(f"  {mode:<20} {gmean:>8.2f}x")
 
+    # Peak memory: ratio to Python (lower is better) and absolute peak
+    memory_means = {}
+    for mode in all_modes:
+        ratios = [b['memory_ratios'][mode] for b in completed_benchmarks if mode in b['memory_ratios']]
+        peaks = [b['peaks_mb'][mode] for b in completed_benchmarks if mode in b['peaks_mb']]
+        if ratios:
+            memory_means[mode] = (geometric_mean(ratios), geometric_mean(peaks))
+
+    if memory_means:
+        print()
+        print(f"{'='*80}")
+        print("GEOMETRIC MEAN (Peak Memory, lower is better):")
+        print(f"{'='*80}")
+        print()
+        for mode, (ratio, peak_mb) in sorted(memory_means.items(), key=lambda x: x[1][0]):
+            note = "  (baseline)" if mode == 'python' else ""
+            print(f"  {mode:<20} {ratio:>8.2f}x  {peak_mb:>9.1f}MB{note}")
+
     print()
     print(f"{'='*80}")
     print("INTERPRETATION:")
@@ -117,6 +339,10 @@ def main():
     print(f"  Geometric mean is the honest average speedup across all benchmarks")
     print(f"  Values > 1.0x mean faster than Python baseline")
     print(f"  Values < 1.0x mean slower than Python baseline")
+    print(f"  [low, high] are {level} bootstrap intervals; overlapping intervals or a")
+    print(f"  'not distinguishable' pair mean the ranking is within measurement noise")
+    if memory_means:
+        print(f"  Peak memory is wait4 ru_maxrss; ratios < 1.0x use less memory than Python")
     print()
 
     # Highlight Ruchy modes
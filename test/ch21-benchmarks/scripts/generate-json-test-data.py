@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 # Generate realistic JSON test data for BENCH-009
-# Creates nested API response structure (50MB)
+# Creates nested API response structure (50MB by default, 1GB+ supported)
+#
+# Streams each user record straight to the file and tracks bytes written,
+# so memory use is constant and generation is linear in the output size.
+#
+# Usage:
+#   python3 scripts/generate-json-test-data.py test-data/sample-50mb.json
+#   python3 scripts/generate-json-test-data.py test-data/sample-1gb.json --size 1GB --seed 7
 
+import argparse
 import json
-import sys
+import os
 import random
+import sys
 from datetime import datetime, timedelta
 
-def generate_user(user_id):
+# Bytes reserved for metadata.total_users, patched in place once known
+TOTAL_USERS_WIDTH = 20
+
+# BENCH-009 reads users[TARGET_USER].profile.location.city
+TARGET_USER = 500
+
+def generate_user(user_id, rng=random):
     """Generate a realistic user object"""
     return {
         "id": user_id,
@@ -19,73 +34,126 @@ def generate_user(user_id):
             "last_name": f"Last{user_id}",
             "age": 20 + (user_id % 50),
             "location": {
-                "city": random.choice(["New York", "London", "Tokyo", "Paris", "Berlin"]),
-                "country": random.choice(["USA", "UK", "Japan", "France", "Germany"]),
+                "city": rng.choice(["New York", "London", "Tokyo", "Paris", "Berlin"]),
+                "country": rng.choice(["USA", "UK", "Japan", "France", "Germany"]),
                 "coordinates": {
-                    "lat": round(random.uniform(-90, 90), 6),
-                    "lng": round(random.uniform(-180, 180), 6)
+                    "lat": round(rng.uniform(-90, 90), 6),
+                    "lng": round(rng.uniform(-180, 180), 6)
                 }
             }
         },
         "stats": {
-            "posts": random.randint(0, 1000),
-            "followers": random.randint(0, 10000),
-            "following": random.randint(0, 500)
+            "posts": rng.randint(0, 1000),
+            "followers": rng.randint(0, 10000),
+            "following": rng.randint(0, 500)
         },
         "preferences": {
-            "theme": random.choice(["light", "dark", "auto"]),
-            "notifications": random.choice([True, False]),
-            "language": random.choice(["en", "es", "fr", "de", "ja"])
+            "theme": rng.choice(["light", "dark", "auto"]),
+            "notifications": rng.choice([True, False]),
+            "language": rng.choice(["en", "es", "fr", "de", "ja"])
         }
     }
 
-def generate_json(output_file, target_mb=50):
-    """Generate JSON with target size in MB"""
-    target_bytes = target_mb * 1024 * 1024
+def parse_size(text):
+    """Parse sizes like 50MB, 1GB, 512KB (binary units) or a plain MB count"""
+    units = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "TB": 1 << 40}
+    text = text.strip().upper()
+    for suffix, factor in units.items():
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(float(text) * units["MB"])
 
-    print(f"Generating {target_mb}MB JSON file...", file=sys.stderr)
+def generate_json(output_file, target_mb=50, seed=42):
+    """
+    Stream a JSON document of at least target_mb MB to output_file.
 
-    data = {
-        "metadata": {
-            "version": "1.0",
-            "generated_at": datetime.now().isoformat(),
-            "total_users": 0,
-            "description": "Test dataset for JSON parsing benchmark"
-        },
-        "users": []
-    }
+    Layout matches json.dump(data, f, indent=2) of the old in-memory
+    generator. metadata.total_users is written as a space-padded
+    placeholder and patched in place at the end, so metadata can stay
+    first without holding the users in memory.
+    """
+    target_bytes = int(target_mb * 1024 * 1024)
+    rng = random.Random(seed)
+    encoder = json.JSONEncoder(indent=2)
 
-    user_id = 1
-    while True:
-        data["users"].append(generate_user(user_id))
-        user_id += 1
+    print(f"Generating {target_mb:g}MB JSON file (seed={seed})...", file=sys.stderr)
 
-        if user_id % 1000 == 0:
-            # Check size periodically
-            json_str = json.dumps(data)
-            current_bytes = len(json_str.encode('utf-8'))
-            current_mb = current_bytes / 1024 / 1024
+    header = (
+        '{\n'
+        '  "metadata": {\n'
+        '    "version": "1.0",\n'
+        f'    "generated_at": {json.dumps(datetime.now().isoformat())},\n'
+        '    "total_users": '
+    )
+    metadata_tail = (
+        ',\n'
+        '    "description": "Test dataset for JSON parsing benchmark"\n'
+        '  },\n'
+        '  "users": ['
+    )
 
-            print(f"Generated {current_mb:.1f}MB ({user_id} users)...", file=sys.stderr)
+    user_count = 0
+    target_city = None
+    # Written next to the output and renamed on success, so a failed run
+    # never leaves a file that ensure_input would take for a finished one
+    tmp_file = f"{output_file}.tmp"
+    try:
+        with open(tmp_file, 'w', buffering=1 << 20) as f:
+            f.write(header)
+            total_users_offset = f.tell()
+            f.write("0".ljust(TOTAL_USERS_WIDTH))
+            f.write(metadata_tail)
+            bytes_written = len(header) + TOTAL_USERS_WIDTH + len(metadata_tail)
+            next_report = 1 << 26
 
-            if current_bytes >= target_bytes:
-                break
+            while bytes_written < target_bytes:
+                user = generate_user(user_count + 1, rng)
+                if user_count == TARGET_USER:
+                    target_city = user["profile"]["location"]["city"]
+                record = ("\n    " if user_count == 0 else ",\n    ") + \
+                    encoder.encode(user).replace("\n", "\n    ")
+                f.write(record)
+                bytes_written += len(record)
+                user_count += 1
 
-    data["metadata"]["total_users"] = len(data["users"])
+                if bytes_written >= next_report:
+                    print(f"Generated {bytes_written / 1024 / 1024:.1f}MB ({user_count} users)...",
+                          file=sys.stderr)
+                    next_report += 1 << 26
 
-    # Write final JSON
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+            footer = "\n  ]\n}" if user_count else "]\n}"
+            f.write(footer)
+            bytes_written += len(footer)
 
-    final_size = len(json.dumps(data).encode('utf-8'))
-    final_mb = final_size / 1024 / 1024
+            f.seek(total_users_offset)
+            f.write(str(user_count).ljust(TOTAL_USERS_WIDTH))
 
-    print(f"✅ Generated {final_mb:.1f}MB ({len(data['users'])} users)", file=sys.stderr)
-    print(f"   Target value: users[500].profile.location.city", file=sys.stderr)
-    print(f"   Actual value: {data['users'][500]['profile']['location']['city']}", file=sys.stderr)
+        if target_city is None:
+            raise ValueError(f"{target_mb:g}MB holds only {user_count} users, but BENCH-009 reads "
+                             f"users[{TARGET_USER}]; use a larger --size")
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    os.replace(tmp_file, output_file)
+    print(f"✅ Generated {bytes_written / 1024 / 1024:.1f}MB ({user_count} users)", file=sys.stderr)
+    print(f"   Target value: users[{TARGET_USER}].profile.location.city", file=sys.stderr)
+    print(f"   Actual value: {target_city}", file=sys.stderr)
 
     return output_file
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate BENCH-009 JSON test data")
+    parser.add_argument("output", nargs="?", default="test-data/sample-50mb.json")
+    parser.add_argument("--size", default="50MB", help="target size, e.g. 50MB, 1GB")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="random seed (fixes users[500].profile.location.city)")
+    args = parser.parse_args()
+    try:
+        generate_json(args.output, parse_size(args.size) / 1024 / 1024, args.seed)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
 if __name__ == "__main__":
-    output = sys.argv[1] if len(sys.argv) > 1 else "test-data/sample-50mb.json"
-    generate_json(output)
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# Parallel, chunked log file generator for BENCH-006
+# Scales to multi-GB test data: chunks of lines are generated independently
+# in a process pool (one deterministic seed per chunk) and written in bulk.
+#
+# Usage:
+#   python3 scripts/generate-logfile-parallel.py testdata/bench-006-logs-10gb.txt --size 10GB
+#   python3 scripts/generate-logfile-parallel.py testdata/bench-006-logs-50mb.txt --size 50MB \
+#       --expected testdata/bench-006-expected-errors-50mb.txt
+#
+# Same seed + same size => byte-identical file and identical error count,
+# regardless of --workers. The lines differ from generate_test_logs.py's, so
+# this script refuses to overwrite the reference log that golden/bench-006.txt
+# and testdata/bench-006-expected-errors.txt describe.
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pool
+
+LINES_PER_CHUNK = 65536
+
+# Written by generate_test_logs.py; its expected count is the golden value
+REFERENCE_LOG = "testdata/bench-006-logs-100mb.txt"
+REFERENCE_EXPECTED = "testdata/bench-006-expected-errors.txt"
+
+# Log levels (pre-padded to 5 chars) and their frequencies
+LEVELS = ["INFO ", "WARN ", "ERROR", "DEBUG"]
+LEVEL_WEIGHTS = [70, 20, 8, 2]
+ERROR_LEVEL = LEVELS.index("ERROR")
+
+# (template, lo, hi): "{}" is filled with a value in [lo, hi]
+MESSAGES = [
+    ("Processing request from user {}", 1000, 9999),
+    ("Database query completed in {}ms", 5, 500),
+    ("Cache hit for key cache_{}", 1, 1000),
+    ("Cache miss for key cache_{}, fetching from database", 1, 1000),
+    ("API call to service-{} completed successfully", 1, 4),
+    ("Scheduled job job-{} started", 1, 4),
+    ("Scheduled job job-{} completed", 1, 4),
+    ("User logged in from IP 192.168.1.{}", 1, 255),
+    ("File file{}.txt uploaded successfully", 1, 100),
+    ("Email sent to user{}@example.com", 1, 1000),
+    ("Payment processed for order ORD-{}", 10000, 99999),
+    ("Inventory updated for product PRD-{}", 100, 999),
+    ("Session sess_{} expired", 100000, 999999),
+    ("Configuration reloaded", 0, 0),
+    ("Health check passed", 0, 0),
+]
+
+# Only ERROR lines may contain "error", so the ERROR level count is exactly
+# the number of lines BENCH-006 must find
+ERROR_MESSAGES = [
+    ("Failed to connect to database: connection timeout", 0, 0),
+    ("Error processing payment: insufficient funds", 0, 0),
+    ("File not found: file{}.txt", 1, 100),
+    ("Permission denied for user {}", 1000, 9999),
+    ("API rate limit exceeded for endpoint /api/v1/users", 0, 0),
+    ("Invalid input: field 'email' is required", 0, 0),
+    ("Network error: connection reset by peer", 0, 0),
+    ("Memory allocation failed", 0, 0),
+]
+
+assert not any("error" in t.lower() for t, _, _ in MESSAGES), "non-ERROR template mentions error"
+
+START_TIME = datetime(2025, 11, 1, tzinfo=timezone.utc)
+MAX_STEP_MS = 500
+
+def parse_size(text):
+    """Parse sizes like 100MB, 10GB, 512KB (binary units) or a plain MB count"""
+    units = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "TB": 1 << 40}
+    text = text.strip().upper()
+    for suffix, factor in units.items():
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(float(text) * units["MB"])
+
+def generate_chunk(seed, index, limit=None):
+    """
+    Generate chunk `index` as (data, lines, errors).
+
+    All random draws for the chunk are made in bulk up front; the per-line
+    loop only formats. Timestamps start at a fixed offset per chunk (the
+    largest possible span of the previous chunks) so they never go backwards
+    and never depend on other chunks. With `limit`, the chunk is cut after
+    the first line that reaches `limit` bytes.
+    """
+    n = LINES_PER_CHUNK
+    rng = random.Random(f"{seed}:{index}")
+    levels = rng.choices(range(len(LEVELS)), weights=LEVEL_WEIGHTS, k=n)
+    steps = rng.choices(range(10, MAX_STEP_MS + 1), k=n)
+    millis = rng.choices(range(100, 1000), k=n)
+    msg_ids = rng.choices(range(len(MESSAGES)), k=n)
+    err_ids = rng.choices(range(len(ERROR_MESSAGES)), k=n)
+    values = rng.choices(range(1 << 20), k=n)
+
+    base = START_TIME + timedelta(milliseconds=index * n * MAX_STEP_MS)
+    base_s = int(base.timestamp())
+    offset_ms = 0
+    last_second = None
+    stamp = ""
+
+    out = []
+    size = 0
+    for i in range(n):
+        offset_ms += steps[i]
+        second = base_s + offset_ms // 1000
+        if second != last_second:
+            stamp = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            last_second = second
+        level = levels[i]
+        if level == ERROR_LEVEL:
+            template, lo, hi = ERROR_MESSAGES[err_ids[i]]
+        else:
+            template, lo, hi = MESSAGES[msg_ids[i]]
+        message = template.format(lo + values[i] % (hi - lo + 1)) if hi else template
+        line = f"{stamp}.{millis[i]} [{LEVELS[level]}] {message}\n"
+        out.append(line)
+        if limit is not None:
+            size += len(line)
+            if size >= limit:
+                break
+
+    lines = len(out)
+    errors = levels[:lines].count(ERROR_LEVEL)
+    return "".join(out).encode("ascii"), lines, errors
+
+def _chunk_task(task):
+    return generate_chunk(*task)
+
+def generate_log(output_file, target_bytes, seed=42, workers=None):
+    """
+    Write chunks in order until target_bytes is reached.
+
+    Chunks are produced `workers` at a time in a process pool and written
+    with one write() each. The final chunk is regenerated with a byte limit
+    so the file ends on the first line that reaches the target, exactly as
+    a serial generator would.
+    """
+    workers = workers or os.cpu_count() or 1
+    written = 0
+    lines = 0
+    errors = 0
+    index = 0
+    started = time.perf_counter()
+
+    print(f"Generating {target_bytes / (1 << 20):.1f}MB log file "
+          f"(seed={seed}, workers={workers})...", file=sys.stderr)
+
+    with open(output_file, "wb", buffering=0) as f, Pool(workers) as pool:
+        while written < target_bytes:
+            batch = [(seed, index + i) for i in range(workers)]
+            for data, n, e in pool.imap(_chunk_task, batch):
+                if written + len(data) >= target_bytes:
+                    data, n, e = generate_chunk(seed, index, target_bytes - written)
+                f.write(data)
+                written += len(data)
+                lines += n
+                errors += e
+                index += 1
+                if written >= target_bytes:
+                    break
+            elapsed = time.perf_counter() - started
+            print(f"  Progress: {written / (1 << 20):.1f}MB written, {lines:,} lines, "
+                  f"{errors:,} errors ({written / (1 << 20) / elapsed:.0f}MB/s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Generated: {output_file}", file=sys.stderr)
+    print(f"   Size: {written / (1 << 20):.2f}MB in {elapsed:.1f}s", file=sys.stderr)
+    print(f"   Lines: {lines:,}", file=sys.stderr)
+    print(f"   Errors: {errors:,} ({100 * errors / max(lines, 1):.2f}%)", file=sys.stderr)
+    return errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate BENCH-006 log data in parallel")
+    parser.add_argument("output", help=f"log file to write (not {REFERENCE_LOG})")
+    parser.add_argument("--size", default="100MB", help="target size, e.g. 100MB, 10GB")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="generator processes (default: all CPUs)")
+    parser.add_argument("--expected", metavar="FILE",
+                        help="also write the expected error-line count to FILE")
+    args = parser.parse_args()
+    for path, owner in ((args.output, REFERENCE_LOG), (args.expected, REFERENCE_EXPECTED)):
+        reference = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", owner)
+        if path and os.path.realpath(path) == os.path.realpath(reference):
+            parser.error(f"{owner} is the reference input from generate_test_logs.py; "
+                         "write to another path")
+
+    errors = generate_log(args.output, parse_size(args.size), args.seed, args.workers)
+    if args.expected:
+        with open(args.expected, "w") as f:
+            f.write(str(errors))
+        print(f"\nExpected error count written to: {args.expected}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
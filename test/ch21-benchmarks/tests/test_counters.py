@@ -0,0 +1,40 @@
+"""harness.counters: failures while opening counters must not strand the child"""
+
+import os
+import unittest
+from unittest import mock
+
+from harness import counters
+
+
+class CountFailureTest(unittest.TestCase):
+    def test_unsupported_architecture_fails_before_forking(self):
+        with mock.patch.object(counters.platform, "machine", lambda: "sparc64"), \
+                mock.patch.object(counters.os, "fork") as fork:
+            with self.assertRaises(counters.CountersUnavailable):
+                counters.count(["true"])
+        fork.assert_not_called()
+
+    def test_open_error_kills_and_reaps_the_child(self):
+        forked = []
+        real_fork = os.fork
+
+        def fork():
+            pid = real_fork()
+            forked.append(pid)
+            return pid
+
+        def fail(pid):
+            raise counters.CountersUnavailable("boom")
+
+        with mock.patch.object(counters.os, "fork", fork), \
+                mock.patch.object(counters, "_open_counters", fail):
+            with self.assertRaises(counters.CountersUnavailable):
+                counters.count(["true"])
+        # Reaped already: waiting again finds no such child
+        with self.assertRaises(ChildProcessError):
+            os.waitpid(forked[0], os.WNOHANG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""harness.preflight: cpu lists and the SMT check (run from test/ch21-benchmarks)"""
+
+import unittest
+from unittest import mock
+
+from harness import preflight
+
+
+def _topology(siblings, active="1"):
+    """Patch siblings/_read for a machine whose cores are the given sibling sets"""
+    lookup = {cpu: set(core) for core in siblings for cpu in core}
+    read = mock.patch.object(preflight, "_read",
+                             lambda path: active if path.endswith("smt/active") else None)
+    sib = mock.patch.object(preflight, "siblings", lambda cpu: lookup.get(cpu, {cpu}))
+    return read, sib
+
+
+class CpuListTest(unittest.TestCase):
+    def test_ranges_and_singles(self):
+        self.assertEqual(preflight._cpu_list("0-3,8,10-11"), {0, 1, 2, 3, 8, 10, 11})
+
+    def test_empty(self):
+        self.assertEqual(preflight._cpu_list(""), set())
+        self.assertEqual(preflight._cpu_list(None), set())
+
+
+class CheckSmtTest(unittest.TestCase):
+    def check(self, cpus, siblings, active="1"):
+        read, sib = _topology(siblings, active)
+        with read, sib:
+            return preflight.check_smt(set(cpus))
+
+    def test_pinned_cpu_on_smt_host_is_ok(self):
+        result = self.check({2}, [(0, 1), (2, 3)])
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["value"]["idle_siblings"], [3])
+
+    def test_several_cpus_with_siblings_warn(self):
+        self.assertEqual(self.check({0, 1, 2, 3}, [(0, 1), (2, 3)])["status"], "warn")
+
+    def test_no_smt(self):
+        self.assertEqual(self.check({0, 1}, [(0,), (1,)], active="0")["status"], "ok")
+
+    def test_unreadable(self):
+        self.assertEqual(self.check({0, 1}, [(0,), (1,)], active=None)["status"], "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""harness.samples: the binary sidecar round-trips every column exactly"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from harness import samples
+
+
+def _run(elapsed_ns, maxrss_kb=2048, cpu=3):
+    return {"elapsed_ns": elapsed_ns, "user_ns": 1000, "sys_ns": 0,
+            "maxrss_kb": maxrss_kb, "cpu": cpu}
+
+
+class SidecarTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.per_mode = {
+            "python": samples.columns([_run(16_250_123), _run(16_100_999), _run(17_000_001)]),
+            "c": samples.columns([_run(731_000, maxrss_kb=None, cpu=None)]),
+        }
+        self.refs = samples.write_sidecar(self.dir / "bench-012-samples.bin", self.per_mode)
+
+    def test_round_trip(self):
+        for mode, cols in self.per_mode.items():
+            self.assertEqual(samples.read_sidecar(self.dir, self.refs[mode]), cols)
+
+    def test_unknown_values_are_minus_one(self):
+        cols = samples.read_sidecar(self.dir, self.refs["c"])
+        self.assertEqual((cols["maxrss_kb"], cols["cpu"]), ([-1], [-1]))
+
+    def test_load_and_elapsed_ms_from_results_file(self):
+        path = self.dir / "bench-012-results-full.json"
+        path.write_text(json.dumps({"modes": {mode: {"samples": ref}
+                                              for mode, ref in self.refs.items()}}))
+        self.assertEqual(samples.load(path, "python"), self.per_mode["python"])
+        entry = {"samples": self.refs["python"]}
+        self.assertEqual(samples.elapsed_ms(entry, self.dir), [16.250123, 16.100999, 17.000001])
+
+    def test_elapsed_ms_from_older_results(self):
+        self.assertEqual(samples.elapsed_ms({"raw_results": [12, 13.5]}, self.dir), [12.0, 13.5])
+
+    def test_rejects_other_files(self):
+        (self.dir / "bench-012-samples.bin").write_bytes(b"NOTASMPL" + bytes(64))
+        with self.assertRaises(ValueError):
+            samples.read_sidecar(self.dir, self.refs["python"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""harness.scaling: curve fit, crossovers and the marginal work rate"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from harness import scaling
+from harness.modes import BuildError
+
+
+class FitPowerLawTest(unittest.TestCase):
+    def test_recovers_exponent_and_fixed_cost(self):
+        work = [10, 20, 40, 80, 160]
+        fit = scaling.fit_power_law(work, [2 + 0.001 * w ** 2 for w in work])
+        self.assertAlmostEqual(fit["exponent"], 2.0)
+        self.assertAlmostEqual(fit["fixed_ms"], 2.0)
+        self.assertAlmostEqual(fit["constant_ms"], 0.001)
+        self.assertAlmostEqual(fit["r2"], 1.0)
+
+    def test_flat_curve_has_exponent_zero(self):
+        # e.g. the compiler removed the work: only startup noise is left
+        fit = scaling.fit_power_law([10, 100, 1000], [5.1, 5.0, 4.9])
+        self.assertEqual(fit["exponent"], 0.0)
+        self.assertEqual(fit["constant_ms"], 0.0)
+        self.assertAlmostEqual(fit["fixed_ms"], 5.0, places=1)
+
+    def test_needs_three_points(self):
+        self.assertIsNone(scaling.fit_power_law([1, 2], [1.0, 2.0]))
+
+
+class CrossoverTest(unittest.TestCase):
+    baseline = {1: 1.0, 10: 10.0, 100: 100.0}
+
+    def test_log_interpolated_crossing(self):
+        result = scaling.crossover([1, 10, 100], {1: 10.0, 10: 1.0, 100: 1.0}, self.baseline)
+        # log ratios log(10) and log(0.1) cross halfway in log size
+        self.assertEqual(result, {"size": 3.16, "faster_above": True})
+
+    def test_slower_above(self):
+        result = scaling.crossover([1, 10, 100], {1: 0.1, 10: 100.0, 100: 1000.0}, self.baseline)
+        self.assertFalse(result["faster_above"])
+
+    def test_no_crossing(self):
+        self.assertIsNone(scaling.crossover([1, 10, 100], {1: 2.0, 10: 20.0, 100: 200.0},
+                                            self.baseline))
+
+    def test_only_shared_sizes_count(self):
+        self.assertIsNone(scaling.crossover([1, 10, 100], {1: 10.0}, self.baseline))
+
+
+class MarginalRateTest(unittest.TestCase):
+    def test_difference_of_two_largest_sizes(self):
+        points = [{"work": 10, "median_ms": 100.0}, {"work": 1000, "median_ms": 11.0},
+                  {"work": 3000, "median_ms": 13.0}]
+        self.assertEqual(scaling.marginal_rate(points), 1000000.0)
+
+    def test_no_time_difference(self):
+        points = [{"work": 1000, "median_ms": 12.0}, {"work": 3000, "median_ms": 12.0}]
+        self.assertIsNone(scaling.marginal_rate(points))
+
+    def test_needs_two_points(self):
+        self.assertIsNone(scaling.marginal_rate([{"work": 1, "median_ms": 1.0}]))
+
+
+class WorkModelTest(unittest.TestCase):
+    def test_fib_calls(self):
+        # fib(20) = 6765, fib(21) = 10946: 2 * 10946 - 1 calls
+        self.assertEqual(scaling.WORK["fib-calls"](20), 21891)
+
+    def test_binary_trees(self):
+        self.assertEqual(scaling.WORK[scaling.SIZES["004"]["work"]](16), 16 * 2 ** 16)
+
+
+class SizedSourceTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.source = self.dir / "bench-005.ruchy"
+        self.source.write_text("fun main() {\n    // BENCH_SIZE\n    let n = 1000000;\n}\n")
+        self.temp_dir = self.dir / "temp"
+        self.temp_dir.mkdir()
+
+    def test_size_replaces_the_marked_literal(self):
+        copy = scaling.sized_source(self.source, 42, self.temp_dir)
+        self.assertIn("let n = 42;", copy.read_text())
+
+    def test_failed_build_removes_the_sized_copy(self):
+        bench = {"number": "005", "sources": {"ruchy": self.source}}
+        with mock.patch.object(scaling, "prepare", side_effect=BuildError("not installed: ruchy")):
+            with self.assertRaises(BuildError):
+                scaling.measure_mode(bench, "ruchy-ast", [100], self.temp_dir, None, None)
+        self.assertEqual(list(self.temp_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""harness.scheduler: a failing job must not take the rest of the sweep down"""
+
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from harness import scheduler
+
+
+def _job(mode):
+    return {"bench": {"name": "Test", "number": "005"}, "mode": mode}
+
+
+def _done(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+class RecordTest(unittest.TestCase):
+    def test_success_records_stats_and_affinity(self):
+        job = _job("c")
+        scheduler._record(job, _done({"mean_ms": 1.0}), 3, False)
+        self.assertEqual(job["stats"]["affinity"], {"pinned_cpu": 3, "exclusive": False})
+
+    def test_any_exception_marks_only_that_job_failed(self):
+        for error in (RuntimeError("exit status 1"), OSError("no such file"), ValueError("bad")):
+            job = _job("go")
+            with mock.patch("sys.stderr"):
+                scheduler._record(job, _done(error=error), 1, False)
+            self.assertNotIn("stats", job)
+            self.assertIn(str(error), job["error"])
+
+
+def _fake_measure(job, cwd, warmup, iterations, cpu):
+    if job["mode"] == "bad":
+        raise OSError("launcher vanished")
+    return {"mean_ms": 1.0}
+
+
+class RunParallelTest(unittest.TestCase):
+    def test_sweep_survives_a_failing_job(self):
+        jobs = [_job("good"), _job("bad"), _job("also-good")]
+        with mock.patch.object(scheduler, "_pinned_measure", _fake_measure), \
+                mock.patch.object(scheduler, "isolated_cores", lambda: [0]), \
+                mock.patch("sys.stderr"):
+            scheduler.run_parallel(jobs, ".", 0, 1, 1)
+        self.assertEqual([("stats" in j, "error" in j) for j in jobs],
+                         [(True, False), (False, True), (True, False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""harness.stats: Mann-Whitney U against hand-computed values"""
+
+import unittest
+
+from harness.stats import mann_whitney
+
+
+class MannWhitneyTest(unittest.TestCase):
+    def test_separated_samples(self):
+        u, p = mann_whitney([1, 2, 3], [4, 5, 6])
+        self.assertEqual(u, 0)
+        # z = (4.5 - 0.5) / sqrt(9 / 12 * 7)
+        self.assertAlmostEqual(p, 0.0809, places=4)
+
+    def test_u_counts_pairs_won_by_x(self):
+        self.assertEqual(mann_whitney([4, 5, 6], [1, 2, 3])[0], 9)
+        self.assertEqual(mann_whitney([1, 3], [2])[0], 1)
+
+    def test_ties_get_mid_ranks(self):
+        self.assertEqual(mann_whitney([1, 2], [2, 3])[0], 0.5)
+
+    def test_identical_samples(self):
+        self.assertEqual(mann_whitney([5, 5, 5], [5, 5, 5]), (4.5, 1.0))
+
+    def test_one_sided(self):
+        slower, faster = [10, 11, 12, 13, 14], [1, 2, 3, 4, 5]
+        self.assertLess(mann_whitney(slower, faster, alternative="greater")[1], 0.01)
+        self.assertGreater(mann_whitney(faster, slower, alternative="greater")[1], 0.99)
+        two_sided = mann_whitney(slower, faster)[1]
+        self.assertAlmostEqual(mann_whitney(slower, faster, alternative="greater")[1],
+                               two_sided / 2, places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""harness.verify: golden lines must match whole output lines, not scattered tokens"""
+
+import unittest
+
+from harness import verify
+
+
+def _golden(*lines, tolerance=verify.REL_TOL):
+    return {"lines": verify._golden_lines("\n".join(lines)), "tolerance": tolerance}
+
+
+class LineTokensTest(unittest.TestCase):
+    def test_thousands_separator(self):
+        self.assertEqual(verify.line_tokens("total: 1,234,567")["values"], ["1234567"])
+
+    def test_labels_are_not_values(self):
+        self.assertEqual(verify.line_tokens("fib(20) = 6765")["values"], ["6765"])
+        self.assertEqual(verify.line_tokens("10,000th prime: 104729")["values"], ["104729"])
+
+
+class CompareTest(unittest.TestCase):
+    def test_exact_output_passes(self):
+        self.assertIsNone(verify.compare("262143 14592688 131071\n",
+                                         _golden("262143 14592688 131071")))
+
+    def test_extra_lines_and_labels_pass(self):
+        output = "Generated 10000 primes\n10,000th prime: 104729\n✓ Verification passed\n"
+        self.assertIsNone(verify.compare(output, _golden("104729")))
+        self.assertIsNone(verify.compare("fib(20) = 6765\n", _golden("6765")))
+
+    def test_golden_values_among_other_numbers_fail(self):
+        self.assertIsNotNone(verify.compare("1 6765 2\n", _golden("6765")))
+        self.assertIsNotNone(verify.compare("262143 0 14592688 131071\n",
+                                            _golden("262143 14592688 131071")))
+
+    def test_values_spread_over_lines_fail(self):
+        self.assertIsNotNone(verify.compare("262143\n14592688 131071\n",
+                                            _golden("262143 14592688 131071")))
+
+    def test_lines_must_appear_in_order(self):
+        golden = _golden("1", "2")
+        self.assertIsNone(verify.compare("1\nnoise\n2\n", golden))
+        self.assertIsNotNone(verify.compare("2\n1\n", golden))
+
+    def test_words(self):
+        self.assertIsNone(verify.compare("Hello, World!\n", _golden("Hello, World!")))
+        self.assertIsNotNone(verify.compare("Hello!\n", _golden("Hello, World!")))
+
+    def test_float_tolerance(self):
+        golden = _golden("248683.505429", tolerance=1e-6)
+        self.assertIsNone(verify.compare("248683.50542901\n", golden))
+        self.assertIsNotNone(verify.compare("248700.0\n", golden))
+
+    def test_integers_match_exactly(self):
+        self.assertIsNotNone(verify.compare("499999500001\n", _golden("499999500000")))
+
+
+if __name__ == "__main__":
+    unittest.main()